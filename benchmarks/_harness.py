@@ -0,0 +1,160 @@
+"""
+基准脚本与测试的公共环境
+
+把 obsScriptFramework_ 加入 sys.path（与脚本在 OBS 中的导入方式一致，通过 src.* 导入框架），
+在 OBS 之外运行时安装一个用纯 Python 模拟的 obspython 模块。
+模拟模块只实现框架用到的属性对象与 obs_data 接口，用于衡量框架自身的开销，不代表 SWIG 调用的真实耗时。
+"""
+import gc
+import itertools
+import json
+import os
+import sys
+import time
+import types
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""仓库根目录"""
+FRAMEWORK_ROOT = os.path.join(REPO_ROOT, "obsScriptFramework_")
+"""框架目录，脚本运行时同样被加入 sys.path"""
+
+if FRAMEWORK_ROOT not in sys.path:
+    sys.path.insert(0, FRAMEWORK_ROOT)
+
+
+# 模拟的 obspython
+# ----------------------------------------------------------------------------------------------------------------
+class _Property:
+    """模拟的 obs_property_t"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.visible = True
+        self.enabled = True
+        self.limits: Tuple[Any, Any, Any] = (0, 100, 1)
+        self.info_type = 0
+        self.items: List[Tuple[str, str]] = []
+
+
+class _Data(dict):
+    """模拟的 obs_data_t"""
+
+
+def _build_simulated_obspython() -> types.ModuleType:
+    """构建模拟的 obspython 模块"""
+    module = types.ModuleType("obspython")
+    module.__doc__ = "纯 Python 模拟的 obspython，仅供 benchmarks 使用"
+    constant_ids = itertools.count(1)
+    constants: Dict[str, int] = {}
+
+    def module_getattr(name: str) -> int:
+        # 枚举依赖各常量互不相同，按首次访问的顺序分配
+        if name.startswith(("OBS_", "LOG_")):
+            if name not in constants:
+                constants[name] = next(constant_ids)
+            return constants[name]
+        raise AttributeError(f"模拟的 obspython 没有 {name}")
+
+    module.__getattr__ = module_getattr
+
+    def add_property(props, name, *args):
+        prop = _Property(name)
+        props[name] = prop
+        return prop
+
+    functions: Dict[str, Callable] = {
+        # 属性集与属性对象
+        "obs_properties_create": lambda: {},
+        "obs_property_visible": lambda p: p.visible,
+        "obs_property_set_visible": lambda p, v: setattr(p, "visible", v),
+        "obs_property_enabled": lambda p: p.enabled,
+        "obs_property_set_enabled": lambda p, v: setattr(p, "enabled", v),
+        "obs_property_int_min": lambda p: p.limits[0],
+        "obs_property_int_max": lambda p: p.limits[1],
+        "obs_property_int_step": lambda p: p.limits[2],
+        "obs_property_int_set_limits": lambda p, lo, hi, step: setattr(p, "limits", (lo, hi, step)),
+        "obs_property_float_min": lambda p: p.limits[0],
+        "obs_property_float_max": lambda p: p.limits[1],
+        "obs_property_float_step": lambda p: p.limits[2],
+        "obs_property_float_set_limits": lambda p, lo, hi, step: setattr(p, "limits", (lo, hi, step)),
+        "obs_property_text_info_type": lambda p: p.info_type,
+        "obs_property_text_set_info_type": lambda p, t: setattr(p, "info_type", t),
+        "obs_property_list_item_count": lambda p: len(p.items),
+        "obs_property_list_item_name": lambda p, i: p.items[i][0] if 0 <= i < len(p.items) else "",
+        "obs_property_list_item_string": lambda p, i: p.items[i][1] if 0 <= i < len(p.items) else "",
+        "obs_property_list_clear": lambda p: p.items.clear(),
+        "obs_property_list_add_string": lambda p, label, value: p.items.append((label, value)),
+        "obs_property_list_insert_string": lambda p, i, label, value: p.items.insert(i, (label, value)),
+        "obs_property_list_item_remove": lambda p, i: p.items.pop(i),
+        # obs_data
+        "obs_data_create": _Data,
+        "obs_data_release": lambda d: None,
+        "obs_data_apply": lambda target, source: target.update(source),
+        "obs_data_get_json": json.dumps,
+        "obs_data_get_bool": lambda d, k: d.get(k, False),
+        "obs_data_get_int": lambda d, k: d.get(k, 0),
+        "obs_data_get_double": lambda d, k: d.get(k, 0.0),
+        "obs_data_get_string": lambda d, k: d.get(k, ""),
+        "obs_data_get_obj": lambda d, k: d.get(k),
+        "obs_data_get_array": lambda d, k: d.get(k),
+        "obs_data_set_bool": _Data.__setitem__,
+        "obs_data_set_int": _Data.__setitem__,
+        "obs_data_set_double": _Data.__setitem__,
+        "obs_data_set_string": _Data.__setitem__,
+        "obs_data_set_obj": _Data.__setitem__,
+        "obs_data_set_array": _Data.__setitem__,
+        "obs_data_array_create": list,
+        "obs_data_array_release": lambda a: None,
+        "obs_data_array_count": len,
+        "obs_data_array_item": lambda a, i: a[i],
+        "obs_data_array_push_back": list.append,
+        "obs_data_array_insert": lambda a, i, item: a.insert(i, item),
+        "obs_data_array_erase": lambda a, i: a.pop(i),
+        "script_log": lambda level, message: None,
+    }
+    for name in ("bool", "int", "int_slider", "float", "float_slider", "text", "button", "list", "path",
+                 "color", "color_alpha", "font", "editable_list", "group"):
+        functions[f"obs_properties_add_{name}"] = add_property
+    for name, function in functions.items():
+        setattr(module, name, function)
+    return module
+
+
+try:
+    import obspython  # noqa: F401
+    SIMULATED_OBS = False
+    """是否使用模拟的 obspython"""
+except ImportError:
+    sys.modules["obspython"] = _build_simulated_obspython()
+    SIMULATED_OBS = True
+
+
+def make_property(name: str) -> _Property:
+    """创建一个属性对象，供基准中为控件赋值 obj"""
+    import obspython as obs
+    return obs.obs_properties_add_bool(obs.obs_properties_create(), name, name)
+
+
+# 计时工具
+# ----------------------------------------------------------------------------------------------------------------
+def best_of(function: Callable[[], Any], repeat: int = 5) -> float:
+    """多次运行取最短耗时（秒），计时期间关闭垃圾回收"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def print_header(title: str) -> None:
+    """打印基准标题与运行环境"""
+    print(title)
+    print(f"Python {sys.version.split()[0]}，obspython: {'模拟' if SIMULATED_OBS else 'OBS'}")
+    print("-" * 60)
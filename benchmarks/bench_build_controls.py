@@ -0,0 +1,83 @@
+"""
+基准：用 build_controls 构建大表单
+
+按 CSV 解析结果的格式生成 N 个控件（分布在若干分组中），调用 build_controls 构建，
+输出不同规模下的总耗时与每个控件的平均耗时。按 object_name 索引查找后，每控件耗时应基本不随 N 增长。
+
+运行: python benchmarks/bench_build_controls.py
+"""
+from _harness import best_of, print_header
+
+from src.framework.obsScriptControlDataFramework import ControlManager
+from src.framework.obsScriptControlInnatePropertyBuildFramework import build_controls
+
+SIZES = (1000, 2000, 3000, 4000, 5000)
+GROUP_SIZE = 50
+"""每个分组中的控件数量"""
+
+
+class _Silent:
+    """不做任何事的日志、回调管理器替身"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: (lambda *a, **k: None)
+
+
+def make_table(count: int) -> dict:
+    """生成与 ControlTemplateParser.parse_csv_files 结果格式一致的控件表"""
+    all_controls = []
+    for index in range(count):
+        if index % GROUP_SIZE == 0:
+            group_index = index // GROUP_SIZE
+            all_controls.append({
+                "widget_category": "GROUP",
+                "object_name": f"group_{group_index}",
+                "props_name": "props",
+                "group_properties": {"group_1": {
+                    "control_name": f"group_{group_index}",
+                    "description": f"分组 {group_index}",
+                    "widget_variant": "NORMAL",
+                    "group_props_name": f"group_{group_index}_props",
+                }},
+            })
+        all_controls.append({
+            "widget_category": "CHECKBOX",
+            "object_name": f"checkbox_{index}",
+            "props_name": f"group_{index // GROUP_SIZE}_props",
+            "group_properties": {"group_1": {
+                "control_name": f"checkbox_{index}",
+                "description": f"复选框 {index}",
+                "checked": index % 2 == 0,
+            }},
+        })
+    return {"all_controls": all_controls}
+
+
+def build(table: dict) -> ControlManager:
+    """用一个新的控件管理器构建整张表"""
+    manager = ControlManager()
+    silent = _Silent()
+    build_controls(
+        control_manager=manager,
+        control_property_table_dictionary=table,
+        log_manager=silent,
+        sys_common_data_manager=silent,
+        modified_function_manager=silent,
+        button_function_manager=silent,
+        control_ui_updater_manager=silent,
+    )
+    return manager
+
+
+def main() -> None:
+    print_header("build_controls 构建耗时")
+    print(f"{'控件数':>8} {'总耗时(ms)':>12} {'每控件(µs)':>12}")
+    for size in SIZES:
+        table = make_table(size)
+        widget_count = len(table["all_controls"])
+        seconds = best_of(lambda: build(table), repeat=3)
+        print(f"{widget_count:>8} {seconds * 1000:>12.1f} {seconds / widget_count * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
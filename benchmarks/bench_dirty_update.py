@@ -0,0 +1,70 @@
+"""
+基准：按脏集合同步单个控件
+
+在不同规模的表单中切换一个复选框，分别用 flush_dirty() 与 update({props_name: [control_name]}) 同步，
+输出每次同步的耗时。两种方式都只访问给定的控件，耗时应与表单中的控件总数无关。
+另外给出 update_controls() 完整同步全部控件时每个控件的耗时，状态位图整轮只合并记录一次，该值同样不随 N 增长。
+
+运行: python benchmarks/bench_dirty_update.py
+"""
+from _harness import best_of, make_property, print_header
+
+import obspython as obs
+
+from src.data.obsScriptControlData import WidgetCategory
+from src.framework.obsScriptControlDataFramework import ControlManager
+from src.framework.obsScriptControlUiUpdaterFramework import UIUpdater
+
+SIZES = (10, 2000, 10000)
+TOGGLES = 2000
+"""每轮计时中切换并同步的次数"""
+
+
+class _Silent:
+    """不输出任何内容的日志管理器替身"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def make_form(count: int):
+    """创建 count 个复选框的表单，返回 (控件管理器, UI 更新器)"""
+    manager = ControlManager()
+    manager.create_widgets_bulk([
+        {"category": WidgetCategory.CHECKBOX, "control_name": f"checkbox_{i}", "props_name": "props"}
+        for i in range(count)
+    ])
+    for widget in manager.get_widgets_by_load_order():
+        widget.obj = make_property(widget.control_name)
+    updater = UIUpdater(obs.obs_data_create(), manager, _Silent())
+    updater.update_controls(widget.control_name for widget in manager.get_widgets_by_load_order())
+    return manager, updater
+
+
+def main() -> None:
+    print_header("切换一个复选框后的同步耗时")
+    print(f"{'控件数':>8} {'flush_dirty(µs)':>16} {'update(µs)':>12} {'全量每控件(µs)':>16}")
+    for size in SIZES:
+        manager, updater = make_form(size)
+        widget = manager.get_widget_by_control_name(f"checkbox_{size // 2}")
+        targets = {"props": [widget.control_name]}
+
+        def toggle_flush():
+            for _ in range(TOGGLES):
+                widget.checked = not widget.checked
+                updater.flush_dirty()
+
+        def toggle_update():
+            for _ in range(TOGGLES):
+                widget.checked = not widget.checked
+                updater.update(targets)
+
+        names = [w.control_name for w in manager.get_widgets_by_load_order()]
+        flush_seconds = best_of(toggle_flush) / TOGGLES
+        update_seconds = best_of(toggle_update) / TOGGLES
+        full_seconds = best_of(lambda: updater.update_controls(names), repeat=3) / size
+        print(f"{size:>8} {flush_seconds * 1e6:>16.2f} {update_seconds * 1e6:>12.2f} {full_seconds * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
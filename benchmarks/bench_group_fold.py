@@ -0,0 +1,87 @@
+"""
+基准：6 层嵌套分组的折叠/展开刷新
+
+表单由若干棵相同的分支组成，每棵分支是 6 层嵌套的可勾选分组，每层分组中有若干复选框。
+分别折叠再展开第 1 层（最外层）、第 3 层与第 6 层（最内层）分组，对比：
+1. refresh_group_fold(group)：只同步实际可见性发生变化的控件；
+2. update(get_props_mapping())：按整张映射同步全部控件（折叠刷新原来的做法）。
+refresh_group_fold 的耗时应与同步的控件数成正比，与表单总规模无关。
+
+运行: python benchmarks/bench_group_fold.py
+"""
+from _harness import best_of, make_property, print_header
+
+import obspython as obs
+
+from src.data.obsScriptControlData import GroupVariant, WidgetCategory
+from src.framework.obsScriptControlDataFramework import ControlManager
+from src.framework.obsScriptControlUiUpdaterFramework import UIUpdater
+
+DEPTH = 6
+"""分组嵌套层数"""
+WIDGETS_PER_LEVEL = 20
+"""每层分组中的复选框数量"""
+BRANCHES = 10
+"""表单中的分支数量"""
+
+
+class _Silent:
+    """不输出任何内容的日志管理器替身"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def make_form():
+    """创建 BRANCHES 棵 DEPTH 层嵌套的分支，返回 (控件管理器, UI 更新器, 第 0 棵分支各层的分组)"""
+    manager = ControlManager()
+    updater = UIUpdater(obs.obs_data_create(), manager, _Silent())
+    specs = []
+    for branch in range(BRANCHES):
+        parent_props = "props"
+        for level in range(1, DEPTH + 1):
+            group_name = f"b{branch}_group_{level}"
+            specs.append({"category": WidgetCategory.GROUP, "control_name": group_name, "props_name": parent_props,
+                          "group_props_name": f"{group_name}_props", "widget_variant": GroupVariant.CHECKABLE})
+            parent_props = f"{group_name}_props"
+            specs.extend(
+                {"category": WidgetCategory.CHECKBOX, "control_name": f"b{branch}_l{level}_checkbox_{i}",
+                 "props_name": parent_props}
+                for i in range(WIDGETS_PER_LEVEL)
+            )
+    for widget in manager.create_widgets_bulk(specs):
+        widget.obj = make_property(widget.control_name)
+        if widget.widget_category is WidgetCategory.GROUP:
+            widget.folding_control_obj = make_property(widget.control_name.encode().hex())
+    groups = [manager.get_widget_by_control_name(f"b0_group_{level}") for level in range(1, DEPTH + 1)]
+    return manager, updater, groups
+
+
+def main() -> None:
+    manager, updater, groups = make_form()
+    widget_count = manager.total_widgets
+    print_header(f"{DEPTH} 层嵌套分组折叠刷新（{BRANCHES} 棵分支，共 {widget_count} 个控件）")
+    mapping = manager.get_props_mapping()
+    updater.update(mapping)
+    print(f"{'分组':>8} {'同步控件数':>10} {'refresh_group_fold(µs)':>24} {'整表 update(µs)':>16}")
+    for level in (1, 3, DEPTH):
+        group = groups[level - 1]
+        synced = []
+
+        def toggle_with_refresh():
+            for folding_visible in (False, True):
+                group.folding_visible = folding_visible
+                synced.append(updater.refresh_group_fold(group))
+
+        def toggle_with_full_update():
+            for folding_visible in (False, True):
+                group.folding_visible = folding_visible
+                updater.update(mapping)
+
+        refresh_seconds = best_of(toggle_with_refresh) / 2
+        full_seconds = best_of(toggle_with_full_update, repeat=3) / 2
+        print(f"{'第' + str(level) + '层':>8} {max(synced):>10} {refresh_seconds * 1e6:>24.0f} {full_seconds * 1e6:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
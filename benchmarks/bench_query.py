@@ -0,0 +1,127 @@
+"""
+基准：ControlManager.query 组合条件查询
+
+1. 正确性：在增删、移动控件以及直接修改 widget_variant、load_order、props_name 之后，query 的结果与遍历
+   get_widgets_by_load_order() 逐个筛选的结果一致（顺序同为 load_order）；
+2. 耗时：在不同规模的表单中查询一个位于小分组内的可见 FLOAT_SLIDER 数字框，与线性筛选对比。
+   query 从最小的候选索引出发，耗时应基本不随控件总数增长。
+
+运行: python benchmarks/bench_query.py
+"""
+from _harness import best_of, print_header
+
+from src.data.obsScriptControlData import DigitalBoxVariant, GroupData, WidgetCategory
+from src.framework.obsScriptControlDataFramework import ControlManager
+
+SIZES = (1000, 10000, 50000)
+QUERIES = 200
+"""每轮计时中执行的查询次数"""
+VARIANTS = (DigitalBoxVariant.INT, DigitalBoxVariant.FLOAT, DigitalBoxVariant.INT_SLIDER)
+"""大分组中数字框轮流使用的类型（不含查询目标 FLOAT_SLIDER）"""
+
+
+def make_form(count: int) -> ControlManager:
+    """count 个数字框放在大分组 big 中，另有 4 个 FLOAT_SLIDER 放在小分组 small 中（其中 1 个隐藏）"""
+    manager = ControlManager()
+    manager.create_widgets_bulk([
+        {"category": WidgetCategory.GROUP, "control_name": "big", "props_name": "props", "group_props_name": "big_props"},
+        {"category": WidgetCategory.GROUP, "control_name": "small", "props_name": "props",
+         "group_props_name": "small_props"},
+    ])
+    manager.create_widgets_bulk([
+        {"category": WidgetCategory.DIGITALBOX, "control_name": f"digital_{i}", "props_name": "big_props",
+         "widget_variant": VARIANTS[i % len(VARIANTS)]}
+        for i in range(count)
+    ])
+    manager.create_widgets_bulk([
+        {"category": WidgetCategory.DIGITALBOX, "control_name": f"slider_{i}", "props_name": "small_props",
+         "widget_variant": DigitalBoxVariant.FLOAT_SLIDER, "visible": i != 0}
+        for i in range(4)
+    ])
+    return manager
+
+
+def linear_query(manager: ControlManager, category=None, variant=None, props_name=None, visible=None,
+                 within_group=None) -> list:
+    """遍历全部控件逐个筛选，作为 query 的参照"""
+    subtree = None
+    if within_group is not None:
+        group = manager.get_widget_by_control_name(within_group)
+        if not isinstance(group, GroupData):
+            return []
+        subtree = {group.group_props_name, *manager.get_props_descendants(group.group_props_name)}
+    return [
+        w for w in manager.get_widgets_by_load_order()
+        if (category is None or w.widget_category is category)
+        and (variant is None or w.widget_variant == variant)
+        and (props_name is None or w.props_name == props_name)
+        and (visible is None or w.visible == visible)
+        and (subtree is None or w.props_name in subtree)
+    ]
+
+
+def check(manager: ControlManager, step: str) -> None:
+    """以多组条件比较 query 与线性筛选的结果"""
+    criteria = (
+        {"category": WidgetCategory.DIGITALBOX, "variant": DigitalBoxVariant.FLOAT_SLIDER, "visible": True},
+        {"variant": DigitalBoxVariant.INT},
+        {"props_name": "small_props"},
+        {"within_group": "small"},
+        {"within_group": "big", "variant": DigitalBoxVariant.FLOAT_SLIDER},
+        {"category": WidgetCategory.GROUP},
+        {"visible": False},
+    )
+    for kwargs in criteria:
+        expected = linear_query(manager, **kwargs)
+        actual = manager.query(**kwargs)
+        assert actual == expected, f"{step}: query({kwargs}) 返回 {len(actual)} 个控件，期望 {len(expected)} 个"
+
+
+def check_correctness() -> None:
+    """在各类结构变化之后检查 query 结果"""
+    manager = make_form(30)
+    check(manager, "初始")
+    manager.create_widget(WidgetCategory.DIGITALBOX, "added", props_name="small_props",
+                          widget_variant=DigitalBoxVariant.FLOAT_SLIDER)
+    check(manager, "添加控件")
+    manager.remove_widget("slider_2")
+    check(manager, "移除控件")
+    manager.move_widget("slider_3", "big_props")
+    check(manager, "移动控件")
+    manager.move_widget("digital_0", "small_props", new_load_order=0)
+    check(manager, "移动并调整 load_order")
+    manager.get_widget_by_control_name("digital_1").widget_variant = DigitalBoxVariant.FLOAT_SLIDER
+    check(manager, "修改 widget_variant")
+    manager.get_widget_by_control_name("digital_2").load_order = -1
+    check(manager, "直接修改 load_order")
+    manager.get_widget_by_control_name("digital_3").props_name = "small_props"
+    check(manager, "直接修改 props_name")
+    manager.remove_widget("digital_2")
+    assert manager.get_widget_by_control_name("digital_2") is None
+    check(manager, "移除修改过 load_order 的控件")
+    manager.move_widget("small", "big_props")
+    check(manager, "移动分组")
+    print("正确性检查通过")
+
+
+def main() -> None:
+    print_header("ControlManager.query 组合条件查询")
+    check_correctness()
+    print(f"{'控件数':>8} {'query(µs)':>12} {'线性筛选(µs)':>14}")
+    criteria = {"category": WidgetCategory.DIGITALBOX, "variant": DigitalBoxVariant.FLOAT_SLIDER,
+                "visible": True, "within_group": "small"}
+    for size in SIZES:
+        manager = make_form(size)
+        assert len(manager.query(**criteria)) == 3
+
+        def run_query():
+            for _ in range(QUERIES):
+                manager.query(**criteria)
+
+        query_seconds = best_of(run_query, repeat=3) / QUERIES
+        linear_seconds = best_of(lambda: linear_query(manager, **criteria), repeat=3)
+        print(f"{size:>8} {query_seconds * 1e6:>12.2f} {linear_seconds * 1e6:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+基准：同步 1,000 个混合控件
+
+表单包含复选框、整数/浮点数字框、普通/信息文本框、可编辑/不可编辑组合框、路径框以及普通/可勾选分组框，
+控件注册时即由 UIUpdater 绑定按分类与派生类型选定的同步函数。输出：
+1. 完整同步全部控件（update_controls）的耗时，首次同步需要写入 settings，之后的同步命中影子副本；
+2. 修改每个控件的值后 flush_dirty() 的耗时，分别给出直接写入 settings 与开启暂存写入（stage_settings_writes）的结果；
+3. 修改派生类型后，控件重新绑定的同步函数与新类型一致。
+
+运行: python benchmarks/bench_ui_update.py
+"""
+import itertools
+
+from _harness import best_of, make_property, print_header
+
+import obspython as obs
+
+from src.data.obsScriptControlData import (
+    ComboBoxVariant, DigitalBoxVariant, GroupVariant, TextBoxInfoVariant, TextBoxVariant, WidgetCategory,
+)
+from src.framework.obsScriptControlDataFramework import ControlManager
+from src.framework.obsScriptControlUiUpdaterFramework import UIUpdater
+
+WIDGET_COUNT = 1000
+ITEMS = [{"label": f"选项{i}", "value": f"option_{i}"} for i in range(5)]
+"""组合框选项"""
+
+
+class _Silent:
+    """不输出任何内容的日志管理器替身"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def widget_specs(count: int) -> list:
+    """生成 count 个轮流使用各分类与派生类型的控件构造参数"""
+    kinds = itertools.cycle((
+        {"category": WidgetCategory.CHECKBOX},
+        {"category": WidgetCategory.DIGITALBOX, "widget_variant": DigitalBoxVariant.INT, "digital": 1},
+        {"category": WidgetCategory.DIGITALBOX, "widget_variant": DigitalBoxVariant.FLOAT_SLIDER, "digital": 0.5},
+        {"category": WidgetCategory.TEXTBOX, "widget_variant": TextBoxVariant.DEFAULT, "text": "文本"},
+        {"category": WidgetCategory.TEXTBOX, "widget_variant": TextBoxVariant.INFO, "text": "提示",
+         "info_type": TextBoxInfoVariant.WARNING},
+        {"category": WidgetCategory.COMBOBOX, "widget_variant": ComboBoxVariant.EDITABLE, "label": "选项1"},
+        {"category": WidgetCategory.COMBOBOX, "widget_variant": ComboBoxVariant.LIST, "value": "option_2"},
+        {"category": WidgetCategory.PATHBOX, "path_text": "."},
+        {"category": WidgetCategory.GROUP, "widget_variant": GroupVariant.NORMAL},
+        {"category": WidgetCategory.GROUP, "widget_variant": GroupVariant.CHECKABLE},
+    ))
+    specs = []
+    for index, kind in zip(range(count), kinds):
+        spec = dict(kind, control_name=f"widget_{index}", props_name="props")
+        if spec["category"] is WidgetCategory.COMBOBOX:
+            spec["items"] = [dict(item) for item in ITEMS]
+        if spec["category"] is WidgetCategory.GROUP:
+            spec["group_props_name"] = f"widget_{index}_props"
+        specs.append(spec)
+    return specs
+
+
+def make_form(count: int):
+    """创建控件并为其分配属性对象，返回 (控件管理器, UI 更新器)"""
+    manager = ControlManager()
+    updater = UIUpdater(obs.obs_data_create(), manager, _Silent())
+    widgets = manager.create_widgets_bulk(widget_specs(count))
+    for widget in widgets:
+        widget.obj = make_property(widget.control_name)
+        if widget.widget_variant is GroupVariant.CHECKABLE:
+            widget.folding_control_obj = make_property(widget.control_name.encode().hex())
+    return manager, updater, widgets
+
+
+def change_values(widgets: list, round_index: int) -> None:
+    """修改每个控件的值，使下一次同步需要写入"""
+    for widget in widgets:
+        category = widget.widget_category
+        if category is WidgetCategory.CHECKBOX or widget.widget_variant is GroupVariant.CHECKABLE:
+            widget.checked = not widget.checked
+        elif category is WidgetCategory.DIGITALBOX:
+            widget.digital = type(widget.digital)(round_index)
+        elif category is WidgetCategory.TEXTBOX:
+            widget.text = f"文本{round_index}"
+        elif category is WidgetCategory.COMBOBOX:
+            widget.label = ITEMS[round_index % len(ITEMS)]["label"]
+            widget.value = ITEMS[round_index % len(ITEMS)]["value"]
+        elif category is WidgetCategory.PATHBOX:
+            widget.path_text = f"./{round_index}"
+
+
+def check_rebinding(manager: ControlManager, updater: UIUpdater) -> None:
+    """修改派生类型或移除控件后，绑定随之更新"""
+    digital = manager.get_widget_by_control_name("widget_1")
+    digital.widget_variant = DigitalBoxVariant.FLOAT
+    digital.digital = 2.5
+    updater.flush_dirty()
+    assert updater.script_settings["widget_1"] == 2.5
+    assert updater._sync_bindings["widget_1"][0] is digital
+    manager.remove_widget("widget_0")
+    assert "widget_0" not in updater._sync_bindings
+    print("重新绑定检查通过")
+
+
+def main() -> None:
+    print_header(f"同步 {WIDGET_COUNT} 个混合控件")
+    manager, updater, widgets = make_form(WIDGET_COUNT)
+    names = [widget.control_name for widget in widgets]
+    assert len(updater._sync_bindings) == WIDGET_COUNT, "控件注册时应已绑定同步函数"
+
+    first_seconds = best_of(lambda: updater.update_controls(names), repeat=1)
+    steady_seconds = best_of(lambda: updater.update_controls(names))
+    rounds = itertools.count(1)
+
+    def change_and_flush():
+        change_values(widgets, next(rounds))
+        updater.flush_dirty()
+
+    flush_seconds = best_of(change_and_flush)
+    updater.stage_settings_writes = True
+    staged_flush_seconds = best_of(change_and_flush)
+    updater.stage_settings_writes = False
+    print(f"首次完整同步      {first_seconds * 1000:8.2f} ms")
+    print(f"再次完整同步      {steady_seconds * 1000:8.2f} ms（命中影子副本）")
+    print(f"修改全部值并同步  {flush_seconds * 1000:8.2f} ms（直接写入），"
+          f"{staged_flush_seconds * 1000:.2f} ms（暂存写入）")
+    check_rebinding(manager, updater)
+    updater.path_status_cache.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+基准：每个控件数据对象占用的内存
+
+用 tracemalloc 统计创建 N 个控件数据对象分配的字节数，对比以下类布局：
+1. 改动前的布局：普通 dataclass（带 __dict__），且不含变更追踪新增的私有字段（_manager、_dirty_fields、_state_id），
+   即改为 slots 之前的字段集合，是本项改动的“之前”数值；
+2. 普通 dataclass（带 __dict__），字段与当前控件数据类相同，只用于区分 slots 与新增字段各自的影响；
+3. _add_slots 手动生成 __slots__（Python 3.10 以下的 OBS 内嵌解释器走这一分支）；
+4. 当前解释器中实际使用的控件数据类（slotted_dataclass），是本项改动的“之后”数值。
+另外给出经 ControlManager.create_widgets_bulk 注册后包含各索引（名称/分类/派生类型索引、load_order 序列、
+状态位图等）在内的每控件字节数。该数值衡量的是管理器的总开销，不能与上面的单个对象数值直接比较。
+
+运行: python benchmarks/bench_widget_memory.py
+"""
+import dataclasses
+import gc
+import tracemalloc
+
+from _harness import print_header
+
+from src.data.obsScriptControlData import (
+    CheckBoxData, DigitalBoxData, TextBoxData, ComboBoxData, GroupData, WidgetCategory, _add_slots,
+)
+from src.framework.obsScriptControlDataFramework import ControlManager
+
+COUNT = 5000
+"""每种布局创建的控件数量"""
+WIDGET_CLASSES = (CheckBoxData, DigitalBoxData, TextBoxData, ComboBoxData)
+"""参与统计的控件数据类，按顺序轮流创建"""
+
+
+def plain_copy(cls: type, baseline_fields: bool = False) -> type:
+    """
+    以相同字段生成不带 slots 的普通 dataclass
+
+    baseline_fields 为 True 时去掉变更追踪新增的私有字段（以下划线开头），得到改动前的字段集合
+    """
+    specs = []
+    for f in dataclasses.fields(cls):
+        if baseline_fields and f.name.startswith("_"):
+            continue
+        kwargs = {"init": f.init, "repr": f.repr, "compare": f.compare}
+        if f.default is not dataclasses.MISSING:
+            kwargs["default"] = f.default
+        if f.default_factory is not dataclasses.MISSING:
+            kwargs["default_factory"] = f.default_factory
+        specs.append((f.name, f.type, dataclasses.field(**kwargs)))
+    return dataclasses.make_dataclass(cls.__name__, specs)
+
+
+def measure(classes, count: int = COUNT) -> float:
+    """创建 count 个控件数据对象，返回每个对象分配的字节数"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    widgets = [classes[i % len(classes)](control_name=f"w{i}", object_name=f"w{i}") for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del widgets
+    return allocated / count
+
+
+def measure_registered(count: int = COUNT) -> float:
+    """经 create_widgets_bulk 注册 count 个控件，返回每个控件（含管理器索引）分配的字节数"""
+    specs = [{"category": WidgetCategory.CHECKBOX, "control_name": f"w{i}", "props_name": "props"}
+             for i in range(count)]
+    manager = ControlManager()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    manager.create_widgets_bulk(specs)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename")) / count
+
+
+def main() -> None:
+    print_header(f"每个控件数据对象的内存（{COUNT} 个，{'/'.join(c.__name__ for c in WIDGET_CLASSES)} 轮流）")
+    baseline_classes = tuple(plain_copy(cls, baseline_fields=True) for cls in WIDGET_CLASSES)
+    plain_classes = tuple(plain_copy(cls) for cls in WIDGET_CLASSES)
+    manual_classes = tuple(_add_slots(plain_copy(cls)) for cls in WIDGET_CLASSES)
+    has_slots = all(not hasattr(cls(), "__dict__") for cls in WIDGET_CLASSES)
+    baseline = measure(baseline_classes)
+    current = measure(WIDGET_CLASSES)
+    print("单个控件数据对象：")
+    print(f"{'改动前（__dict__，原字段集合）':<32} {baseline:>8.0f} 字节/控件")
+    print(f"{'__dict__，当前字段集合':<32} {measure(plain_classes):>8.0f} 字节/控件")
+    print(f"{'_add_slots (Python < 3.10)':<32} {measure(manual_classes):>8.0f} 字节/控件")
+    print(f"{'当前控件数据类' + ('（slots）' if has_slots else '（无 slots）'):<32} {current:>8.0f} 字节/控件")
+    print(f"改动前后对比：{baseline:.0f} → {current:.0f} 字节/控件（{(current - baseline) / baseline:+.0%}）")
+    print("管理器总开销（与上面的单个对象数值不可直接比较）：")
+    print(f"{'注册到 ControlManager（含索引）':<32} {measure_registered():>8.0f} 字节/控件")
+    group = GroupData(control_name="g", group_props_name="g_props")
+    print(f"GroupData 是否有 __dict__: {hasattr(group, '__dict__')}")
+
+
+if __name__ == "__main__":
+    main()
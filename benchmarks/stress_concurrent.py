@@ -0,0 +1,110 @@
+"""
+压力测试：并发模式下后台线程持续写入控件字段
+
+若干写线程不停地修改控件的值与可见状态，主线程模拟 OBS 的逐帧循环：每帧调用 apply_pending_changes()
+与 pop_dirty()，并通过 query()、diff_state_against_pushed() 读取模型。检查：
+1. 每帧都能在有限时间内返回（写线程不会让主线程的排队处理无限循环），超时则打印各线程栈并退出；
+2. 每帧处理的排队变更不超过 控件数×被修改字段数（重复修改同一字段会被合并）；
+3. 写线程停止后，由后台线程修改过的每个控件都被登记为脏，状态位图与控件属性一致。
+
+运行: python benchmarks/stress_concurrent.py
+"""
+import faulthandler
+import random
+import threading
+import time
+
+from _harness import print_header
+
+from src.data.obsScriptControlData import WidgetCategory
+from src.framework.obsScriptControlDataFramework import ControlManager
+
+WIDGET_COUNT = 500
+WRITER_COUNT = 4
+DURATION_SECONDS = 3.0
+"""写线程持续写入的时间"""
+FRAME_TIMEOUT_SECONDS = 5.0
+"""单帧超过该时间视为卡死"""
+WRITTEN_FIELDS = ("checked", "visible")
+"""写线程修改的字段"""
+
+
+def writer(manager: ControlManager, stop: threading.Event, seed: int) -> None:
+    """随机修改控件字段直到 stop 被设置"""
+    rng = random.Random(seed)
+    widgets = list(manager.get_widgets_by_load_order())
+    while not stop.is_set():
+        widget = rng.choice(widgets)
+        setattr(widget, rng.choice(WRITTEN_FIELDS), rng.random() < 0.5)
+
+
+def main() -> None:
+    print_header(f"并发写入压力测试（{WRITER_COUNT} 个写线程，{WIDGET_COUNT} 个控件，{DURATION_SECONDS:.0f} 秒）")
+    manager = ControlManager(concurrent=True)
+    manager.create_widgets_bulk([
+        {"category": WidgetCategory.CHECKBOX, "control_name": f"checkbox_{i}", "props_name": "props"}
+        for i in range(WIDGET_COUNT)
+    ])
+    manager.pop_dirty()
+
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=writer, args=(manager, stop, seed), daemon=True)
+        for seed in range(WRITER_COUNT)
+    ]
+    for thread in threads:
+        thread.start()
+
+    max_batch = WIDGET_COUNT * len(WRITTEN_FIELDS)
+    frames = applied_total = largest_batch = 0
+    slowest_frame = 0.0
+    deadline = time.perf_counter() + DURATION_SECONDS
+    while time.perf_counter() < deadline:
+        faulthandler.dump_traceback_later(FRAME_TIMEOUT_SECONDS, exit=True)
+        start = time.perf_counter()
+        applied = manager.apply_pending_changes()
+        manager.pop_dirty()
+        manager.query(category=WidgetCategory.CHECKBOX, visible=False)
+        manager.diff_state_against_pushed()
+        manager.mark_state_pushed()
+        slowest_frame = max(slowest_frame, time.perf_counter() - start)
+        faulthandler.cancel_dump_traceback_later()
+        assert applied <= max_batch, f"单帧处理了 {applied} 条变更，超过上限 {max_batch}"
+        frames += 1
+        applied_total += applied
+        largest_batch = max(largest_batch, applied)
+        time.sleep(1 / 60)
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    # 写线程停止后：由后台线程各修改一批控件，处理排队变更后这些控件都应为脏
+    manager.apply_pending_changes()
+    manager.pop_dirty()
+    widgets = list(manager.get_widgets_by_load_order())
+    final_writers = [
+        threading.Thread(target=lambda part: [setattr(w, "checked", not w.checked) for w in part],
+                         args=(widgets[seed::WRITER_COUNT],))
+        for seed in range(WRITER_COUNT)
+    ]
+    for thread in final_writers:
+        thread.start()
+    for thread in final_writers:
+        thread.join()
+    assert manager.pending_change_count == WIDGET_COUNT
+    assert manager.apply_pending_changes() == WIDGET_COUNT
+    dirty_names = {widget.control_name for widget, _ in manager.pop_dirty()}
+    assert dirty_names == {w.control_name for w in widgets}, f"{WIDGET_COUNT - len(dirty_names)} 个控件未登记为脏"
+
+    # 状态位图与控件属性一致：show_subtree 按位图挑出的控件正是属性为隐藏的控件
+    hidden = {w.control_name for w in widgets if not w.visible}
+    assert {w.control_name for w in manager.show_subtree("props")} == hidden
+
+    print(f"帧数 {frames}，处理变更 {applied_total} 条，单帧最多 {largest_batch} 条（上限 {max_batch}）")
+    print(f"最慢一帧 {slowest_frame * 1000:.2f} ms")
+    print("检查通过")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,14 +20,14 @@ try:
     from src.tool.LogManager import LogManager
     from src.tool.scriptCsv2Json import ControlTemplateParser
     from src.tool.CommonDataManager import CommonDataManager
-    from src.data.obsScriptGlobalVariable import ObsScriptGlobalData, ObsScriptGlobalManager
+    from src.data.obsScriptGlobalVariable import ObsScriptContext
     from src.data.obsScriptControlData import WidgetCategory
     from src.data.obsScriptControlData import (CheckBoxVariant, DigitalBoxVariant, TextBoxVariant, ButtonVariant,
                                                ComboBoxVariant, PathBoxVariant, ColorBoxVariant, FontBoxVariant,
                                                ListBoxVariant, GroupVariant)
     from plugins.ButtonFunction import BtnFunction
     from plugins.ControlFunction import ControlDataSetFunction
-    from src.framework.obsScriptControlDataFramework import get_control_manager
+    from src.framework.obsScriptControlDataFramework import get_control_manager, release_control_manager
     from src.framework.obsScriptControlInnatePropertyBuildFramework import build_controls
     from src.framework.obsScriptControlFreePropertyBuildFramework import apply_user_properties
     from src.framework.obsScriptModifiedFunctionFramework import ModifiedFunction
@@ -42,7 +42,7 @@ except ImportError:
         from obsScriptFramework_.src.tool.LogManager import LogManager
         from obsScriptFramework_.src.tool.scriptCsv2Json import ControlTemplateParser
         from obsScriptFramework_.src.tool.CommonDataManager import CommonDataManager
-        from obsScriptFramework_.src.data.obsScriptGlobalVariable import ObsScriptGlobalData, ObsScriptGlobalManager
+        from obsScriptFramework_.src.data.obsScriptGlobalVariable import ObsScriptContext
         from obsScriptFramework_.src.data.obsScriptControlData import WidgetCategory
         from obsScriptFramework_.src.data.obsScriptControlData import (CheckBoxVariant, DigitalBoxVariant, TextBoxVariant,
                                                                        ButtonVariant, ComboBoxVariant, PathBoxVariant,
@@ -50,7 +50,7 @@ except ImportError:
                                                                        GroupVariant)
         from obsScriptFramework_.plugins.ButtonFunction import BtnFunction
         from obsScriptFramework_.plugins.ControlFunction import ControlDataSetFunction
-        from obsScriptFramework_.src.framework.obsScriptControlDataFramework import get_control_manager
+        from obsScriptFramework_.src.framework.obsScriptControlDataFramework import get_control_manager, release_control_manager
         from obsScriptFramework_.src.framework.obsSciptButtonFunctionFramework import ObsScriptButtonFunction
         from obsScriptFramework_.src.framework.obsScriptControlInnatePropertyBuildFramework import build_controls
         from obsScriptFramework_.src.framework.obsScriptControlFreePropertyBuildFramework import apply_user_properties
@@ -63,6 +63,9 @@ except ImportError:
         ImportSuccess = (False, str(e.msg))
         obs.script_log(obs.LOG_ERROR, str(e.msg))
 
+script_context = ObsScriptContext(script_config_folder) if ImportSuccess[0] else None
+"""本脚本的运行上下文，同一解释器中的其他脚本各有自己的上下文"""
+
 
 def script_defaults(settings):  # 设置其默认值
     """
@@ -73,71 +76,76 @@ def script_defaults(settings):  # 设置其默认值
     if not ImportSuccess[0]:
         return
     # 脚本设置体
-    ObsScriptGlobalData.settings = settings
+    script_context.settings = settings
     # # 控件系统属性常用设置文件路径
     # ObsScriptGlobalData.control_system_properties_common_settings_filepath = script_config_folder / ObsScriptGlobalData.control_system_properties_common_settings_filename
     # 日志管理器
-    ObsScriptGlobalManager.Log_manager = LogManager(ObsScriptGlobalData.log_folder_path)
+    script_context.Log_manager = LogManager(script_context.log_folder_path)
     # 控件管理器
-    ObsScriptGlobalManager.control_manager = get_control_manager()
+    script_context.control_manager = get_control_manager(script_file_path)
     # 控件属性文档转换器
-    ObsScriptGlobalManager.control_parser_manager = ControlTemplateParser()
+    script_context.control_parser_manager = ControlTemplateParser()
     # 控件系统属性常用设置属性
-    ObsScriptGlobalManager.sys_common_data_manager = CommonDataManager(filepath=ObsScriptGlobalData.control_system_properties_common_settings_filepath)
-    ObsScriptGlobalManager.ControlUiUpdaterManager = UIUpdater(
-        script_settings=ObsScriptGlobalData.settings,
-        control_manager=ObsScriptGlobalManager.control_manager,
-        Log_manager=ObsScriptGlobalManager.Log_manager
+    script_context.sys_common_data_manager = CommonDataManager(filepath=script_context.control_system_properties_common_settings_filepath)
+    script_context.ControlUiUpdaterManager = UIUpdater(
+        script_settings=script_context.settings,
+        control_manager=script_context.control_manager,
+        Log_manager=script_context.Log_manager
     )
+    if script_context.ui_deferred_sync_enabled:
+        # 延后同步：折叠分组中的控件在之后的同步中按时间预算分批补齐
+        script_context.ControlUiUpdaterManager.enable_deferred_sync(script_context.ui_deferred_sync_budget_ms)
     # 按钮回调函数类
-    ObsScriptGlobalData.BtnFunctions = BtnFunction(
-        Log_manager=ObsScriptGlobalManager.Log_manager,
-        sys_c_d_m=ObsScriptGlobalManager.sys_common_data_manager,
-        control_manager=ObsScriptGlobalManager.control_manager,
-        control_ui_updater_manager=ObsScriptGlobalManager.ControlUiUpdaterManager
+    script_context.BtnFunctions = BtnFunction(
+        Log_manager=script_context.Log_manager,
+        sys_c_d_m=script_context.sys_common_data_manager,
+        control_manager=script_context.control_manager,
+        control_ui_updater_manager=script_context.ControlUiUpdaterManager
     )
     # 控件获取属性函数类
-    ObsScriptGlobalData.ControlDataSetFunctions = ControlDataSetFunction(
-        sys_c_d_m=ObsScriptGlobalManager.sys_common_data_manager,
-        control_manager=ObsScriptGlobalManager.control_manager
+    script_context.ControlDataSetFunctions = ControlDataSetFunction(
+        sys_c_d_m=script_context.sys_common_data_manager,
+        control_manager=script_context.control_manager
     )
     # 前端事件触发管理器
-    ObsScriptGlobalManager.trigger_front_event_manager = TriggerFrontendEvent(
-        BtnFunctions=ObsScriptGlobalData.BtnFunctions,
-        log_manager=ObsScriptGlobalManager.Log_manager
+    script_context.trigger_front_event_manager = TriggerFrontendEvent(
+        BtnFunctions=script_context.BtnFunctions,
+        log_manager=script_context.Log_manager
     )
     # 按钮回调函数管理器
-    ObsScriptGlobalManager.button_function_manager = ObsScriptButtonFunction(
-        BtnFunctions=ObsScriptGlobalData.BtnFunctions,
-        log=ObsScriptGlobalManager.Log_manager
+    script_context.button_function_manager = ObsScriptButtonFunction(
+        BtnFunctions=script_context.BtnFunctions,
+        log=script_context.Log_manager,
+        ui_updater=script_context.ControlUiUpdaterManager
     )
     # 控件变动回调函数管理器
-    ObsScriptGlobalData.modified_function_manager = ModifiedFunction(
-        BtnFunctions=ObsScriptGlobalData.BtnFunctions,
-        log_manager=ObsScriptGlobalManager.Log_manager
+    script_context.modified_function_manager = ModifiedFunction(
+        BtnFunctions=script_context.BtnFunctions,
+        log_manager=script_context.Log_manager,
+        ui_updater=script_context.ControlUiUpdaterManager
     )
     # 控件属性表字典
-    ObsScriptGlobalData.control_property_table_dictionary = ObsScriptGlobalManager.control_parser_manager.parse_csv_files(
-        attribute_def_path=ObsScriptGlobalData.control_attribute_definition_data_csv_filepath,
-        data_path=ObsScriptGlobalData.control_data_csv_filepath,
-        initial_props_name=ObsScriptGlobalManager.control_manager.get_basic_group().group_props_name
+    script_context.control_property_table_dictionary = script_context.control_parser_manager.parse_csv_files(
+        attribute_def_path=script_context.control_attribute_definition_data_csv_filepath,
+        data_path=script_context.control_data_csv_filepath,
+        initial_props_name=script_context.control_manager.get_basic_group().group_props_name
     )
     # 设定 天赋属性
     build_controls(
-        control_manager=ObsScriptGlobalManager.control_manager,
-        control_property_table_dictionary=ObsScriptGlobalData.control_property_table_dictionary,
-        log_manager=ObsScriptGlobalManager.Log_manager,
-        sys_common_data_manager=ObsScriptGlobalManager.sys_common_data_manager,
-        modified_function_manager=ObsScriptGlobalData.modified_function_manager,
-        button_function_manager=ObsScriptGlobalManager.button_function_manager,
-        control_ui_updater_manager=ObsScriptGlobalManager.ControlUiUpdaterManager
+        control_manager=script_context.control_manager,
+        control_property_table_dictionary=script_context.control_property_table_dictionary,
+        log_manager=script_context.Log_manager,
+        sys_common_data_manager=script_context.sys_common_data_manager,
+        modified_function_manager=script_context.modified_function_manager,
+        button_function_manager=script_context.button_function_manager,
+        control_ui_updater_manager=script_context.ControlUiUpdaterManager
     )
     # 设定控件用户属性
     apply_user_properties(
-        log_manager=ObsScriptGlobalManager.Log_manager,
-        control_manager=ObsScriptGlobalManager.control_manager,
-        control_property_table_dictionary=ObsScriptGlobalData.control_property_table_dictionary,
-        ControlDataSetFunctions=ObsScriptGlobalData.ControlDataSetFunctions,
+        log_manager=script_context.Log_manager,
+        control_manager=script_context.control_manager,
+        control_property_table_dictionary=script_context.control_property_table_dictionary,
+        ControlDataSetFunctions=script_context.ControlDataSetFunctions,
         all_props_mapping=None
     )
 
@@ -148,7 +156,7 @@ def script_description():
     # 包载入判断
     if not ImportSuccess[0]:
         return ImportSuccess[1]
-    return ObsScriptGlobalData.description
+    return script_context.description
 
 
 def script_load(settings):
@@ -160,8 +168,8 @@ def script_load(settings):
     # 包载入判断
     if not ImportSuccess[0]:
         return
-    ObsScriptGlobalManager.Log_manager.log_info(f"{script_file_name} 加载成功")
-    obs.obs_frontend_add_event_callback(ObsScriptGlobalManager.trigger_front_event_manager.event_callback())
+    script_context.Log_manager.log_info(f"{script_file_name} 加载成功")
+    obs.obs_frontend_add_event_callback(script_context.trigger_front_event_manager.event_callback())
     pass
 
 
@@ -175,7 +183,8 @@ def script_update(settings):
     # 包载入判断
     if not ImportSuccess[0]:
         return
-    pass
+    # 用户修改了设置，UI 更新器中 settings 的影子值需要重新读取
+    script_context.ControlUiUpdaterManager.invalidate_settings_shadow()
 
 
 def script_properties():
@@ -183,26 +192,28 @@ def script_properties():
     # 包载入判断
     if not ImportSuccess[0]:
         return None
-    ObsScriptGlobalManager.Log_manager.log_info(f"生成控件")
+    script_context.Log_manager.log_info(f"生成控件")
+    # 属性对象将被重建，UI 更新器的影子副本全部失效
+    script_context.ControlUiUpdaterManager.invalidate_shadow()
 
-    for props_name in ObsScriptGlobalManager.control_manager.available_group_props_names:
-        ObsScriptGlobalManager.Log_manager.log_info(f"构建属性集: {props_name}")
-        ObsScriptGlobalData.props_dict[props_name] = obs.obs_properties_create()
+    for props_name in script_context.control_manager.available_group_props_names:
+        script_context.Log_manager.log_info(f"构建属性集: {props_name}")
+        script_context.props_dict[props_name] = obs.obs_properties_create()
 
-    sorted_widgets = ObsScriptGlobalManager.control_manager.get_widgets_by_load_order()
+    sorted_widgets = script_context.control_manager.get_widgets_by_load_order()
     for w in sorted_widgets:
-        w.props = ObsScriptGlobalData.props_dict[w.props_name]
+        w.props = script_context.props_dict[w.props_name]
         if hasattr(w, "group_props_name"):
-            w.group_props = ObsScriptGlobalData.props_dict[w.group_props_name]
+            w.group_props = script_context.props_dict[w.group_props_name]
 
         # 获取按载入次序排序的所有控件列表
         if w.widget_category == WidgetCategory.CHECKBOX:
             # 添加复选框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"复选框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"复选框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_bool(w.props, w.control_name, w.description)
         elif w.widget_category == WidgetCategory.DIGITALBOX:
             # 添加数字控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"数字框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"数字框控件: {w.control_name} 【{w.description}】")
             if w.widget_variant == DigitalBoxVariant.INT_SLIDER:
                 w.obj = obs.obs_properties_add_int_slider(
                     w.props, w.control_name, w.description, w.min_val, w.max_val, w.step
@@ -225,11 +236,11 @@ def script_properties():
                 obs.obs_property_float_set_suffix(w.obj, w.suffix)
         elif w.widget_category == WidgetCategory.TEXTBOX:
             # 添加文本框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"文本框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"文本框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_text(w.props, w.control_name, w.description, w.widget_variant.value)
         elif w.widget_category == WidgetCategory.BUTTON:
             # 添加按钮控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"按钮控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"按钮控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_button(
                 w.props, w.control_name, w.description, w.click_callback
             )
@@ -238,44 +249,44 @@ def script_properties():
                 obs.obs_property_button_set_url(w.obj, w.url)
         elif w.widget_category == WidgetCategory.COMBOBOX:
             # 添加组合框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"组合框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"组合框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_list(
                 w.props, w.control_name, w.description, w.widget_variant.value, obs.OBS_COMBO_FORMAT_STRING
             )
         elif w.widget_category == WidgetCategory.PATHBOX:
             # 添加路径对话框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"路径对话框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"路径对话框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_path(
                 w.props, w.control_name, w.description, w.widget_variant.value, w.filter_str, w.default_path
             )
         elif w.widget_category == WidgetCategory.COLORBOX:
             # 添加颜色对话框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"颜色对话框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"颜色对话框控件: {w.control_name} 【{w.description}】")
             if w.widget_variant == ColorBoxVariant.COLOR:
                 w.obj = obs.obs_properties_add_color(w.props, w.control_name, w.description)
             elif w.widget_variant == ColorBoxVariant.ALPHA:
                 w.obj = obs.obs_properties_add_color_alpha(w.props, w.control_name, w.description)
         elif w.widget_category == WidgetCategory.FONTBOX:
             # 添加字体对话框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"字体对话框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"字体对话框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_font(w.props, w.control_name, w.description)
         elif w.widget_category == WidgetCategory.LISTBOX:
             # 添加列表对话框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"列表对话框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"列表对话框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_editable_list(
                 w.props, w.control_name, w.description, w.widget_variant.value, w.filter_str, w.default_path
             )
         elif w.widget_category == WidgetCategory.GROUP:
             # 分组框控件
-            ObsScriptGlobalManager.Log_manager.log_info(f"分组框控件: {w.control_name} 【{w.description}】")
+            script_context.Log_manager.log_info(f"分组框控件: {w.control_name} 【{w.description}】")
             w.obj = obs.obs_properties_add_group(
                 w.props, w.control_name, w.description + f"{'[⏬]' if w.widget_variant == GroupVariant.CHECKABLE else ''}", w.widget_variant.value, w.group_props
             )
             if w.widget_variant == GroupVariant.CHECKABLE:  # 如果分组框的派生类型是复选分组框
                 # 添加复选框控件作为折叠分组框
-                ObsScriptGlobalManager.Log_manager.log_info(f"折叠分组框[复选框控件]: {w.control_name} 【{w.description}】")
+                script_context.Log_manager.log_info(f"折叠分组框[复选框控件]: {w.control_name} 【{w.description}】")
                 w.folding_control_obj = obs.obs_properties_add_bool(w.props, w.control_name.encode().hex(), w.description + "[⏫]")
-                widget_visibility_less_list = ObsScriptGlobalManager.sys_common_data_manager.get_data("system", "group_folded_props_names")
+                widget_visibility_less_list = script_context.sys_common_data_manager.get_data("system", "group_folded_props_names")
                 w.folding_visible = w.group_props_name not in widget_visibility_less_list
                 w.folding_enabled = w.group_props_name not in widget_visibility_less_list
                 w.checked = w.group_props_name not in widget_visibility_less_list
@@ -284,17 +295,17 @@ def script_properties():
             obs.obs_property_set_long_description(w.obj, w.long_description)
 
         if w.modified_callback_enabled:
-            ObsScriptGlobalManager.Log_manager.log_info(f"为{w.widget_category}: 【{w.description}】添加钩子函数")
+            script_context.Log_manager.log_info(f"为{w.widget_category}: 【{w.description}】添加钩子函数")
             obs.obs_property_set_modified_callback(w.obj, w.modified_callback)
             if w.widget_variant == GroupVariant.CHECKABLE:  # 如果分组框的派生类型是复选分组框
-                ObsScriptGlobalManager.Log_manager.log_info(f"为{w.widget_category}: 【{w.description}】添加钩子函数")
+                script_context.Log_manager.log_info(f"为{w.widget_category}: 【{w.description}】添加钩子函数")
                 obs.obs_property_set_modified_callback(w.folding_control_obj, w.modified_callback)
     # GlobalVariableOfData.props_dict = props_dict
     # 更新UI界面数据#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*#*
-    ObsScriptGlobalManager.ControlUiUpdaterManager.update(
-        update_widget_for_props_dict=ObsScriptGlobalManager.control_manager.get_props_mapping()
+    script_context.ControlUiUpdaterManager.queue_update(
+        update_widget_for_props_dict=script_context.control_manager.get_props_mapping()
     )
-    return ObsScriptGlobalData.props_dict[ObsScriptGlobalManager.control_manager.get_basic_group().group_props_name]
+    return script_context.props_dict[script_context.control_manager.get_basic_group().group_props_name]
 
     pass
 
@@ -323,8 +334,11 @@ def script_unload():
     # 包载入判断
     if not ImportSuccess[0]:
         return
-    ObsScriptGlobalManager.Log_manager.flush()
-    pass
+    script_context.Log_manager.flush()
+    # 关闭路径状态缓存的后台线程
+    script_context.ControlUiUpdaterManager.path_status_cache.shutdown()
+    # 释放本脚本的控件管理器，不影响同一解释器中的其他脚本
+    release_control_manager(script_file_path)
 
 
 
@@ -50,10 +50,16 @@ class BtnFunction(metaclass=AliasMeta):
         control_name = kwargs["control_name"]
         self.Log_manager.log_info(f"折叠分组框{control_name}")
 
-        update_widget_for_props_dict = self.control_manager.get_props_mapping()
-        self.control_ui_updater_manager.update(
-            update_widget_for_props_dict=update_widget_for_props_dict
-        )
+        widget = self.control_manager.get_widget_by_control_name(control_name)
+        # 按结构判断分组控件，不依赖插件与框架分别导入的枚举类是否为同一个
+        if widget is not None and hasattr(widget, "group_props_name"):
+            # 只刷新该分组子树中实际可见性发生变化的控件
+            self.control_ui_updater_manager.refresh_group_fold(widget)
+        else:
+            update_widget_for_props_dict = self.control_manager.get_props_mapping()
+            self.control_ui_updater_manager.update(
+                update_widget_for_props_dict=update_widget_for_props_dict
+            )
         return True
 
 
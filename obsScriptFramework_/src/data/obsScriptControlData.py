@@ -1,7 +1,8 @@
 """控件后台属性默认模版(定量)"""
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Literal, Any, Union, Optional, Callable, Dict, List
+from typing import Literal, Any, Union, Optional, Callable, Dict, List, Set, FrozenSet
 import obspython as obs
 
 
@@ -176,7 +177,46 @@ class PathBoxVariant(Enum):
 
 # 控件属性
 # ----------------------------------------------------------------------------------------------------------------
-@dataclass
+def slotted_dataclass(cls):
+    """
+    生成带 __slots__ 的 dataclass，控件实例不再携带 __dict__，降低大量控件时的内存占用。
+    Python 3.10 以下（较旧的 OBS 内嵌版本）不支持 slots 参数，由 _add_slots 手动生成。
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    return _add_slots(dataclass(cls))
+
+
+def _add_slots(cls):
+    """
+    以 dataclass 的字段为 __slots__ 重新创建类，与 Python 3.10 的 dataclass(slots=True) 做法一致。
+
+    父类已声明的槽不再重复声明；字段默认值已保存在生成的 __init__ 中，需从类字典中移除，
+    否则会与同名的槽描述符冲突。
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    inherited_slots = {slot for base in cls.__mro__[1:-1] for slot in getattr(base, "__slots__", ())}
+    cls_dict["__slots__"] = tuple(name for name in field_names if name not in inherited_slots)
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+_UNTRACKED_FIELDS: FrozenSet[str] = frozenset({
+    "props", "obj", "group_props", "folding_control_obj", "font_data",
+})
+"""不参与变更追踪的字段：OBS 运行时句柄"""
+
+_MISSING = object()
+"""字段尚未赋值的哨兵"""
+
+
+@slotted_dataclass
 class ControlBaseData:
     """
     所有控件的基类数据模型。
@@ -221,9 +261,37 @@ class ControlBaseData:
     """控件的可见状态。"""
     enabled: bool = True
     """控件的可用（是否灰显）状态。"""
+    _manager: Any = field(default=None, init=False, repr=False, compare=False)
+    """📵控件注册到的控件管理器，用于上报字段变更。"""
+    _dirty_fields: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
+    """📵自上次同步以来值发生变化的字段名集合。"""
+    _state_id: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    """📵控件在所属管理器可见/可用状态位图中的稠密编号。"""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """赋值时把值确实发生变化的字段上报给所属控件管理器，由管理器记录脏字段"""
+        # 私有字段与运行时句柄不追踪，未注册的控件没有管理器，均直接赋值
+        if name[0] == "_" or name in _UNTRACKED_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        manager = getattr(self, "_manager", None)
+        if manager is None:
+            object.__setattr__(self, name, value)
+            return
+        old_value = getattr(self, name, _MISSING)
+        object.__setattr__(self, name, value)
+        # 值未变化时不进入管理器
+        if old_value is not _MISSING and (old_value is value or old_value == value):
+            return
+        manager._on_widget_field_changed(self, name, old_value)
+
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """📵自上次同步以来值发生变化的字段名。"""
+        return frozenset(self._dirty_fields or ())
 
 
-@dataclass
+@slotted_dataclass
 class CheckBoxData(ControlBaseData):
     """复选框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.CHECKBOX
@@ -232,7 +300,7 @@ class CheckBoxData(ControlBaseData):
     """复选框的选中状态。"""
 
 
-@dataclass
+@slotted_dataclass
 class DigitalBoxData(ControlBaseData):
     """数字框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.DIGITALBOX
@@ -251,7 +319,7 @@ class DigitalBoxData(ControlBaseData):
     """调整时的步长。"""
 
 
-@dataclass
+@slotted_dataclass
 class TextBoxData(ControlBaseData):
     """文本框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.TEXTBOX
@@ -264,7 +332,7 @@ class TextBoxData(ControlBaseData):
     """文本框中的文字内容。"""
 
 
-@dataclass
+@slotted_dataclass
 class ButtonData(ControlBaseData):
     """按钮控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.BUTTON
@@ -277,7 +345,7 @@ class ButtonData(ControlBaseData):
     """📵🥚仅当 widget_variant 为 OBS_BUTTON_URL 时有效的跳转链接。"""
 
 
-@dataclass
+@slotted_dataclass
 class ComboBoxData(ControlBaseData):
     """组合框（下拉列表）控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.COMBOBOX
@@ -292,7 +360,7 @@ class ComboBoxData(ControlBaseData):
     """下拉框的选项列表，每个项是 {'label': '...', 'value': '...'}。"""
 
 
-@dataclass
+@slotted_dataclass
 class ListBoxData(ControlBaseData):
     """列表框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.LISTBOX
@@ -307,7 +375,7 @@ class ListBoxData(ControlBaseData):
     """表框中的项目列表，每个项目是字典格式。"""
 
 
-@dataclass
+@slotted_dataclass
 class GroupData(ControlBaseData):
     """分组框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.GROUP
@@ -328,7 +396,7 @@ class GroupData(ControlBaseData):
     """仅当 widget_variant 为 OBS_GROUP_CHECKABLE 时有效，表示分组是否被勾选。"""
 
 
-@dataclass
+@slotted_dataclass
 class ColorBoxData(ControlBaseData):
     """颜色选择框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.COLORBOX
@@ -366,7 +434,7 @@ class ColorBoxData(ControlBaseData):
             self.color_alpha = 0xFF  # 无 Alpha 控件时默认不透明
 
 
-@dataclass
+@slotted_dataclass
 class FontBoxData(ControlBaseData):
     """字体选择框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.FONTBOX
@@ -392,12 +460,12 @@ class FontBoxData(ControlBaseData):
 
     @property
     def font_flags(self):
-        """📵字体标志位"""
+        """📵字体标志位，与 OBS 一致：粗体 1、斜体 2、下划线 4、删除线 8"""
         font_bold = 1 if self.font_bold else 0
-        font_italic = 1 if self.font_italic else 0
-        font_underline = 1 if self.font_underline else 0
-        font_strikeout = 1 if self.font_strikeout else 0
-        return int(f"0b{font_bold}{font_italic}{font_underline}{font_strikeout}", 2)
+        font_italic = 2 if self.font_italic else 0
+        font_underline = 4 if self.font_underline else 0
+        font_strikeout = 8 if self.font_strikeout else 0
+        return font_bold | font_italic | font_underline | font_strikeout
 
     def set_from_font_flags(self, font_flags: int):
         """根据 font_flags 整数设置本控件的各字体标志位。"""
@@ -407,7 +475,7 @@ class FontBoxData(ControlBaseData):
         self.font_strikeout = bool(font_flags & 8)
 
 
-@dataclass
+@slotted_dataclass
 class PathBoxData(ControlBaseData):
     """路径选择框控件的专用数据模型。"""
     widget_category: WidgetCategory = WidgetCategory.PATHBOX
@@ -15,7 +15,10 @@ class ClassProperty:
 
 
 class ObsScriptGlobalData:
-    """脚本的全局数据变量"""
+    """
+    脚本的全局数据变量
+    类属性在同一解释器加载的所有脚本之间共享，每个脚本的运行数据保存在 ObsScriptContext 中
+    """
 
     BtnFunctions = None
     ControlDataSetFunctions = None
@@ -32,6 +35,10 @@ class ObsScriptGlobalData:
     """控件属性集的字典"""
     property_modified_callback_allow_execution: bool = True
     """属性修改回调执行许可"""
+    ui_deferred_sync_enabled: bool = False
+    """是否开启延后同步：大表单刷新时折叠分组中的控件在之后的同步中按时间预算分批补齐"""
+    ui_deferred_sync_budget_ms: float = 2.0
+    """延后同步时每轮同步用于补齐折叠分组控件的时间预算（毫秒）"""
 
     # 路径变量------------------------------------------------------------------------------------------------------
     __data_dir_path = Path(__file__).parent
@@ -96,7 +103,10 @@ class ObsScriptGlobalData:
 
 
 class ObsScriptGlobalManager:
-    """脚本的全局管理器变量"""
+    """
+    脚本的全局管理器变量
+    类属性在同一解释器加载的所有脚本之间共享，每个脚本的管理器保存在 ObsScriptContext 中
+    """
     Log_manager = None
     """日志管理器"""
     control_manager: Any = None
@@ -113,6 +123,105 @@ class ObsScriptGlobalManager:
     """"""
 
 
+class ObsScriptContext:
+    """
+    单个脚本实例的运行上下文
+
+    同一 OBS Python 解释器中加载的多个脚本导入的是同一个 src 包（sys.modules 中只有一份），
+    ObsScriptGlobalData、ObsScriptGlobalManager 的类属性因此在这些脚本之间共享。
+    每个脚本创建自己的上下文对象，脚本设置、属性集字典、各管理器以及数据文件路径都保存在实例上，
+    由脚本传给各框架组件，互不干扰。版本号、文件名等只读默认值仍取自 ObsScriptGlobalData。
+    """
+
+    def __init__(self, script_config_folder: Union[str, Path]):
+        """
+        :param script_config_folder: 脚本配置文件夹路径（~/[脚本名]_），数据文件路径均由此推导
+        """
+        self.script_config_folder = Path(script_config_folder)
+        """脚本配置文件夹路径"""
+
+        # 脚本数据------------------------------------------------------------------------------------------------
+        self.settings: Any = None
+        """脚本设置体"""
+        self.props_dict: dict[str, Any] = {}
+        """控件属性集的字典"""
+        self.control_property_table_dictionary: dict[str, Any] = {}
+        """控件属性表字典"""
+        self.BtnFunctions = None
+        """按钮回调函数类"""
+        self.ControlDataSetFunctions = None
+        """控件获取属性函数类"""
+        self.ui_deferred_sync_enabled: bool = ObsScriptGlobalData.ui_deferred_sync_enabled
+        """是否开启延后同步"""
+        self.ui_deferred_sync_budget_ms: float = ObsScriptGlobalData.ui_deferred_sync_budget_ms
+        """延后同步时每轮同步用于补齐折叠分组控件的时间预算（毫秒）"""
+
+        # 管理器--------------------------------------------------------------------------------------------------
+        self.Log_manager = None
+        """日志管理器"""
+        self.control_manager: Any = None
+        """控件管理器"""
+        self.control_parser_manager: Any = None
+        """控件属性文档转换器"""
+        self.trigger_front_event_manager = None
+        """前端事件触发管理器"""
+        self.button_function_manager = None
+        """按钮回调函数管理器"""
+        self.modified_function_manager = None
+        """控件变动回调函数管理器"""
+        self.sys_common_data_manager = None
+        """系统常用数据管理器"""
+        self.ControlUiUpdaterManager = None
+        """UI 更新器"""
+
+    # 路径变量------------------------------------------------------------------------------------------------------
+    @property
+    def control_system_properties_common_settings_filepath(self) -> str:
+        """
+        系统常用数据配置文件路径
+        ~/[脚本名]_/[系统常用数据配置文件名]
+        """
+        return str(self.script_config_folder / ObsScriptGlobalData.control_system_properties_common_settings_filename)
+
+    @property
+    def log_folder_path(self) -> str:
+        """
+        保存日志文件的文件夹路径
+        ~/[脚本名]_/[保存日志文件的文件夹名称]
+        """
+        return str(self.script_config_folder / ObsScriptGlobalData.log_folder_name)
+
+    @property
+    def control_data_csv_filepath(self) -> str:
+        """
+        控件数据的csv文件路径
+        ~/[脚本名]_/plugins/[控件数据的csv文件名]
+        """
+        return str(self.script_config_folder / "plugins" / ObsScriptGlobalData.control_data_csv_filename)
+
+    @property
+    def description(self) -> str:
+        """
+        脚本介绍文件内容
+        ~/[脚本名]_/plugins/[脚本介绍文件名称]
+        """
+        try:
+            with open(self.script_config_folder / "plugins" / ObsScriptGlobalData.description_filename,
+                      encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError as e:
+            return str(e)
+
+    @property
+    def control_attribute_definition_data_csv_filepath(self) -> str:
+        """
+        控件数据定义的csv文件路径
+        ~/[脚本名]_/src/data/[控件数据定义的csv文件名]
+        """
+        return str(self.script_config_folder / "src" / "data"
+                   / ObsScriptGlobalData.control_attribute_definition_data_csv_filename)
+
+
 if __name__ == "__main__":
     print(ObsScriptGlobalData.description_filename)
     print(ObsScriptGlobalData.description)
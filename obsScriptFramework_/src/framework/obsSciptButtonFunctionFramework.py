@@ -1,18 +1,22 @@
 """按钮单击函数框架"""
+from contextlib import nullcontext
 from typing import Callable, Any
 
 
 class ObsScriptButtonFunction:
 
-    def __init__(self, BtnFunctions, log):
+    def __init__(self, BtnFunctions, log, ui_updater=None):
         self.BtnFunctions = BtnFunctions
         self.log = log
+        # 可选的 UI 更新器，回调在其批处理作用域内执行，多次刷新请求合并为一次
+        self.ui_updater = ui_updater
 
     def select(self, button_name: str) -> Callable[[Any, Any], bool]:
         def build_bf(ps, p):
-            try:
-                getattr(self.BtnFunctions, button_name)(button_name)
-            except AttributeError:
-                self.log.log_error(f"未找到名为【{button_name}】的回调函数")
+            with self.ui_updater.batch() if self.ui_updater is not None else nullcontext():
+                try:
+                    getattr(self.BtnFunctions, button_name)(button_name)
+                except AttributeError:
+                    self.log.log_error(f"未找到名为【{button_name}】的回调函数")
             return True
         return build_bf
\ No newline at end of file
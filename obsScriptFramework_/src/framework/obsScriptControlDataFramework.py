@@ -1,6 +1,16 @@
 """控件管理框架"""
-from collections import OrderedDict as PyOrderedDict
-from typing import Set
+import copy
+import dataclasses
+import functools
+import os
+import sys
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict as PyOrderedDict
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Set, Iterable, Tuple, Mapping, FrozenSet, Collection, Sequence, ClassVar
 try:
     from ..data.obsScriptControlData import *
 except ImportError as e:
@@ -9,6 +19,758 @@ except ImportError as e:
     except ImportError as e:
         raise ImportError(e)
 
+# 共享控件模式
+# ----------------------------------------------------------------------------------------------------------------
+class _ControlSchema:
+    """
+    所有控件管理器共享的不可变控件模式数据。
+
+    包括分类到数据类的映射、各数据类的构造字段、分类到控件类型枚举的映射，
+    以及控件名称字符串的驻留。同一解释器中加载的多个脚本共用这一份数据，
+    每个 ControlManager 只保存自己的可变状态。
+    """
+
+    # 需要驻留的名称类字段
+    NAME_FIELDS: FrozenSet[str] = frozenset(("control_name", "object_name", "props_name", "group_props_name"))
+
+    def __init__(self):
+        """构建共享模式数据"""
+        self.widget_classes: Mapping[WidgetCategory, type] = MappingProxyType({
+            WidgetCategory.CHECKBOX: CheckBoxData,
+            WidgetCategory.DIGITALBOX: DigitalBoxData,
+            WidgetCategory.TEXTBOX: TextBoxData,
+            WidgetCategory.BUTTON: ButtonData,
+            WidgetCategory.COMBOBOX: ComboBoxData,
+            WidgetCategory.LISTBOX: ListBoxData,
+            WidgetCategory.GROUP: GroupData,
+            WidgetCategory.COLORBOX: ColorBoxData,
+            WidgetCategory.FONTBOX: FontBoxData,
+            WidgetCategory.PATHBOX: PathBoxData,
+        })
+        self.variant_enums: Mapping[WidgetCategory, type] = MappingProxyType({
+            WidgetCategory.CHECKBOX: CheckBoxVariant,
+            WidgetCategory.DIGITALBOX: DigitalBoxVariant,
+            WidgetCategory.TEXTBOX: TextBoxVariant,
+            WidgetCategory.BUTTON: ButtonVariant,
+            WidgetCategory.COMBOBOX: ComboBoxVariant,
+            WidgetCategory.LISTBOX: ListBoxVariant,
+            WidgetCategory.GROUP: GroupVariant,
+            WidgetCategory.COLORBOX: ColorBoxVariant,
+            WidgetCategory.FONTBOX: FontBoxVariant,
+            WidgetCategory.PATHBOX: PathBoxVariant,
+        })
+        # 分类枚举成员名（如 "CHECKBOX"）到分类的映射
+        self.categories_by_name: Mapping[str, WidgetCategory] = MappingProxyType(
+            {category.name: category for category in WidgetCategory}
+        )
+        # 各分类的控件类型名到枚举成员的映射
+        self.variants_by_name: Mapping[WidgetCategory, Mapping[str, Enum]] = MappingProxyType({
+            category: MappingProxyType({member.name: member for member in variant_enum})
+            for category, variant_enum in self.variant_enums.items()
+        })
+        # 各数据类可通过构造函数传入的字段名
+        self.init_fields: Mapping[type, FrozenSet[str]] = MappingProxyType({
+            widget_class: frozenset(f.name for f in dataclasses.fields(widget_class) if f.init)
+            for widget_class in self.widget_classes.values()
+        })
+
+    def get_widget_class(self, category: WidgetCategory) -> Optional[type]:
+        """
+        获取分类对应的数据类
+
+        参数:
+            category: 控件分类
+
+        返回:
+            对应的数据类，不支持的分类返回None
+        """
+        return self.widget_classes.get(category)
+
+    def resolve_variant(self, category: Union[WidgetCategory, str], variant_name: str) -> Optional[Enum]:
+        """
+        将控件类型名解析为对应分类的枚举成员
+
+        参数:
+            category: 控件分类或其枚举成员名（如 "CHECKBOX"）
+            variant_name: 控件类型名（如 "DEFAULT"）
+
+        返回:
+            控件类型枚举成员，名称无效时返回None
+        """
+        if isinstance(category, str):
+            category = self.categories_by_name.get(category)
+        return self.variants_by_name.get(category, {}).get(variant_name)
+
+    @staticmethod
+    def intern(value: Any) -> Any:
+        """驻留字符串，非字符串原样返回"""
+        return sys.intern(value) if type(value) is str else value
+
+    def intern_names(self, kwargs: Dict[str, Any]) -> None:
+        """
+        就地驻留控件构造参数中的名称类字段
+
+        参数:
+            kwargs: 控件构造参数
+        """
+        for name in self.NAME_FIELDS.intersection(kwargs):
+            kwargs[name] = self.intern(kwargs[name])
+
+
+CONTROL_SCHEMA = _ControlSchema()
+"""所有控件管理器共享的控件模式数据"""
+
+
+# 控件模板
+# ----------------------------------------------------------------------------------------------------------------
+_MUTABLE_FIELD_TYPES = (list, dict, set, bytearray)
+"""模板字段中需要为每个实例单独复制的可变值类型"""
+
+
+@dataclass(frozen=True)
+class ControlTemplateItem:
+    """
+    控件模板中的单个控件（享元）。
+
+    fields 中保存所有实例共享的属性（描述、控件类型、回调等），
+    由 ControlManager.instantiate() 批量生成的控件直接引用其中的不可变对象；
+    列表、字典、集合等可变值（如组合框的 items）为每个实例深拷贝一份，修改一个实例不会影响其他实例。
+    """
+    name: str
+    """控件在模板内的名称，实例的control_name为“前缀+序号_名称”"""
+    category: WidgetCategory
+    """控件分类"""
+    fields: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+    """所有实例共享的控件属性"""
+    props_name: Optional[str] = None
+    """
+    控件所属属性集：为None时使用 instantiate() 的 props_name 参数；
+    为模板内某个分组的group_props_name时，指向同一实例中的该分组
+    """
+
+    # 由模板统一生成、不允许在fields中指定的字段
+    RESERVED_FIELDS: ClassVar[FrozenSet[str]] = frozenset(
+        ("widget_category", "control_name", "object_name", "props_name", "load_order")
+    )
+
+    def __post_init__(self):
+        """校验字段并冻结共享属性"""
+        widget_class = CONTROL_SCHEMA.get_widget_class(self.category)
+        if widget_class is None:
+            raise ValueError(f"不支持的分类: {self.category}")
+        reserved = self.RESERVED_FIELDS.intersection(self.fields)
+        if reserved:
+            raise ValueError(f"控件模板 '{self.name}' 不能指定字段 {sorted(reserved)}")
+        unknown = set(self.fields) - CONTROL_SCHEMA.init_fields[widget_class]
+        if unknown:
+            raise ValueError(f"控件模板 '{self.name}' 的分类 {self.category.value} 不支持字段 {sorted(unknown)}")
+        if self.category == WidgetCategory.GROUP and not self.fields.get("group_props_name"):
+            raise ValueError(f"分组控件模板 '{self.name}' 必须指定 group_props_name")
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "fields", MappingProxyType(
+            {sys.intern(key): CONTROL_SCHEMA.intern(value) for key, value in self.fields.items()}
+        ))
+
+
+@dataclass(frozen=True)
+class ControlTemplate:
+    """
+    由多个控件组成、可重复实例化的控件模板。
+
+    例如“每个来源：启用复选框、透明度滑块、颜色”，通过 ControlManager.instantiate()
+    一次性批量注册任意数量的实例。
+    """
+    name: str
+    """模板名称"""
+    items: Tuple[ControlTemplateItem, ...]
+    """模板中的控件，按此顺序分配load_order"""
+
+    def __post_init__(self):
+        """校验模板内名称唯一"""
+        object.__setattr__(self, "items", tuple(self.items))
+        names = [item.name for item in self.items]
+        if len(set(names)) != len(names):
+            duplicates = [name for name, count in Counter(names).items() if count > 1]
+            raise ValueError(f"控件模板 '{self.name}' 中的控件名称 {duplicates} 重复")
+
+    @property
+    def local_props_names(self) -> FrozenSet[str]:
+        """模板内分组控件定义的group_props_name"""
+        return frozenset(item.fields["group_props_name"] for item in self.items
+                         if item.category == WidgetCategory.GROUP)
+
+
+# 控件索引结构
+# ----------------------------------------------------------------------------------------------------------------
+class _LoadOrderSequence:
+    """
+    按load_order升序维护的控件序列。
+
+    通过二分插入保持有序，避免每次查询都重新排序；
+    对外提供缓存的不可变元组与版本号，调用方可据版本号判断序列是否发生变化。
+    load_order相同的控件按加入先后排列。
+    """
+
+    def __init__(self):
+        """初始化有序序列"""
+        # 与_widgets一一对应的load_order键列表，用于二分查找
+        self._keys: List[int] = []
+        # 按load_order排序的控件列表
+        self._widgets: List[ControlBaseData] = []
+        # 每次序列变化时递增的版本号
+        self._version: int = 0
+        # 缓存的不可变快照，序列变化后置为None，下次读取时重建
+        self._cached: Optional[Tuple[ControlBaseData, ...]] = ()
+
+    def add(self, widget: ControlBaseData) -> None:
+        """
+        按load_order插入控件
+
+        参数:
+            widget: 控件数据对象
+        """
+        index = bisect_right(self._keys, widget.load_order)
+        self._keys.insert(index, widget.load_order)
+        self._widgets.insert(index, widget)
+        self._changed()
+
+    def add_many(self, widgets: Iterable[ControlBaseData]) -> None:
+        """
+        批量插入控件，整体只排序一次
+
+        参数:
+            widgets: 控件数据对象序列
+        """
+        new_widgets = sorted(widgets, key=lambda w: w.load_order)
+        if not new_widgets:
+            return
+        if not self._keys or new_widgets[0].load_order >= self._keys[-1]:
+            # 新控件全部位于末尾，直接追加
+            self._widgets.extend(new_widgets)
+        else:
+            # 稳定排序保证load_order相同时已有控件在前
+            self._widgets = sorted(self._widgets + new_widgets, key=lambda w: w.load_order)
+        self._keys = [w.load_order for w in self._widgets]
+        self._changed()
+
+    def remove(self, widget: ControlBaseData) -> bool:
+        """
+        移除控件
+
+        参数:
+            widget: 控件数据对象
+
+        返回:
+            控件存在并被移除时返回True
+        """
+        start = bisect_left(self._keys, widget.load_order)
+        end = bisect_right(self._keys, widget.load_order, lo=start)
+        for index in range(start, end):
+            if self._widgets[index] is widget:
+                break
+        else:
+            # load_order在登记后被改动时按对象查找，保证序列持有的控件总能被移除
+            index = next((i for i, w in enumerate(self._widgets) if w is widget), None)
+            if index is None:
+                return False
+        del self._keys[index]
+        del self._widgets[index]
+        self._changed()
+        return True
+
+    def clear(self) -> None:
+        """清空序列"""
+        self._keys.clear()
+        self._widgets.clear()
+        self._changed()
+
+    def _changed(self) -> None:
+        """标记序列已变化"""
+        self._version += 1
+        self._cached = None
+
+    @property
+    def version(self) -> int:
+        """序列版本号"""
+        return self._version
+
+    @property
+    def widgets(self) -> Tuple[ControlBaseData, ...]:
+        """按load_order排序的控件不可变快照"""
+        if self._cached is None:
+            self._cached = tuple(self._widgets)
+        return self._cached
+
+    def __len__(self) -> int:
+        """控件数量"""
+        return len(self._widgets)
+
+
+class _PropsTree:
+    """
+    属性集层级图。
+
+    以属性集名称（props_name / group_props_name）为节点，分组控件把自身的group_props_name
+    挂到其props_name之下。提供祖先、后代查询，并按需预计算每棵子树中控件的load_order范围。
+    """
+
+    def __init__(self):
+        """初始化属性集层级图"""
+        # 属性集到父属性集的映射，根属性集的父节点为None
+        self._parent: Dict[str, Optional[str]] = {}
+        # 属性集到直接子属性集列表的映射
+        self._children: Dict[str, List[str]] = {}
+        # 属性集到拥有它的分组控件的映射
+        self._group_by_props: Dict[str, GroupData] = {}
+        # 子树load_order范围缓存：属性集 -> (最小load_order, 最大load_order, 子树控件数)
+        self._ranges: Dict[str, Tuple[int, int, int]] = {}
+        # 范围缓存对应的load_order序列版本号
+        self._ranges_version: int = -1
+
+    def add_props(self, group: GroupData) -> None:
+        """
+        登记分组控件拥有的属性集
+
+        参数:
+            group: 分组控件数据对象
+        """
+        props_name = group.group_props_name
+        parent = group.props_name or None
+        self._parent[props_name] = parent
+        self._children.setdefault(props_name, [])
+        self._group_by_props[props_name] = group
+        if parent is not None:
+            self._children.setdefault(parent, []).append(props_name)
+        self._ranges_version = -1
+
+    def remove_props(self, props_name: str, keep_children: bool = False) -> None:
+        """
+        移除属性集节点与其父节点之间的连接
+
+        参数:
+            props_name: 属性集名称
+            keep_children: 为True时保留该节点及其子节点列表，仅断开与父节点的连接，
+                用于分组控件被替换或移动后重新挂接
+        """
+        parent = self._parent.get(props_name)
+        if parent is not None and props_name in self._children.get(parent, ()):
+            self._children[parent].remove(props_name)
+        if not keep_children:
+            self._parent.pop(props_name, None)
+            self._children.pop(props_name, None)
+            self._group_by_props.pop(props_name, None)
+        self._ranges_version = -1
+
+    def clear(self) -> None:
+        """清空层级图"""
+        self._parent.clear()
+        self._children.clear()
+        self._group_by_props.clear()
+        self._ranges.clear()
+        self._ranges_version = -1
+
+    def __contains__(self, props_name: str) -> bool:
+        """属性集是否已登记"""
+        return props_name in self._parent
+
+    def parent(self, props_name: str) -> Optional[str]:
+        """获取父属性集名称"""
+        return self._parent.get(props_name)
+
+    def group(self, props_name: str) -> Optional[GroupData]:
+        """获取拥有该属性集的分组控件"""
+        return self._group_by_props.get(props_name)
+
+    def children(self, props_name: str) -> List[str]:
+        """获取直接子属性集名称列表"""
+        return list(self._children.get(props_name, ()))
+
+    def ancestors(self, props_name: str) -> List[str]:
+        """获取所有祖先属性集名称（由近及远，不含自身），O(深度)"""
+        result = []
+        parent = self._parent.get(props_name)
+        while parent is not None:
+            result.append(parent)
+            parent = self._parent.get(parent)
+        return result
+
+    def descendants(self, props_name: str) -> List[str]:
+        """获取所有后代属性集名称（先序，不含自身），O(子树大小)"""
+        result = []
+        stack = list(reversed(self._children.get(props_name, ())))
+        while stack:
+            current = stack.pop()
+            result.append(current)
+            stack.extend(reversed(self._children.get(current, ())))
+        return result
+
+    def ranges(self, sequence: _LoadOrderSequence) -> Dict[str, Tuple[int, int, int]]:
+        """
+        获取每棵子树的load_order范围，序列或层级变化后重新计算
+
+        参数:
+            sequence: 控件的load_order有序序列
+
+        返回:
+            属性集 -> (最小load_order, 最大load_order, 子树控件数)
+        """
+        if self._ranges_version == sequence.version:
+            return self._ranges
+        ranges: Dict[str, Tuple[int, int, int]] = {}
+        parent_map = self._parent
+        for widget in sequence.widgets:
+            load_order = widget.load_order
+            props_name = widget.props_name
+            while props_name is not None:
+                current = ranges.get(props_name)
+                if current is None:
+                    ranges[props_name] = (load_order, load_order, 1)
+                else:
+                    ranges[props_name] = (min(current[0], load_order), max(current[1], load_order), current[2] + 1)
+                props_name = parent_map.get(props_name)
+        self._ranges = ranges
+        self._ranges_version = sequence.version
+        return ranges
+
+
+STATE_FLAG_FIELDS: Tuple[str, ...] = ("visible", "enabled", "folding_visible", "folding_enabled")
+"""以位图形式存储的控件状态字段"""
+
+_POSITION_FIELDS: FrozenSet[str] = frozenset({"load_order", "props_name"})
+"""决定控件在有序序列与属性集索引中位置的字段，直接赋值时重新登记控件"""
+
+
+class _WidgetStateStore:
+    """
+    控件可见/可用状态位图。
+
+    每个注册的控件分配一个稠密编号，visible、enabled、folding_visible、folding_enabled
+    分别保存在以编号为位索引的位图（bytearray，每字节8位）中。控件属性依然可直接读取，
+    位图随属性赋值同步更新，单个控件的置位与记录推送为O(1)；整棵子树的批量操作以及与上次推送状态的比较
+    先把位图转换为整数再按位运算。非分组控件没有折叠字段，其折叠位恒为1。
+    """
+
+    def __init__(self):
+        """初始化状态位图"""
+        # 各状态字段的当前位图
+        self._bits: Dict[str, bytearray] = {flag: bytearray() for flag in STATE_FLAG_FIELDS}
+        # 各状态字段最近一次推送到 OBS 时的位图
+        self._pushed: Dict[str, bytearray] = {flag: bytearray() for flag in STATE_FLAG_FIELDS}
+        # 编号到控件的映射，空位为None
+        self._widgets: List[Optional[ControlBaseData]] = []
+        # 可复用的空闲编号
+        self._free_ids: List[int] = []
+
+    def register(self, widget: ControlBaseData) -> int:
+        """
+        为控件分配编号并写入当前状态
+
+        参数:
+            widget: 控件数据对象
+
+        返回:
+            控件编号
+        """
+        if self._free_ids:
+            state_id = self._free_ids.pop()
+            self._widgets[state_id] = widget
+        else:
+            state_id = len(self._widgets)
+            self._widgets.append(widget)
+            if state_id & 7 == 0:
+                # 编号进入新的字节，所有位图扩展一个字节
+                for bitmap in (*self._bits.values(), *self._pushed.values()):
+                    bitmap.append(0)
+        widget._state_id = state_id
+        for flag in STATE_FLAG_FIELDS:
+            self.set(state_id, flag, getattr(widget, flag, True))
+        return state_id
+
+    def unregister(self, widget: ControlBaseData) -> None:
+        """
+        释放控件编号并清除其所有状态位
+
+        参数:
+            widget: 控件数据对象
+        """
+        state_id = widget._state_id
+        if state_id is None:
+            return
+        byte_index, clear_mask = state_id >> 3, ~(1 << (state_id & 7)) & 0xFF
+        for flag in STATE_FLAG_FIELDS:
+            self._bits[flag][byte_index] &= clear_mask
+            self._pushed[flag][byte_index] &= clear_mask
+        self._widgets[state_id] = None
+        self._free_ids.append(state_id)
+        widget._state_id = None
+
+    def clear(self) -> None:
+        """清空位图并释放所有编号"""
+        for widget in self._widgets:
+            if widget is not None:
+                widget._state_id = None
+        self._bits = {flag: bytearray() for flag in STATE_FLAG_FIELDS}
+        self._pushed = {flag: bytearray() for flag in STATE_FLAG_FIELDS}
+        self._widgets = []
+        self._free_ids = []
+
+    def set(self, state_id: int, flag: str, value: bool) -> None:
+        """设置单个控件的状态位"""
+        if value:
+            self._bits[flag][state_id >> 3] |= 1 << (state_id & 7)
+        else:
+            self._bits[flag][state_id >> 3] &= ~(1 << (state_id & 7)) & 0xFF
+
+    def bits(self, flag: str) -> int:
+        """获取状态字段的当前位图"""
+        return int.from_bytes(self._bits[flag], "little")
+
+    def mask_of(self, widgets: Iterable[ControlBaseData]) -> int:
+        """将控件集合转换为位掩码，先在字节数组中置位再一次性转换为整数，O(控件数 + 编号数/8)"""
+        registered = self._widgets
+        mask_bytes = bytearray((len(registered) + 7) >> 3)
+        for widget in widgets:
+            state_id = widget._state_id
+            if state_id is not None and state_id < len(registered) and registered[state_id] is widget:
+                mask_bytes[state_id >> 3] |= 1 << (state_id & 7)
+        return int.from_bytes(mask_bytes, "little")
+
+    def widgets_of(self, mask: int) -> List[ControlBaseData]:
+        """将位掩码转换为控件列表，O(置位数)"""
+        widgets = []
+        while mask:
+            lowest_bit = mask & -mask
+            widget = self._widgets[lowest_bit.bit_length() - 1]
+            if widget is not None:
+                widgets.append(widget)
+            mask ^= lowest_bit
+        return widgets
+
+    def diff_pushed(self, flag: str) -> int:
+        """获取状态字段自上次推送以来发生变化的位掩码"""
+        return int.from_bytes(self._bits[flag], "little") ^ int.from_bytes(self._pushed[flag], "little")
+
+    def mark_pushed(self, widgets: Optional[Iterable[ControlBaseData]] = None) -> None:
+        """
+        将当前状态记为已推送
+
+        参数:
+            widgets: 仅记录这些控件的状态，O(控件数)；为None时记录所有控件
+        """
+        if widgets is None:
+            for flag in STATE_FLAG_FIELDS:
+                self._pushed[flag][:] = self._bits[flag]
+            return
+        registered = self._widgets
+        bitmaps = [(self._bits[flag], self._pushed[flag]) for flag in STATE_FLAG_FIELDS]
+        for widget in widgets:
+            state_id = widget._state_id
+            if state_id is None or state_id >= len(registered) or registered[state_id] is not widget:
+                continue
+            byte_index, bit = state_id >> 3, 1 << (state_id & 7)
+            for bits, pushed in bitmaps:
+                pushed[byte_index] = (pushed[byte_index] & ~bit & 0xFF) | (bits[byte_index] & bit)
+
+
+_INDEX_FIELDS: FrozenSet[str] = frozenset({
+    "control_name", "object_name", "props_name", "group_props_name", "load_order",
+})
+"""参与管理器索引的控件字段，恢复快照时需要重新登记"""
+
+
+class ControlModelSnapshot:
+    """
+    控件模型快照。
+
+    创建快照时不复制任何控件，快照与当前模型共享全部控件对象；之后每个控件字段第一次被修改时
+    才把旧值记入快照（写时复制），控件的新增与移除也记入快照。因此创建快照为O(1)，
+    恢复快照的开销与快照之后发生变化的控件数量成正比，而与表单规模无关。
+    只记录值字段，OBS 运行时句柄（obj、props、group_props 等）不参与快照。
+    就地修改列表类字段（如 items.append）不会被记录，需整体赋值。
+    """
+
+    def __init__(self, manager: 'ControlManager'):
+        """
+        初始化快照
+
+        参数:
+            manager: 所属控件管理器
+        """
+        self._manager = manager
+        # id(控件) -> (控件, {字段名: 快照时的值})
+        self._saved: Dict[int, Tuple[ControlBaseData, Dict[str, Any]]] = {}
+        # 快照之后新注册的控件
+        self._added: Dict[int, ControlBaseData] = {}
+        # 快照之后被移除的、快照时已存在的控件
+        self._removed: Dict[int, ControlBaseData] = {}
+        # 快照时的load_order计数器
+        self._load_order_counter: int = manager._load_order_counter
+        # 快照是否仍然有效（管理器clear()后失效）
+        self._valid: bool = True
+
+    def _record_change(self, widget: ControlBaseData, field_name: str, old_value: Any) -> None:
+        """记录快照时已存在的控件的字段旧值，每个字段只记录第一次"""
+        key = id(widget)
+        if key in self._added:
+            return
+        entry = self._saved.get(key)
+        if entry is None:
+            self._saved[key] = (widget, {field_name: old_value})
+        elif field_name not in entry[1]:
+            entry[1][field_name] = old_value
+
+    def _record_added(self, widget: ControlBaseData) -> None:
+        """记录快照之后注册的控件"""
+        key = id(widget)
+        if self._removed.pop(key, None) is None:
+            self._added[key] = widget
+
+    def _record_removed(self, widget: ControlBaseData) -> None:
+        """记录快照之后移除的控件"""
+        key = id(widget)
+        if self._added.pop(key, None) is None:
+            self._removed[key] = widget
+
+    def _reset(self) -> None:
+        """以当前模型为基准清空变更记录"""
+        self._saved = {}
+        self._added = {}
+        self._removed = {}
+        self._load_order_counter = self._manager._load_order_counter
+
+    @property
+    def changed_widget_count(self) -> int:
+        """快照之后发生变化（修改、新增或移除）的控件数量"""
+        return len(self._saved.keys() | self._added.keys() | self._removed.keys())
+
+
+# 并发支持
+# ----------------------------------------------------------------------------------------------------------------
+class _ReadWriteLock:
+    """
+    可重入的读写锁，写者优先。
+
+    持有写锁的线程可以再次获取读锁或写锁；持有读锁的线程可以再次获取读锁，
+    但不能升级为写锁。
+    """
+
+    def __init__(self):
+        """初始化读写锁"""
+        self._condition = threading.Condition(threading.Lock())
+        # 当前持有读锁的线程数
+        self._readers = 0
+        # 当前持有写锁的线程标识及重入深度
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        # 正在等待写锁的线程数
+        self._waiting_writers = 0
+        # 每个线程的读锁重入记录，True表示该次获取计入了_readers
+        self._local = threading.local()
+
+    def _read_stack(self) -> List[bool]:
+        """获取当前线程的读锁重入记录"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def acquire_read(self) -> None:
+        """获取读锁"""
+        me = threading.get_ident()
+        stack = self._read_stack()
+        with self._condition:
+            if self._writer == me:
+                stack.append(False)
+                return
+            if not stack:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+            stack.append(True)
+
+    def release_read(self) -> None:
+        """释放读锁"""
+        counted = self._read_stack().pop()
+        if counted:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        获取写锁
+
+        异常:
+            RuntimeError: 如果当前线程持有读锁但未持有写锁
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if self._read_stack():
+                raise RuntimeError("不能从读锁升级为写锁")
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        """释放写锁"""
+        with self._condition:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """以读锁保护的上下文"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """以写锁保护的上下文"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def _reader(method):
+    """并发模式下以读锁保护的管理器方法"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        with lock.read_locked():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _writer(method):
+    """并发模式下以写锁保护的管理器方法"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        if lock is None:
+            return method(self, *args, **kwargs)
+        with lock.write_locked():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 # 控件管理
 # ----------------------------------------------------------------------------------------------------------------
 class ControlManager:
@@ -24,8 +786,23 @@ class ControlManager:
     6. 维护基础group控件和group_props_name约束
     """
 
-    def __init__(self):
-        """初始化控件管理器"""
+    def __init__(self, concurrent: bool = False):
+        """
+        初始化控件管理器
+
+        参数:
+            concurrent: 是否启用并发模式，见 enable_concurrent_mode()
+        """
+        # 并发模式的读写锁，为None时不做任何同步
+        self._lock: Optional[_ReadWriteLock] = None
+        # 并发模式下的主线程（OBS 线程）标识
+        self._owner_thread_id: Optional[int] = None
+        # 其他线程修改控件字段后排队等待主线程处理的变更：(控件id, 字段名) -> (控件, 字段名, 旧值)
+        # 同一控件同一字段的重复修改合并为一条并保留最早的旧值，队列长度不超过控件数×字段数
+        self._pending_changes: Dict[Tuple[int, str], Tuple[ControlBaseData, str, Any]] = {}
+        # 保护 _pending_changes 的互斥锁，后台线程入队与主线程取出整批变更时持有
+        self._pending_lock = threading.Lock()
+
         # 按分类存储控件的数据字典
         self._widgets_by_category: Dict[WidgetCategory, Dict[str, ControlBaseData]] = {
             category: PyOrderedDict() for category in WidgetCategory
@@ -34,17 +811,46 @@ class ControlManager:
         # 全局control_name集合，用于确保唯一性
         self._global_control_names: Set[str] = set()
 
+        # 全局control_name到控件的索引，与_global_control_names保持同步
+        self._widgets_by_control_name: Dict[str, ControlBaseData] = {}
+
         # 按分类的object_name集合，用于确保同一分类下唯一性
         self._object_names_by_category: Dict[WidgetCategory, Set[str]] = {
             category: set() for category in WidgetCategory
         }
 
+        # 按分类的object_name到控件的索引，用于分类管理器O(1)查找
+        self._widgets_by_object_name: Dict[WidgetCategory, Dict[str, ControlBaseData]] = {
+            category: {} for category in WidgetCategory
+        }
+
         # 按props_name分组的控件字典
         self._widgets_by_props: Dict[str, List[str]] = {}
 
+        # 按widget_variant的control_name二级索引，供组合条件查询
+        self._control_names_by_variant: Dict[Any, Set[str]] = {}
+
         # 存储所有group控件的group_props_name，用于唯一性检查
         self._group_props_names: Set[str] = set()
 
+        # 按load_order有序的控件序列
+        self._load_order_sequence = _LoadOrderSequence()
+
+        # 属性集层级图
+        self._props_tree = _PropsTree()
+
+        # 控件可见/可用状态位图
+        self._state_store = _WidgetStateStore()
+
+        # 仍在使用中的模型快照
+        self._live_snapshots: 'weakref.WeakSet[ControlModelSnapshot]' = weakref.WeakSet()
+
+        # 控件注册监听者（如 UIUpdater），控件注册、注销或派生类型变化时得到通知
+        self._registration_listeners: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+
+        # 脏控件登记表：control_name -> 控件，记录自上次同步以来字段发生变化的控件
+        self._dirty_widgets: Dict[str, ControlBaseData] = {}
+
         # 加载顺序计数器
         self._load_order_counter = 0
 
@@ -57,6 +863,79 @@ class ControlManager:
         # 创建基础group控件
         self._create_basic_group()
 
+        if concurrent:
+            self.enable_concurrent_mode()
+
+    def enable_concurrent_mode(self) -> None:
+        """
+        启用并发模式，允许后台线程（网络轮询、文件扫描等）与 OBS 线程同时访问控件模型
+
+        需在 OBS 线程中调用，调用线程被视为主线程。启用后：
+        1. 所有修改与遍历索引的方法都由读写锁保护；
+        2. 后台线程直接修改控件字段时，脏标记、快照记录与状态位图等登记工作排入队列，
+           由主线程在 apply_pending_changes()（UIUpdater 更新前会自动调用）中统一处理。
+        """
+        if self._lock is None:
+            self._lock = _ReadWriteLock()
+        self._owner_thread_id = threading.get_ident()
+
+    @property
+    def concurrent(self) -> bool:
+        """是否处于并发模式"""
+        return self._lock is not None
+
+    def add_registration_listener(self, listener: Any) -> None:
+        """
+        添加控件注册监听者
+
+        监听者需提供 on_widget_registered(widget) 与 on_widget_unregistered(widget) 方法：
+        控件注册（含移动、替换、恢复快照后的重新登记）以及直接修改widget_variant时调用前者，
+        控件从索引中移除时调用后者。监听者以弱引用保存，不延长其生命周期。
+
+        参数:
+            listener: 监听者对象
+        """
+        self._registration_listeners.add(listener)
+
+    def remove_registration_listener(self, listener: Any) -> None:
+        """
+        移除控件注册监听者
+
+        参数:
+            listener: 监听者对象
+        """
+        self._registration_listeners.discard(listener)
+
+    @property
+    def pending_change_count(self) -> int:
+        """后台线程排队等待主线程处理的字段变更数量"""
+        return len(self._pending_changes)
+
+    def apply_pending_changes(self) -> int:
+        """
+        在主线程中处理后台线程排队的字段变更
+
+        返回:
+            处理的变更数量
+        """
+        if not self._pending_changes:
+            return 0
+        with self._lock.write_locked():
+            return self._drain_pending_changes()
+
+    def _drain_pending_changes(self) -> int:
+        """
+        处理排队的字段变更，调用方需持有写锁
+
+        只处理调用时已入队的一批变更：在互斥锁内换入空队列后再逐条处理，
+        后台线程持续写入时不会使主线程无限循环，新入队的变更留待下一次处理。
+        """
+        with self._pending_lock:
+            pending, self._pending_changes = self._pending_changes, {}
+        for widget, field_name, old_value in pending.values():
+            self._apply_field_change(widget, field_name, old_value)
+        return len(pending)
+
     def _setup_category_properties(self):
         """为每个控件分类设置动态属性"""
         for category in WidgetCategory:
@@ -88,6 +967,9 @@ class ControlManager:
         # 将基础group的group_props_name添加到集合中，这样其他控件可以使用"props"
         self._group_props_names.add(basic_group.group_props_name)
 
+        # 基础group的属性集作为层级图的根节点
+        self._props_tree.add_props(basic_group)
+
         # 注意：不添加到 _widgets_by_category, _widgets_by_props 等常规映射中
         # 这样它就完全独立于常规控件管理系统
 
@@ -159,24 +1041,45 @@ class ControlManager:
                 f"必须来自某个group控件的group_props_name"
             )
 
-    def _add_control_to_maps(self, widget: ControlBaseData) -> None:
+    def _add_control_to_maps(self, widget: ControlBaseData, add_to_sequence: bool = True) -> None:
         """
         将控件添加到各种映射中
 
         参数:
             widget: 控件数据对象
+            add_to_sequence: 是否同时插入load_order有序序列，批量注册时由调用方统一插入
         """
         category = widget.widget_category
 
+        # 绑定到本管理器以追踪字段变更
+        widget._manager = self
+        if widget._dirty_fields is None:
+            widget._dirty_fields = set()
+        elif widget._dirty_fields:
+            self._dirty_widgets[widget.control_name] = widget
+        if widget._state_id is None:
+            self._state_store.register(widget)
+
         # 添加到分类字典
         self._widgets_by_category[category][widget.control_name] = widget
 
         # 添加到全局control_name集合
         self._global_control_names.add(widget.control_name)
+        self._widgets_by_control_name[widget.control_name] = widget
 
         # 添加到分类object_name集合
         self._object_names_by_category[category].add(widget.object_name)
 
+        # 添加到分类object_name索引
+        self._widgets_by_object_name[category][widget.object_name] = widget
+
+        # 添加到widget_variant索引
+        self._control_names_by_variant.setdefault(widget.widget_variant, set()).add(widget.control_name)
+
+        # 添加到load_order有序序列
+        if add_to_sequence:
+            self._load_order_sequence.add(widget)
+
         # 添加到props_name分组字典
         props_name = widget.props_name
         if props_name not in self._widgets_by_props:
@@ -187,10 +1090,63 @@ class ControlManager:
         if category == WidgetCategory.GROUP and hasattr(widget, 'group_props_name'):
             group_props_name = widget.group_props_name
             self._group_props_names.add(group_props_name)
+            self._props_tree.add_props(widget)
 
             if group_props_name not in self._widgets_by_props:
                 self._widgets_by_props[group_props_name] = []
 
+        if self._registration_listeners:
+            for listener in self._registration_listeners:
+                listener.on_widget_registered(widget)
+
+    def _remove_control_from_maps(self, widget: ControlBaseData, keep_group_props: bool = False) -> None:
+        """
+        将控件从各种映射中移除
+
+        参数:
+            widget: 控件数据对象
+            keep_group_props: 为True时保留分组控件的group_props_name及其下属控件列表，
+                用于分组控件被替换或移动后重新登记
+        """
+        category = widget.widget_category
+
+        # 从分类字典、名称集合与索引中移除
+        self._widgets_by_category[category].pop(widget.control_name, None)
+        self._global_control_names.discard(widget.control_name)
+        self._widgets_by_control_name.pop(widget.control_name, None)
+        self._object_names_by_category[category].discard(widget.object_name)
+        self._widgets_by_object_name[category].pop(widget.object_name, None)
+
+        # 从widget_variant索引中移除
+        variant_names = self._control_names_by_variant.get(widget.widget_variant)
+        if variant_names is not None:
+            variant_names.discard(widget.control_name)
+            if not variant_names:
+                del self._control_names_by_variant[widget.widget_variant]
+
+        # 从load_order有序序列中移除
+        self._load_order_sequence.remove(widget)
+
+        # 从脏控件登记表中移除（控件自身的脏字段保留，重新登记时恢复）
+        self._dirty_widgets.pop(widget.control_name, None)
+
+        # 从props_name分组字典中移除
+        control_names = self._widgets_by_props.get(widget.props_name)
+        if control_names and widget.control_name in control_names:
+            control_names.remove(widget.control_name)
+
+        # 如果是Group，还需要处理group_props_name
+        if category == WidgetCategory.GROUP and hasattr(widget, 'group_props_name'):
+            group_props_name = widget.group_props_name
+            self._props_tree.remove_props(group_props_name, keep_children=keep_group_props)
+            if not keep_group_props:
+                self._group_props_names.discard(group_props_name)
+                self._widgets_by_props.pop(group_props_name, None)
+
+        if self._registration_listeners:
+            for listener in self._registration_listeners:
+                listener.on_widget_unregistered(widget)
+
     def _get_widget_class(self, category: WidgetCategory, **kwargs) -> type:
         """
         根据分类获取对应的数据类
@@ -202,21 +1158,9 @@ class ControlManager:
         返回:
             对应的数据类
         """
-        widget_classes = {
-            WidgetCategory.CHECKBOX: CheckBoxData,
-            WidgetCategory.DIGITALBOX: DigitalBoxData,
-            WidgetCategory.TEXTBOX: TextBoxData,
-            WidgetCategory.BUTTON: ButtonData,
-            WidgetCategory.COMBOBOX: ComboBoxData,
-            WidgetCategory.LISTBOX: ListBoxData,
-            WidgetCategory.GROUP: GroupData,
-            WidgetCategory.COLORBOX: ColorBoxData,
-            WidgetCategory.FONTBOX: FontBoxData,
-            WidgetCategory.PATHBOX: PathBoxData,
-        }
-
-        return widget_classes.get(category)
+        return CONTROL_SCHEMA.get_widget_class(category)
 
+    @_writer
     def create_widget(self, category: WidgetCategory, control_name: str, object_name: Optional[str] = None,
                       **kwargs) -> ControlBaseData:
         """
@@ -252,6 +1196,7 @@ class ControlManager:
         # 设置control_name和object_name
         kwargs['control_name'] = control_name
         kwargs['object_name'] = object_name
+        CONTROL_SCHEMA.intern_names(kwargs)
 
         # 设置load_order
         if 'load_order' not in kwargs:
@@ -269,32 +1214,908 @@ class ControlManager:
 
         # 添加到各种映射中
         self._add_control_to_maps(widget)
+        if self._live_snapshots:
+            for snapshot in self._live_snapshots:
+                snapshot._record_added(widget)
 
         return widget
 
-    def get_widgets_by_load_order(self) -> List[ControlBaseData]:
+    @_writer
+    def instantiate(self, template: ControlTemplate, prefix: str, count: int, props_name: str = "props",
+                    instance_values: Optional[Sequence[Mapping[str, Mapping[str, Any]]]] = None
+                    ) -> List[Dict[str, ControlBaseData]]:
         """
-        获取按load_order排序的控件列表（不包含基础group控件）
+        按控件模板批量生成并注册控件实例
 
-        返回:
-            按load_order升序排列的控件列表
-        """
-        all_widgets = []
-        for category_dict in self._widgets_by_category.values():
-            all_widgets.extend(category_dict.values())
+        第 i 个实例中模板控件 item 的 control_name 与 object_name 为 f"{prefix}{i}_{item.name}"，
+        模板内分组的 group_props_name 同样加上 f"{prefix}{i}_" 前缀，模板内控件对这些分组的
+        引用会指向同一实例中的分组。所有实例通过一次 create_widgets_bulk() 注册，任一失败则全部不注册。
 
-        # 按load_order排序
-        return sorted(all_widgets, key=lambda w: w.load_order)
+        参数:
+            template: 控件模板
+            prefix: 控件名称前缀
+            count: 实例数量
+            props_name: 模板中未指定属性集的控件所属的属性集
+            instance_values: 可选，每个实例的独有属性，第 i 项为 {模板控件名称: {字段: 值}}
 
-    def get_props_mapping(self) -> Dict[str, List[str]]:
-        """
+        返回:
+            按实例顺序排列的 {模板控件名称: 控件数据对象} 列表
+
+        异常:
+            ValueError: 如果实例数量或独有属性无效，或生成的控件违反唯一性约束
+        """
+        if count < 0:
+            raise ValueError(f"实例数量不能为负数: {count}")
+        if instance_values is not None and len(instance_values) != count:
+            raise ValueError(f"instance_values 的长度 {len(instance_values)} 与实例数量 {count} 不一致")
+
+        local_props_names = template.local_props_names
+        item_names = {item.name for item in template.items}
+        # 模板控件中的可变字段，每个实例各自深拷贝一份
+        mutable_fields = {
+            item.name: [key for key, value in item.fields.items() if isinstance(value, _MUTABLE_FIELD_TYPES)]
+            for item in template.items
+        }
+        specs = []
+        for index in range(count):
+            instance_prefix = f"{prefix}{index}_"
+            values = instance_values[index] if instance_values is not None else {}
+            unknown = set(values) - item_names
+            if unknown:
+                raise ValueError(f"instance_values[{index}] 中的控件 {sorted(unknown)} 不在模板 '{template.name}' 中")
+            for item in template.items:
+                control_name = instance_prefix + item.name
+                item_props_name = item.props_name
+                if item_props_name is None:
+                    item_props_name = props_name
+                elif item_props_name in local_props_names:
+                    item_props_name = instance_prefix + item_props_name
+                spec = dict(item.fields)
+                for key in mutable_fields[item.name]:
+                    spec[key] = copy.deepcopy(spec[key])
+                spec.update(values.get(item.name, ()))
+                if item.category == WidgetCategory.GROUP:
+                    spec["group_props_name"] = instance_prefix + item.fields["group_props_name"]
+                spec["category"] = item.category
+                spec["control_name"] = control_name
+                spec["object_name"] = control_name
+                spec["props_name"] = item_props_name
+                specs.append(spec)
+
+        widgets = self.create_widgets_bulk(specs)
+        items_count = len(template.items)
+        return [
+            {item.name: widget for item, widget in zip(template.items, widgets[start:start + items_count])}
+            for start in range(0, len(widgets), items_count)
+        ] if items_count else [{} for _ in range(count)]
+
+    @_writer
+    def create_widgets_bulk(self, specs: Iterable[Mapping[str, Any]]) -> List[ControlBaseData]:
+        """
+        批量创建控件实例
+
+        整批控件一次性完成校验：名称重复通过集合运算检测，分组的group_props_name
+        允许被同批中位于其前面的控件引用（前向引用）。所有控件构造成功后才统一写入索引，
+        任何校验失败都会抛出异常且不会注册任何控件。
+
+        参数:
+            specs: 控件描述序列，每项为包含 category、control_name、可选 object_name
+                以及其余控件属性的字典，与 create_widget 的参数一一对应
+
+        返回:
+            按specs顺序创建的控件数据对象列表
+
+        异常:
+            ValueError: 如果任一控件违反唯一性约束或其他验证失败
+        """
+        entries = []
+        for spec in specs:
+            kwargs = dict(spec)
+            category = kwargs.pop("category", None) or kwargs.get("widget_category")
+            control_name = kwargs.pop("control_name", None)
+            object_name = kwargs.pop("object_name", None)
+            if object_name is None:
+                object_name = control_name
+            widget_class = self._get_widget_class(category)
+            if widget_class is None:
+                raise ValueError(f"不支持的分类: {category}")
+            kwargs["widget_category"] = category
+            kwargs["control_name"] = control_name
+            kwargs["object_name"] = object_name
+            CONTROL_SCHEMA.intern_names(kwargs)
+            entries.append((widget_class, kwargs))
+
+        # 1. control_name 唯一性
+        control_names = [kwargs["control_name"] for _, kwargs in entries]
+        control_name_set = set(control_names)
+        if "group" in control_name_set:
+            raise ValueError(f"control_name 'group' 是保留名称，用于基础group控件")
+        if len(control_name_set) != len(control_names):
+            duplicates = [name for name, count in Counter(control_names).items() if count > 1]
+            raise ValueError(f"control_name {duplicates} 在本批控件中重复，必须是全局唯一的")
+        conflicts = control_name_set & self._global_control_names
+        if conflicts:
+            raise ValueError(f"control_name {sorted(conflicts)} 已存在，必须是全局唯一的")
+
+        # 2. object_name 在同一分类下唯一
+        object_names_by_category: Dict[WidgetCategory, List[str]] = {}
+        for _, kwargs in entries:
+            object_names_by_category.setdefault(kwargs["widget_category"], []).append(kwargs["object_name"])
+        for category, object_names in object_names_by_category.items():
+            object_name_set = set(object_names)
+            if len(object_name_set) != len(object_names):
+                duplicates = [name for name, count in Counter(object_names).items() if count > 1]
+                raise ValueError(f"object_name {duplicates} 在分类 {category.value} 的本批控件中重复")
+            conflicts = object_name_set & self._object_names_by_category[category]
+            if conflicts:
+                raise ValueError(f"object_name {sorted(conflicts)} 在分类 {category.value} 中已存在")
+
+        # 3. 分配load_order并构造控件，构造失败时不影响管理器状态
+        load_order_counter = self._load_order_counter
+        widgets = []
+        for widget_class, kwargs in entries:
+            if "load_order" not in kwargs:
+                kwargs["load_order"] = load_order_counter
+                load_order_counter += 1
+            widgets.append(widget_class(**kwargs))
+
+        # 4. group_props_name 约束
+        batch_groups = [w for w in widgets if isinstance(w, GroupData)]
+        batch_group_props_names = [w.group_props_name for w in batch_groups]
+        batch_group_props_name_set = set(batch_group_props_names)
+        if len(batch_group_props_name_set) != len(batch_group_props_names):
+            duplicates = [name for name, count in Counter(batch_group_props_names).items() if count > 1]
+            raise ValueError(f"group_props_name {duplicates} 在本批控件中重复，所有group控件的group_props_name不能重名")
+        conflicts = batch_group_props_name_set & self._group_props_names
+        if conflicts:
+            raise ValueError(f"group_props_name {sorted(conflicts)} 已存在，所有group控件的group_props_name不能重名")
+        for group in batch_groups:
+            if group.group_props_name == group.props_name:
+                raise ValueError(
+                    f"group控件 '{group.control_name}' 的 "
+                    f"group_props_name '{group.group_props_name}' 不能等于 props_name"
+                )
+
+        # 5. props_name 必须来自已注册或同批分组的group_props_name
+        available_props_names = self._group_props_names | batch_group_props_name_set
+        for widget in widgets:
+            if widget.props_name not in available_props_names:
+                raise ValueError(
+                    f"控件 '{widget.control_name}' 的 props_name '{widget.props_name}' "
+                    f"必须来自某个group控件的group_props_name"
+                )
+
+        # 6. 同批分组之间的前向引用必须最终挂接到已注册的属性集上，不能成环
+        parent_by_props = {group.group_props_name: group.props_name for group in batch_groups}
+        resolved: Set[str] = set()
+        for props_name in parent_by_props:
+            chain = []
+            current = props_name
+            while current in parent_by_props and current not in resolved:
+                if current in chain:
+                    raise ValueError(f"group_props_name {chain} 之间存在循环引用")
+                chain.append(current)
+                current = parent_by_props[current]
+            resolved.update(chain)
+
+        # 7. 统一写入索引
+        for widget in widgets:
+            self._add_control_to_maps(widget, add_to_sequence=False)
+        self._load_order_sequence.add_many(widgets)
+        self._load_order_counter = load_order_counter
+        if self._live_snapshots:
+            for snapshot in self._live_snapshots:
+                for widget in widgets:
+                    snapshot._record_added(widget)
+
+        return widgets
+
+    def _require_widget(self, control_name: str) -> ControlBaseData:
+        """
+        获取已注册的常规控件，不存在或为基础group控件时抛出异常
+
+        参数:
+            control_name: 控件的全局唯一标识名
+
+        返回:
+            控件数据对象
+
+        异常:
+            ValueError: 如果控件不存在或为基础group控件
+        """
+        if control_name == "group":
+            raise ValueError(f"control_name 'group' 是保留名称，基础group控件不能被修改")
+        widget = self._widgets_by_control_name.get(control_name)
+        if widget is None:
+            raise ValueError(f"control_name '{control_name}' 不存在")
+        return widget
+
+    def _validate_group_placement(self, widget: ControlBaseData, new_props_name: str) -> None:
+        """
+        验证分组控件放入new_props_name后不会出现在自身子树中
+
+        参数:
+            widget: 控件数据对象
+            new_props_name: 目标属性集名称
+
+        异常:
+            ValueError: 如果目标属性集位于该分组自身的子树中
+        """
+        if not isinstance(widget, GroupData):
+            return
+        own_props_names = {widget.group_props_name, *self._props_tree.descendants(widget.group_props_name)}
+        if new_props_name in own_props_names:
+            raise ValueError(
+                f"group控件 '{widget.control_name}' 不能放入自身或其子分组的属性集 '{new_props_name}' 中"
+            )
+
+    @_writer
+    def remove_widget(self, control_name: str) -> List[ControlBaseData]:
+        """
+        移除控件，移除分组控件时级联移除其属性集下的所有控件
+
+        参数:
+            control_name: 控件的全局唯一标识名
+
+        返回:
+            被移除的控件数据对象列表（子控件在前，分组控件在后）
+
+        异常:
+            ValueError: 如果控件不存在或为基础group控件
+        """
+        widget = self._require_widget(control_name)
+
+        removed = []
+        if isinstance(widget, GroupData):
+            for child_name in list(self._widgets_by_props.get(widget.group_props_name, ())):
+                if child_name in self._widgets_by_control_name:
+                    removed.extend(self.remove_widget(child_name))
+        self._remove_control_from_maps(widget)
+        self._state_store.unregister(widget)
+        widget._manager = None
+        if self._live_snapshots:
+            for snapshot in self._live_snapshots:
+                snapshot._record_removed(widget)
+        removed.append(widget)
+        return removed
+
+    @_writer
+    def replace_widget(self, control_name: str, /, **changes) -> ControlBaseData:
+        """
+        修改控件的属性，包括control_name、object_name、props_name等索引字段，并同步更新所有映射
+
+        控件对象保持不变（原地修改），外部持有的引用依然有效。
+        所有校验在修改前完成，校验失败时控件与映射均不发生变化。
+
+        参数:
+            control_name: 控件的全局唯一标识名
+            **changes: 需要修改的控件属性
+
+        返回:
+            修改后的控件数据对象
+
+        异常:
+            ValueError: 如果控件不存在，或修改后违反唯一性约束或其他验证失败
+        """
+        widget = self._require_widget(control_name)
+        if "widget_category" in changes and changes["widget_category"] is not widget.widget_category:
+            raise ValueError(f"控件 '{control_name}' 不能修改 widget_category，请移除后重新创建")
+
+        # 构造临时对象以校验字段名与构造参数
+        candidate = dataclasses.replace(widget, **changes)
+        category = widget.widget_category
+
+        # 验证名称唯一性（排除自身）
+        if candidate.control_name != widget.control_name:
+            if candidate.control_name == "group":
+                raise ValueError(f"control_name 'group' 是保留名称，用于基础group控件")
+            if candidate.control_name in self._global_control_names:
+                raise ValueError(f"control_name '{candidate.control_name}' 已存在，必须是全局唯一的")
+        if candidate.object_name != widget.object_name:
+            if candidate.object_name in self._object_names_by_category[category]:
+                raise ValueError(f"object_name '{candidate.object_name}' 在分类 {category.value} 中已存在")
+
+        # 验证props_name与分组约束
+        self._validate_props_name(candidate)
+        if isinstance(candidate, GroupData):
+            if candidate.group_props_name == candidate.props_name:
+                raise ValueError(
+                    f"group控件 '{candidate.control_name}' 的 "
+                    f"group_props_name '{candidate.group_props_name}' 不能等于 props_name"
+                )
+            if candidate.group_props_name != widget.group_props_name:
+                if candidate.group_props_name in self._group_props_names:
+                    raise ValueError(
+                        f"group_props_name '{candidate.group_props_name}' 已存在，"
+                        f"所有group控件的group_props_name不能重名"
+                    )
+                if self._widgets_by_props.get(widget.group_props_name):
+                    raise ValueError(
+                        f"group控件 '{control_name}' 的属性集 '{widget.group_props_name}' 下仍有控件，"
+                        f"不能修改 group_props_name"
+                    )
+            if candidate.props_name != widget.props_name:
+                self._validate_group_placement(widget, candidate.props_name)
+
+        # 重新登记
+        keep_group_props = isinstance(widget, GroupData) and candidate.group_props_name == widget.group_props_name
+        self._remove_control_from_maps(widget, keep_group_props=keep_group_props)
+        for name in changes:
+            setattr(widget, name, getattr(candidate, name))
+        self._add_control_to_maps(widget)
+        return widget
+
+    @_writer
+    def move_widget(self, control_name: str, new_props_name: str, new_load_order: Optional[int] = None) -> ControlBaseData:
+        """
+        将控件移动到另一个属性集，并可同时调整其load_order
+
+        分组控件连同其属性集下的所有控件一起移动。
+
+        参数:
+            control_name: 控件的全局唯一标识名
+            new_props_name: 目标属性集名称，必须来自某个group控件的group_props_name
+            new_load_order: 新的load_order，为None时保持不变
+
+        返回:
+            移动后的控件数据对象
+
+        异常:
+            ValueError: 如果控件不存在、目标属性集无效，或分组控件被移入自身子树
+        """
+        widget = self._require_widget(control_name)
+        if new_props_name not in self._group_props_names:
+            raise ValueError(
+                f"控件 '{control_name}' 的 props_name '{new_props_name}' "
+                f"必须来自某个group控件的group_props_name"
+            )
+        self._validate_group_placement(widget, new_props_name)
+
+        self._remove_control_from_maps(widget, keep_group_props=True)
+        widget.props_name = new_props_name
+        if new_load_order is not None:
+            widget.load_order = new_load_order
+        self._add_control_to_maps(widget)
+        return widget
+
+    def _on_widget_field_changed(self, widget: ControlBaseData, field_name: str, old_value: Any) -> None:
+        """
+        控件字段值变化时由控件回调
+
+        并发模式下，后台线程的变更排入队列由主线程处理，主线程的变更在写锁保护下立即处理。
+
+        参数:
+            widget: 控件数据对象
+            field_name: 发生变化的字段名
+            old_value: 变化前的值
+        """
+        lock = self._lock
+        if lock is None:
+            self._apply_field_change(widget, field_name, old_value)
+        elif threading.get_ident() != self._owner_thread_id:
+            with self._pending_lock:
+                # 已排队的变更保留最早的旧值，保证快照回到首次修改之前
+                self._pending_changes.setdefault((id(widget), field_name), (widget, field_name, old_value))
+        else:
+            with lock.write_locked():
+                # 先处理排队的变更，保证快照记录的是最早的旧值
+                self._drain_pending_changes()
+                self._apply_field_change(widget, field_name, old_value)
+
+    def _apply_field_change(self, widget: ControlBaseData, field_name: str, old_value: Any) -> None:
+        """
+        登记控件字段变更：脏字段、快照、状态位图与二级索引
+
+        参数:
+            widget: 控件数据对象
+            field_name: 发生变化的字段名
+            old_value: 变化前的值
+        """
+        if widget._manager is not self:
+            return
+        if field_name in _POSITION_FIELDS and self._widgets_by_control_name.get(widget.control_name) is widget:
+            # 直接修改位置字段时按move_widget的方式重新登记，保持有序序列与属性集索引正确
+            self._reposition_widget(widget, field_name, old_value)
+        widget._dirty_fields.add(field_name)
+
+        # 写时复制：把旧值记入仍在使用中的快照，没有快照时不遍历 WeakSet
+        if self._live_snapshots:
+            for snapshot in self._live_snapshots:
+                snapshot._record_change(widget, field_name, old_value)
+
+        # 同步状态位图
+        if field_name in STATE_FLAG_FIELDS and widget._state_id is not None:
+            self._state_store.set(widget._state_id, field_name, getattr(widget, field_name))
+
+        # 已登记为脏的控件无需再次登记
+        control_name = widget.control_name
+        if self._dirty_widgets.get(control_name) is widget and field_name != "widget_variant":
+            return
+
+        # 仅登记当前已注册的控件，替换/移动过程中的中间状态在重新登记时处理
+        if self._widgets_by_control_name.get(control_name) is widget:
+            self._dirty_widgets[control_name] = widget
+
+            # 直接修改widget_variant时同步二级索引
+            if field_name == "widget_variant":
+                old_names = self._control_names_by_variant.get(old_value)
+                if old_names is not None:
+                    old_names.discard(control_name)
+                    if not old_names:
+                        del self._control_names_by_variant[old_value]
+                self._control_names_by_variant.setdefault(widget.widget_variant, set()).add(control_name)
+                if self._registration_listeners:
+                    for listener in self._registration_listeners:
+                        listener.on_widget_registered(widget)
+
+    def _reposition_widget(self, widget: ControlBaseData, field_name: str, old_value: Any) -> None:
+        """
+        控件的load_order或props_name被直接赋值后，先以旧值移出各映射，再以新值重新登记
+
+        参数:
+            widget: 控件数据对象
+            field_name: 发生变化的位置字段名
+            old_value: 变化前的值
+
+        异常:
+            ValueError: 如果新的props_name无效或分组控件被移入自身子树，此时字段恢复为旧值
+        """
+        new_value = getattr(widget, field_name)
+        object.__setattr__(widget, field_name, old_value)
+        if field_name == "props_name":
+            if new_value not in self._group_props_names:
+                raise ValueError(
+                    f"控件 '{widget.control_name}' 的 props_name '{new_value}' "
+                    f"必须来自某个group控件的group_props_name"
+                )
+            self._validate_group_placement(widget, new_value)
+        self._remove_control_from_maps(widget, keep_group_props=True)
+        object.__setattr__(widget, field_name, new_value)
+        self._add_control_to_maps(widget)
+
+    @property
+    def has_dirty_widgets(self) -> bool:
+        """是否存在字段已变化但尚未同步的控件"""
+        return bool(self._dirty_widgets)
+
+    @_reader
+    def get_dirty_widgets(self) -> Dict[str, FrozenSet[str]]:
+        """
+        获取字段已变化但尚未同步的控件
+
+        返回:
+            control_name到变化字段名集合的映射
+        """
+        return {control_name: widget.dirty_fields for control_name, widget in self._dirty_widgets.items()}
+
+    @_writer
+    def pop_dirty(self) -> List[Tuple[ControlBaseData, Set[str]]]:
+        """
+        取出所有脏控件及其变化字段，并清除它们的脏标记
+
+        返回:
+            按load_order排序的(控件, 变化字段名集合)列表；字段集合直接移交给调用方，控件换用新的空集合
+        """
+        if self._pending_changes and threading.get_ident() == self._owner_thread_id:
+            self._drain_pending_changes()
+        dirty_widgets = sorted(self._dirty_widgets.values(), key=lambda w: w.load_order)
+        self._dirty_widgets = {}
+        result = []
+        for widget in dirty_widgets:
+            result.append((widget, widget._dirty_fields))
+            widget._dirty_fields = set()
+        return result
+
+    @_writer
+    def mark_dirty(self, widget: ControlBaseData, field_names: Iterable[str]) -> None:
+        """
+        把控件的字段重新登记为脏，供同步方保留暂时无法同步的变化（如控件尚未创建 OBS 属性对象）
+
+        参数:
+            widget: 控件数据对象，必须已注册到本管理器
+            field_names: 需要登记的字段名
+        """
+        if widget._manager is not self or self._widgets_by_control_name.get(widget.control_name) is not widget:
+            return
+        widget._dirty_fields.update(field_names)
+        self._dirty_widgets[widget.control_name] = widget
+
+    @_writer
+    def clear_dirty(self, control_name: Optional[str] = None) -> None:
+        """
+        清除脏标记
+
+        参数:
+            control_name: 需要清除的控件，为None时清除所有控件
+        """
+        if control_name is None:
+            for widget in self._dirty_widgets.values():
+                widget._dirty_fields.clear()
+            self._dirty_widgets = {}
+            return
+        widget = self._dirty_widgets.pop(control_name, None)
+        if widget is not None:
+            widget._dirty_fields.clear()
+
+    @_writer
+    def hydrate_from_settings(self, values: Mapping[str, Any]) -> List[ControlBaseData]:
+        """
+        用脚本设置中的当前值回填控件数据模型
+
+        values 通常由 json.loads(obs_data_get_json(settings)) 得到，键为control_name。
+        只修改值与设置不同的控件；回填的字段视为已与界面一致，不会留下脏标记（控件原有的脏字段保留）。
+        按钮与分组框不回填。
+
+        参数:
+            values: control_name到设置值的映射
+
+        返回:
+            发生变化的控件列表
+        """
+        hydrated = []
+        for control_name, value in values.items():
+            widget = self._widgets_by_control_name.get(control_name)
+            if widget is None:
+                continue
+            dirty_before = set(widget._dirty_fields)
+            if not self._hydrate_widget(widget, value):
+                continue
+            hydrated.append(widget)
+            # 回填的字段已与设置一致，只保留回填前就存在的脏字段
+            widget._dirty_fields.intersection_update(dirty_before)
+            if not widget._dirty_fields:
+                self._dirty_widgets.pop(widget.control_name, None)
+        return hydrated
+
+    @staticmethod
+    def _hydrate_widget(widget: ControlBaseData, value: Any) -> bool:
+        """
+        将单个设置值回填到控件
+
+        返回:
+            控件是否发生变化
+        """
+        def assign(field_name: str, new_value: Any) -> bool:
+            if getattr(widget, field_name) == new_value:
+                return False
+            setattr(widget, field_name, new_value)
+            return True
+
+        category = widget.widget_category
+        if category is WidgetCategory.CHECKBOX:
+            return isinstance(value, bool) and assign("checked", value)
+        if category is WidgetCategory.DIGITALBOX:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+            if widget.widget_variant in (DigitalBoxVariant.INT, DigitalBoxVariant.INT_SLIDER):
+                return assign("digital", int(value))
+            return assign("digital", float(value))
+        if category is WidgetCategory.TEXTBOX:
+            return isinstance(value, str) and assign("text", value)
+        if category is WidgetCategory.PATHBOX:
+            return isinstance(value, str) and assign("path_text", value)
+        if category is WidgetCategory.COMBOBOX:
+            if not isinstance(value, str):
+                return False
+            # 可编辑组合框的设置值为显示文本，不可编辑组合框为选项值；另一项按选项补齐
+            if widget.widget_variant is ComboBoxVariant.EDITABLE:
+                field_name, other_field, key, other_key = "label", "value", "label", "value"
+            else:
+                field_name, other_field, key, other_key = "value", "label", "value", "label"
+            changed = assign(field_name, value)
+            for item in widget.items if isinstance(widget.items, list) else ():
+                if item.get(key) == value:
+                    changed = assign(other_field, item.get(other_key)) or changed
+                    break
+            return changed
+        if category is WidgetCategory.COLORBOX:
+            if isinstance(value, bool) or not isinstance(value, int) or widget.color_value == value:
+                return False
+            widget.set_from_color_value(value)
+            return True
+        if category is WidgetCategory.FONTBOX:
+            if not isinstance(value, Mapping):
+                return False
+            changed = False
+            if isinstance(value.get("face"), str):
+                changed = assign("font_face", value["face"]) or changed
+            if isinstance(value.get("size"), int):
+                changed = assign("font_size", value["size"]) or changed
+            if isinstance(value.get("style"), str):
+                changed = assign("font_style", value["style"]) or changed
+            flags = value.get("flags")
+            if isinstance(flags, int) and flags != widget.font_flags:
+                widget.set_from_font_flags(flags)
+                changed = True
+            return changed
+        if category is WidgetCategory.LISTBOX:
+            if not isinstance(value, list):
+                return False
+            items = [
+                {"value": item.get("value", ""), "selected": bool(item.get("selected", False)),
+                 "hidden": bool(item.get("hidden", False))}
+                for item in value if isinstance(item, Mapping)
+            ]
+            return assign("items", items)
+        return False
+
+    @_reader
+    def query(self,
+              category: Optional[WidgetCategory] = None,
+              variant: Any = None,
+              props_name: Optional[str] = None,
+              visible: Optional[bool] = None,
+              within_group: Optional[str] = None) -> List[ControlBaseData]:
+        """
+        按组合条件查询控件，未指定（None）的条件不参与筛选
+
+        先从分类、类型、属性集、分组子树等索引中选出最小的候选集合，
+        再对候选控件逐个检查其余条件，开销与最小候选集合的大小成正比。
+
+        参数:
+            category: 控件分类
+            variant: 控件类型（widget_variant），如 DigitalBoxVariant.FLOAT_SLIDER
+            props_name: 控件直接所属的属性集名称
+            visible: 控件自身的可见状态
+            within_group: 分组控件的control_name，只返回位于该分组子树（含嵌套分组）中的控件
+
+        返回:
+            按load_order升序排列的控件列表
+        """
+        widgets_by_control_name = self._widgets_by_control_name
+
+        # 1. 收集各索引给出的候选集合
+        candidates: List[Collection[str]] = []
+        if category is not None:
+            candidates.append(self._widgets_by_category[category].keys())
+        if variant is not None:
+            candidates.append(self._control_names_by_variant.get(variant, ()))
+        if props_name is not None:
+            candidates.append(self._widgets_by_props.get(props_name, ()))
+        subtree_props_names: Optional[Set[str]] = None
+        if within_group is not None:
+            group = self.get_widget_by_control_name(within_group)
+            if not isinstance(group, GroupData):
+                return []
+            subtree_props_names = {group.group_props_name, *self._props_tree.descendants(group.group_props_name)}
+            candidates.append([w.control_name for w in self.get_subtree_widgets(group.group_props_name)])
+        if not candidates:
+            candidates.append(widgets_by_control_name.keys())
+
+        # 2. 从最小的候选集合出发逐个检查其余条件
+        candidates.sort(key=len)
+        result = []
+        for control_name in candidates[0]:
+            widget = widgets_by_control_name.get(control_name)
+            if widget is None:
+                continue
+            if category is not None and widget.widget_category is not category:
+                continue
+            if variant is not None and widget.widget_variant != variant:
+                continue
+            if props_name is not None and widget.props_name != props_name:
+                continue
+            if visible is not None and widget.visible != visible:
+                continue
+            if subtree_props_names is not None and widget.props_name not in subtree_props_names:
+                continue
+            result.append(widget)
+
+        result.sort(key=lambda w: w.load_order)
+        return result
+
+    @_writer
+    def snapshot(self) -> ControlModelSnapshot:
+        """
+        创建控件模型快照，O(1)
+
+        返回:
+            快照对象，可传给 restore() 恢复到创建时的状态；不再引用时自动停止记录
+        """
+        snapshot = ControlModelSnapshot(self)
+        self._live_snapshots.add(snapshot)
+        return snapshot
+
+    @_writer
+    def restore(self, snapshot: ControlModelSnapshot) -> int:
+        """
+        将控件模型恢复到快照创建时的状态，开销与快照之后发生变化的控件数量成正比
+
+        被恢复字段的控件会被标记为脏，之后调用 UIUpdater.flush_dirty() 即可把恢复后的值推送到界面。
+        恢复完成后快照依然有效，并以恢复后的状态作为新的基准。
+
+        参数:
+            snapshot: 由本管理器 snapshot() 创建的快照
+
+        返回:
+            恢复的控件数量
+
+        异常:
+            ValueError: 如果快照不属于本管理器或已因 clear() 失效
+        """
+        if snapshot._manager is not self or not snapshot._valid:
+            raise ValueError("快照不属于该控件管理器或已失效")
+
+        # 恢复期间不向自身记录变更，其余快照照常记录
+        self._live_snapshots.discard(snapshot)
+        try:
+            restored_count = snapshot.changed_widget_count
+            saved = snapshot._saved
+            registered = self._widgets_by_control_name
+
+            # 1. 需要重新登记的快照时已存在控件：被移除的以及索引字段发生变化的
+            reattach: Dict[int, ControlBaseData] = dict(snapshot._removed)
+            for key, (widget, fields) in saved.items():
+                if key not in reattach and not _INDEX_FIELDS.isdisjoint(fields):
+                    reattach[key] = widget
+
+            # 2. 移除快照之后新注册的控件
+            for widget in snapshot._added.values():
+                if registered.get(widget.control_name) is widget:
+                    self._remove_control_from_maps(widget)
+                    self._state_store.unregister(widget)
+                    widget._manager = None
+                    for other in self._live_snapshots:
+                        other._record_removed(widget)
+
+            # 3. 暂时撤下需要重新登记的控件
+            for widget in reattach.values():
+                if registered.get(widget.control_name) is widget:
+                    keep_group_props = (
+                        isinstance(widget, GroupData) and "group_props_name" not in saved.get(id(widget), (None, {}))[1]
+                    )
+                    self._remove_control_from_maps(widget, keep_group_props=keep_group_props)
+                else:
+                    widget._manager = self
+                    for other in self._live_snapshots:
+                        other._record_added(widget)
+
+            # 4. 写回字段旧值，经由赋值钩子更新脏标记与状态位图
+            for widget, fields in saved.values():
+                for field_name, old_value in fields.items():
+                    setattr(widget, field_name, old_value)
+
+            # 5. 重新登记
+            for widget in reattach.values():
+                self._add_control_to_maps(widget)
+
+            self._load_order_counter = snapshot._load_order_counter
+            snapshot._reset()
+        finally:
+            self._live_snapshots.add(snapshot)
+        return restored_count
+
+    @_writer
+    def set_state_for_widgets(self, flag: str, widgets: Iterable[ControlBaseData], value: bool) -> List[ControlBaseData]:
+        """
+        批量设置控件的状态字段，只有状态确实改变的控件会被赋值并标记为脏
+
+        参数:
+            flag: 状态字段名，取值见 STATE_FLAG_FIELDS
+            widgets: 控件集合
+            value: 目标状态
+
+        返回:
+            状态发生改变的控件列表
+        """
+        if flag not in STATE_FLAG_FIELDS:
+            raise ValueError(f"'{flag}' 不是状态字段，可选值为 {STATE_FLAG_FIELDS}")
+        store = self._state_store
+        mask = store.mask_of(widgets)
+        bits = store.bits(flag)
+        # 需要改变的位：目标为True时取当前为0的位，目标为False时取当前为1的位
+        changed_mask = (mask & ~bits) if value else (mask & bits)
+        changed = [w for w in store.widgets_of(changed_mask) if hasattr(w, flag)]
+        for widget in changed:
+            setattr(widget, flag, value)
+        return changed
+
+    @_writer
+    def hide_subtree(self, props_name: str) -> List[ControlBaseData]:
+        """
+        隐藏属性集子树（自身及所有嵌套属性集）中的所有控件
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            可见性发生改变的控件列表
+        """
+        return self.set_state_for_widgets("visible", self.get_subtree_widgets(props_name), False)
+
+    @_writer
+    def show_subtree(self, props_name: str) -> List[ControlBaseData]:
+        """
+        显示属性集子树（自身及所有嵌套属性集）中的所有控件
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            可见性发生改变的控件列表
+        """
+        return self.set_state_for_widgets("visible", self.get_subtree_widgets(props_name), True)
+
+    @_writer
+    def set_props_enabled(self, props_name: str, enabled: bool = True) -> List[ControlBaseData]:
+        """
+        设置属性集中所有直接所属控件的启用状态
+
+        参数:
+            props_name: 属性集名称
+            enabled: 目标启用状态
+
+        返回:
+            启用状态发生改变的控件列表
+        """
+        widgets = self.get_widgets_by_control_names(self._widgets_by_props.get(props_name, ()))
+        return self.set_state_for_widgets("enabled", widgets, enabled)
+
+    @_reader
+    def diff_state_against_pushed(self) -> Dict[str, List[ControlBaseData]]:
+        """
+        与最近一次推送到 OBS 的状态按位比较
+
+        返回:
+            状态字段名到状态已变化控件列表的映射，没有变化的字段不出现在结果中
+        """
+        result = {}
+        for flag in STATE_FLAG_FIELDS:
+            changed_mask = self._state_store.diff_pushed(flag)
+            if changed_mask:
+                result[flag] = self._state_store.widgets_of(changed_mask)
+        return result
+
+    @_writer
+    def mark_state_pushed(self, widgets: Optional[Iterable[ControlBaseData]] = None) -> None:
+        """
+        将控件的当前状态记为已推送到 OBS
+
+        参数:
+            widgets: 需要记录的控件，为None时记录所有控件
+        """
+        self._state_store.mark_pushed(widgets)
+
+    @_reader
+    def get_widgets_by_load_order(self) -> Tuple[ControlBaseData, ...]:
+        """
+        获取按load_order排序的控件序列（不包含基础group控件）
+
+        返回:
+            按load_order升序排列的控件不可变元组，控件未变化时返回同一缓存对象
+        """
+        return self._load_order_sequence.widgets
+
+    @_reader
+    def get_widgets_by_load_order_with_version(self) -> Tuple[Tuple[ControlBaseData, ...], int]:
+        """
+        获取按load_order排序的控件序列及其版本号
+
+        返回:
+            (控件不可变元组, 版本号)，版本号未变时调用方可跳过重复处理
+        """
+        sequence = self._load_order_sequence
+        return sequence.widgets, sequence.version
+
+    @property
+    def load_order_version(self) -> int:
+        """load_order有序序列的版本号，控件增删时递增"""
+        return self._load_order_sequence.version
+
+    @_reader
+    def get_props_mapping(self) -> Dict[str, List[str]]:
+        """
         获取props_name到控件control_name的映射字典（不包含基础group控件）
 
         返回:
             props_name到控件control_name列表的映射字典
         """
+        if self._lock is not None:
+            # 并发模式下返回列表副本，避免调用方遍历时被其他线程修改
+            return {props_name: list(control_names) for props_name, control_names in self._widgets_by_props.items()}
         return self._widgets_by_props.copy()
 
+    @_reader
     def get_widget_by_control_name(self, control_name: str) -> Optional[ControlBaseData]:
         """
         通过control_name查找控件
@@ -310,10 +2131,186 @@ class ControlManager:
             return self._basic_group
 
         # 在常规控件中查找
-        for category_dict in self._widgets_by_category.values():
-            if control_name in category_dict:
-                return category_dict[control_name]
-        return None
+        return self._widgets_by_control_name.get(control_name)
+
+    @_reader
+    def get_widgets_by_control_names(self, control_names: Iterable[str]) -> List[Optional[ControlBaseData]]:
+        """
+        批量通过control_name查找控件
+
+        参数:
+            control_names: 控件的全局唯一标识名序列
+
+        返回:
+            与control_names顺序一致的控件数据对象列表，不存在的控件对应None
+        """
+        widgets_by_control_name = self._widgets_by_control_name
+        basic_group = self._basic_group
+        return [
+            basic_group if control_name == "group" else widgets_by_control_name.get(control_name)
+            for control_name in control_names
+        ]
+
+    @_reader
+    def get_props_parent(self, props_name: str) -> Optional[str]:
+        """
+        获取属性集的父属性集名称
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            父属性集名称，根属性集或未知属性集返回None
+        """
+        return self._props_tree.parent(props_name)
+
+    @_reader
+    def get_group_by_props_name(self, props_name: str) -> Optional[GroupData]:
+        """
+        获取拥有该属性集的分组控件
+
+        参数:
+            props_name: 属性集名称（即分组控件的group_props_name）
+
+        返回:
+            分组控件数据对象，根属性集返回基础group控件，未知属性集返回None
+        """
+        return self._props_tree.group(props_name)
+
+    @_reader
+    def get_props_ancestors(self, props_name: str) -> List[str]:
+        """
+        获取属性集的所有祖先属性集，O(深度)
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            由近及远的祖先属性集名称列表（不含自身）
+        """
+        return self._props_tree.ancestors(props_name)
+
+    @_reader
+    def get_props_descendants(self, props_name: str) -> List[str]:
+        """
+        获取属性集下嵌套的所有属性集，O(子树大小)
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            先序排列的后代属性集名称列表（不含自身）
+        """
+        return self._props_tree.descendants(props_name)
+
+    @_reader
+    def get_subtree_load_order_range(self, props_name: str) -> Optional[Tuple[int, int]]:
+        """
+        获取属性集子树（自身及所有嵌套属性集）中控件的load_order范围
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            (最小load_order, 最大load_order)，子树中没有控件时返回None
+        """
+        subtree_range = self._props_tree.ranges(self._load_order_sequence).get(props_name)
+        if subtree_range is None:
+            return None
+        return subtree_range[0], subtree_range[1]
+
+    @_reader
+    def get_subtree_widgets(self, props_name: str) -> List[ControlBaseData]:
+        """
+        获取属性集子树（自身及所有嵌套属性集）中的所有控件，按load_order排序
+
+        子树控件在load_order上连续时直接切片有序序列，否则按层级收集后排序。
+
+        参数:
+            props_name: 属性集名称
+
+        返回:
+            按load_order升序排列的控件列表
+        """
+        sequence = self._load_order_sequence
+        subtree_range = self._props_tree.ranges(sequence).get(props_name)
+        if subtree_range is None:
+            return []
+        low, high, count = subtree_range
+        start = bisect_left(sequence._keys, low)
+        end = bisect_right(sequence._keys, high, lo=start)
+        if end - start == count:
+            return list(sequence.widgets[start:end])
+
+        # 子树与其他控件交错，按层级收集
+        widgets = []
+        for name in [props_name] + self._props_tree.descendants(props_name):
+            widgets.extend(self._widgets_by_control_name[control_name]
+                           for control_name in self._widgets_by_props.get(name, ()))
+        widgets.sort(key=lambda w: w.load_order)
+        return widgets
+
+    @_reader
+    def get_unfolded_subtree_widgets(self, props_name: str,
+                                     folded_props_names: Optional[Set[str]] = None) -> List[ControlBaseData]:
+        """
+        获取属性集子树中未被折叠分组遮挡的控件，按load_order排序，O(返回的控件数)
+
+        从props_name向下遍历，遇到处于折叠状态的嵌套分组时不再进入其属性集（该分组控件本身仍包含在结果中）。
+        分组展开时，这些控件的实际可见性随之改变，是需要刷新的最小集合。
+
+        参数:
+            props_name: 属性集名称（通常为分组控件的group_props_name）
+            folded_props_names: 已折叠分组的group_props_name集合；
+                为None时按可勾选分组控件的folding_visible判断
+
+        返回:
+            按load_order升序排列的控件列表
+        """
+        tree = self._props_tree
+        widgets = []
+        stack = [props_name]
+        while stack:
+            name = stack.pop()
+            widgets.extend(self._widgets_by_control_name[control_name]
+                           for control_name in self._widgets_by_props.get(name, ()))
+            for child in tree.children(name):
+                if folded_props_names is not None:
+                    folded = child in folded_props_names
+                else:
+                    group = tree.group(child)
+                    folded = (group is not None and group.widget_variant is GroupVariant.CHECKABLE
+                              and not group.folding_visible)
+                if not folded:
+                    stack.append(child)
+        widgets.sort(key=lambda w: w.load_order)
+        return widgets
+
+    @_reader
+    def is_any_ancestor_folded(self, props_name: str, folded_props_names: Optional[Set[str]] = None) -> bool:
+        """
+        判断属性集自身或其任一祖先属性集所属的分组是否处于折叠状态，O(深度)
+
+        参数:
+            props_name: 属性集名称（通常为控件的props_name）
+            folded_props_names: 已折叠分组的group_props_name集合；
+                为None时按可勾选分组控件的folding_visible判断
+
+        返回:
+            存在被折叠的分组时返回True
+        """
+        tree = self._props_tree
+        current = props_name
+        while current is not None:
+            if folded_props_names is not None:
+                if current in folded_props_names:
+                    return True
+            else:
+                group = tree.group(current)
+                if group is not None and group.widget_variant is GroupVariant.CHECKABLE and not group.folding_visible:
+                    return True
+            current = tree.parent(current)
+        return False
 
     def get_basic_group(self) -> GroupData:
         """
@@ -324,13 +2321,28 @@ class ControlManager:
         """
         return self._basic_group
 
+    @_writer
     def clear(self):
         """清除所有常规控件，但保留基础group控件"""
+        for widget in self._widgets_by_control_name.values():
+            widget._manager = None
+            for listener in self._registration_listeners:
+                listener.on_widget_unregistered(widget)
+        for snapshot in self._live_snapshots:
+            snapshot._valid = False
+        self._live_snapshots = weakref.WeakSet()
+        self._dirty_widgets = {}
+        self._state_store.clear()
         self._widgets_by_category = {category: PyOrderedDict() for category in WidgetCategory}
         self._global_control_names.clear()
+        self._widgets_by_control_name.clear()
         self._object_names_by_category = {category: set() for category in WidgetCategory}
+        self._widgets_by_object_name = {category: {} for category in WidgetCategory}
         self._widgets_by_props.clear()
+        self._control_names_by_variant.clear()
         self._group_props_names.clear()
+        self._load_order_sequence.clear()
+        self._props_tree.clear()
         self._load_order_counter = 0
 
         # 重新创建基础group控件
@@ -344,8 +2356,12 @@ class ControlManager:
     @property
     def available_group_props_names(self) -> Set[str]:
         """获取所有可用的group_props_name"""
-        return self._group_props_names.copy()
+        if self._lock is None:
+            return self._group_props_names.copy()
+        with self._lock.read_locked():
+            return self._group_props_names.copy()
 
+    @_reader
     def __str__(self) -> str:
         """字符串表示"""
         result = [f"ControlManager (共 {self.total_widgets} 个常规控件)"]
@@ -415,13 +2431,10 @@ class _CategoryManager:
         异常:
             AttributeError: 如果控件不存在
         """
-        # 从父管理器的分类字典中查找
-        widgets_dict = self._manager._widgets_by_category.get(self._category, {})
-
-        # 遍历查找object_name匹配的控件
-        for widget in widgets_dict.values():
-            if widget.object_name == object_name:
-                return widget
+        # 从父管理器的分类object_name索引中查找
+        widget = self._manager._widgets_by_object_name[self._category].get(object_name)
+        if widget is not None:
+            return widget
 
         # 如果找不到，抛出AttributeError
         raise AttributeError(f"分类 '{self._category.value}' 中没有名为 '{object_name}' 的控件")
@@ -432,13 +2445,20 @@ class _CategoryManager:
 
     def __contains__(self, object_name: str) -> bool:
         """检查object_name是否存在"""
+        return object_name in self._manager._widgets_by_object_name[self._category]
+
+    def _snapshot_dict(self) -> Dict[str, ControlBaseData]:
+        """获取该分类的控件字典，并发模式下返回读锁保护下的副本"""
         widgets_dict = self._manager._widgets_by_category.get(self._category, {})
-        return any(widget.object_name == object_name for widget in widgets_dict.values())
+        lock = self._manager._lock
+        if lock is None:
+            return widgets_dict
+        with lock.read_locked():
+            return dict(widgets_dict)
 
     def __iter__(self):
         """迭代该分类的所有控件"""
-        widgets_dict = self._manager._widgets_by_category.get(self._category, {})
-        return iter(widgets_dict.values())
+        return iter(self._snapshot_dict().values())
 
     def __len__(self) -> int:
         """获取该分类的控件数量"""
@@ -447,18 +2467,15 @@ class _CategoryManager:
 
     def keys(self):
         """获取所有控件的control_name"""
-        widgets_dict = self._manager._widgets_by_category.get(self._category, {})
-        return widgets_dict.keys()
+        return self._snapshot_dict().keys()
 
     def values(self):
         """获取所有控件对象"""
-        widgets_dict = self._manager._widgets_by_category.get(self._category, {})
-        return widgets_dict.values()
+        return self._snapshot_dict().values()
 
     def items(self):
         """获取(control_name, 控件对象)对"""
-        widgets_dict = self._manager._widgets_by_category.get(self._category, {})
-        return widgets_dict.items()
+        return self._snapshot_dict().items()
 
     def __str__(self) -> str:
         """字符串表示"""
@@ -466,22 +2483,58 @@ class _CategoryManager:
         return f"{self._category.value}管理器 (共 {count} 个控件)"
 
 
-# 单例控件管理器实例
+# 按脚本区分的控件管理器实例
 # ----------------------------------------------------------------------------------------------------------------
-_global_control_manager = None
+_control_managers: Dict[str, ControlManager] = {}
+_control_managers_lock = threading.Lock()
+
+
+def _control_manager_key(script_path: Optional[Union[str, os.PathLike]]) -> str:
+    """将脚本路径规范化为控件管理器的键，未指定路径时使用空字符串"""
+    if script_path is None:
+        return ""
+    return sys.intern(os.path.normcase(os.path.abspath(os.fspath(script_path))))
 
 
-def get_control_manager() -> ControlManager:
+def get_control_manager(script_path: Optional[Union[str, os.PathLike]] = None) -> ControlManager:
     """
-    获取全局控件管理器单例
+    获取脚本对应的控件管理器，不存在时创建
+
+    同一解释器中加载的多个脚本各自拥有独立的控件管理器，互不干扰；
+    控件模式数据（CONTROL_SCHEMA）在所有管理器之间共享。
+
+    参数:
+        script_path: 脚本文件路径，为None时返回默认的全局控件管理器
+
+    返回:
+        控件管理器实例
+    """
+    key = _control_manager_key(script_path)
+    manager = _control_managers.get(key)
+    if manager is None:
+        with _control_managers_lock:
+            manager = _control_managers.get(key)
+            if manager is None:
+                manager = _control_managers[key] = ControlManager()
+    return manager
+
+
+def release_control_manager(script_path: Optional[Union[str, os.PathLike]] = None) -> bool:
+    """
+    释放脚本对应的控件管理器，通常在 script_unload 中调用
+
+    参数:
+        script_path: 脚本文件路径，为None时释放默认的全局控件管理器
 
     返回:
-        全局控件管理器实例
+        是否存在并释放了控件管理器
     """
-    global _global_control_manager
-    if _global_control_manager is None:
-        _global_control_manager = ControlManager()
-    return _global_control_manager
+    with _control_managers_lock:
+        manager = _control_managers.pop(_control_manager_key(script_path), None)
+    if manager is None:
+        return False
+    manager.clear()
+    return True
 
 
 # 使用示例
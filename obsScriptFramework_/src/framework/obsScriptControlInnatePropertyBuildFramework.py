@@ -1,18 +1,7 @@
 """为控件管理器中添加控件及其天赋属性"""
 from ..data.obsScriptGlobalVariable import ObsScriptGlobalData
-from ..data.obsScriptControlData import (
-    WidgetCategory,
-    CheckBoxVariant,
-    DigitalBoxVariant,
-    TextBoxVariant,
-    ButtonVariant,
-    ComboBoxVariant,
-    PathBoxVariant,
-    ColorBoxVariant,
-    FontBoxVariant,
-    ListBoxVariant,
-    GroupVariant,
-)
+from ..data.obsScriptControlData import ButtonVariant
+from .obsScriptControlDataFramework import CONTROL_SCHEMA
 from typing import Any, Dict
 
 
@@ -53,11 +42,16 @@ def build_controls(
         )
 
     # ---------- 2. 构建 CSV 中定义的所有控件 ----------
+    # 先收集全部控件描述，再一次性批量注册到控件管理器
+    widget_specs = []
+    pending_object_names = set()
     for controls_data in control_property_table_dictionary["all_controls"]:
         control_manager_category = getattr(control_manager, controls_data["widget_category"].lower())
 
         if hasattr(control_manager_category, controls_data["object_name"]):
             continue
+        if (controls_data["widget_category"], controls_data["object_name"]) in pending_object_names:
+            continue
 
         # 合并所有属性：优先 properties，然后各个 group_properties（后面的覆盖前面的，但一般不会重名）
         all_props = {}
@@ -135,48 +129,29 @@ def build_controls(
                     widget.checked = group_props_name not in widget_visibility_less_list
                     if not widget.checked:
                         log_manager.log_info(f"折叠分组框{_control_name}")
-                        update_widget_for_props_dict = {widget.props_name: [_control_name]}
                     else:
                         log_manager.log_info(f"展开分组框{_control_name}")
-                        update_widget_for_props_dict = {
-                            widget.props_name: [_control_name],
-                            widget.group_props_name: control_manager.get_props_mapping().get(widget.group_props_name, [])
-                        }
-                    control_ui_updater_manager.update(update_widget_for_props_dict=update_widget_for_props_dict)
+                    # 只刷新实际可见性发生变化的控件（含嵌套分组）
+                    control_ui_updater_manager.refresh_group_fold(widget)
                     if _modified_callback_name:
                         modified_function_manager.property_modified(_control_name, _modified_callback_name)(ps, p, st)
                     return True
                 kwargs["modified_callback"] = group_folded_modified_callback
             else:
                 kwargs["modified_callback"] = modified_function_manager.property_modified(control_name, kwargs["modified_callback"])
+            # 用户修改控件值时，使 UI 更新器中该控件的 settings 影子值失效，并在批处理作用域内执行回调
+            kwargs["modified_callback"] = control_ui_updater_manager.wrap_modified_callback(
+                control_name, kwargs["modified_callback"]
+            )
 
         # 转换 widget_variant 字符串为对应的枚举值
         variant_str = kwargs.get("widget_variant")
         if variant_str:
-            category = controls_data["widget_category"]
-            try:
-                if category == "CHECKBOX":
-                    kwargs["widget_variant"] = getattr(CheckBoxVariant, variant_str)
-                elif category == "DIGITALBOX":
-                    kwargs["widget_variant"] = getattr(DigitalBoxVariant, variant_str)
-                elif category == "TEXTBOX":
-                    kwargs["widget_variant"] = getattr(TextBoxVariant, variant_str)
-                elif category == "BUTTON":
-                    kwargs["widget_variant"] = getattr(ButtonVariant, variant_str)
-                elif category == "COMBOBOX":
-                    kwargs["widget_variant"] = getattr(ComboBoxVariant, variant_str)
-                elif category == "PATHBOX":
-                    kwargs["widget_variant"] = getattr(PathBoxVariant, variant_str)
-                elif category == "COLORBOX":
-                    kwargs["widget_variant"] = getattr(ColorBoxVariant, variant_str)
-                elif category == "FONTBOX":
-                    kwargs["widget_variant"] = getattr(FontBoxVariant, variant_str)
-                elif category == "LISTBOX":
-                    kwargs["widget_variant"] = getattr(ListBoxVariant, variant_str)
-                elif category == "GROUP":
-                    kwargs["widget_variant"] = getattr(GroupVariant, variant_str)
-            except AttributeError:
+            widget_variant = CONTROL_SCHEMA.resolve_variant(controls_data["widget_category"], variant_str)
+            if widget_variant is None:
                 log_manager.log_error(f"为 {control_name} 添加 widget_variant 时出错，无效值：{variant_str}")
+            else:
+                kwargs["widget_variant"] = widget_variant
 
         # 添加控件到管理器
         # 避免重复传递 control_name 和 object_name
@@ -194,14 +169,20 @@ def build_controls(
         for key in unsupported_params:
             kwargs.pop(key, None)
 
-        control_manager_category.add(
-            control_name=control_name,
-            object_name=controls_data["object_name"],
+        pending_object_names.add((controls_data["widget_category"], controls_data["object_name"]))
+        widget_specs.append({
+            "category": CONTROL_SCHEMA.categories_by_name[controls_data["widget_category"]],
+            "control_name": control_name,
+            "object_name": controls_data["object_name"],
             **kwargs,
-        )
+        })
+
+    control_manager.create_widgets_bulk(widget_specs)
+    for widget_spec in widget_specs:
         pull_innate_attribute_data_log_of_control(
-            control_name=control_name,
-            attribute=str(kwargs)
+            control_name=widget_spec["control_name"],
+            attribute=str({key: value for key, value in widget_spec.items()
+                           if key not in ("category", "control_name", "object_name")})
         )
 
     # ---------- 3. 创建“禁止执行控件修改回调”按钮 ----------
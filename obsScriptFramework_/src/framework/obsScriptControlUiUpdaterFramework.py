@@ -1,9 +1,14 @@
-import os
+import functools
+import json
+import time
+from contextlib import contextmanager
+from difflib import SequenceMatcher
 
 import obspython as obs
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Callable, Dict, List, Optional, Literal, FrozenSet, AbstractSet, Iterable, Tuple
 
 from plugins.tool.parseColor import int_to_color_str
+from ..tool.PathStatusCache import PathStatusCache
 # 根据您的实际文件路径调整导入
 from ..data.obsScriptControlData import (
     WidgetCategory,
@@ -21,6 +26,46 @@ from ..data.obsScriptControlData import (
     TextBoxInfoVariant, ListBoxData, ColorBoxData, FontBoxData, ColorBoxVariant,
 )
 
+_STATE_FIELDS: FrozenSet[str] = frozenset({"visible", "enabled", "folding_visible", "folding_enabled"})
+"""只影响控件可见性与启用状态的字段"""
+
+_VALUE_SYNC_METHODS: Dict[WidgetCategory, Tuple[type, str]] = {
+    WidgetCategory.CHECKBOX: (CheckBoxData, "_update_checkbox"),
+    WidgetCategory.DIGITALBOX: (DigitalBoxData, "_update_digitalbox"),
+    WidgetCategory.TEXTBOX: (TextBoxData, "_update_textbox"),
+    WidgetCategory.COMBOBOX: (ComboBoxData, "_update_combobox"),
+    WidgetCategory.PATHBOX: (PathBoxData, "_update_pathbox"),
+    WidgetCategory.GROUP: (GroupData, "_update_group"),
+    WidgetCategory.COLORBOX: (ColorBoxData, "_update_colorbox"),
+    WidgetCategory.FONTBOX: (FontBoxData, "_update_fontbox"),
+    WidgetCategory.LISTBOX: (ListBoxData, "_update_listbox"),
+}
+"""控件分类到(数据类, 值同步方法名)的映射，按钮无需数据同步"""
+
+_DIGITALBOX_OPS: Dict[DigitalBoxVariant, Tuple[Any, ...]] = {
+    DigitalBoxVariant.INT: (obs.obs_property_int_min, obs.obs_property_int_max, obs.obs_property_int_step,
+                            obs.obs_property_int_set_limits, obs.obs_data_get_int, obs.obs_data_set_int, int),
+    DigitalBoxVariant.INT_SLIDER: (obs.obs_property_int_min, obs.obs_property_int_max, obs.obs_property_int_step,
+                                   obs.obs_property_int_set_limits, obs.obs_data_get_int, obs.obs_data_set_int, int),
+    DigitalBoxVariant.FLOAT: (obs.obs_property_float_min, obs.obs_property_float_max, obs.obs_property_float_step,
+                              obs.obs_property_float_set_limits, obs.obs_data_get_double, obs.obs_data_set_double,
+                              float),
+    DigitalBoxVariant.FLOAT_SLIDER: (obs.obs_property_float_min, obs.obs_property_float_max,
+                                     obs.obs_property_float_step, obs.obs_property_float_set_limits,
+                                     obs.obs_data_get_double, obs.obs_data_set_double, float),
+}
+"""数字框派生类型到 (读最小值, 读最大值, 读步长, 设置范围, 读值, 写值, 数值类型) 的映射，绑定时选定"""
+
+_COMBOBOX_TEXT: Dict[ComboBoxVariant, Tuple[int, str, Any]] = {
+    ComboBoxVariant.EDITABLE: (0, "label", obs.obs_property_list_item_name),
+    ComboBoxVariant.LIST: (1, "value", obs.obs_property_list_item_string),
+}
+"""组合框派生类型到 (选项元组中的下标, 控件字段名, 读取第一项的函数) 的映射，决定写入 settings 的显示文本"""
+
+
+def _noop() -> None:
+    """无需同步的控件使用的空操作"""
+
 
 class UIUpdater:
     """
@@ -29,11 +74,19 @@ class UIUpdater:
     该类封装了原有的 update_ui_interface_data 函数，将脚本设置存储作为依赖项，
     通过构造函数传入，避免直接引用全局变量，提高可测试性和模块化。
 
+    更新器为每个控件保存一份最近一次写入（或读取）到 OBS 的状态影子副本，比较时优先使用影子副本，
+    避免重复的 SWIG 调用。属性对象上的状态（范围、选项、可见性等）在属性对象重建时失效，
+    settings 中的值在设置代数变化时失效（script_update、控件修改回调或 invalidate_settings_shadow()）。
+
     Attributes:
         script_settings: OBS 数据对象 (obs_data_t)，用于读写控件值。
+        obs_calls_saved: 因命中影子副本而省去的 OBS 调用次数。
+        settings_generation: 设置代数，每次整体失效 settings 影子副本时递增。
+        stage_settings_writes: 是否把一轮同步中的值写入汇集到暂存 obs_data 后一次性应用，默认关闭。
     """
 
-    def __init__(self, script_settings: Any, control_manager: Any, Log_manager: Any) -> None:
+    def __init__(self, script_settings: Any, control_manager: Any, Log_manager: Any,
+                 path_status_cache: Optional[PathStatusCache] = None) -> None:
         """
         初始化 UIUpdater 实例。
 
@@ -41,132 +94,661 @@ class UIUpdater:
             control_manager: 包含控件列表和相关方法的对象，必须提供 get_widgets_by_load_order() 方法，
                     返回一个由控件数据对象（如 CheckBoxData、DigitalBoxData 等）组成的列表。
             script_settings: OBS 数据对象，通常为 GlobalVariableOfData.script_settings。
+            path_status_cache: 路径状态缓存，路径框的路径检查只读取该缓存，为 None 时自动创建。
         """
         self.script_settings = script_settings
         self.control_manager = control_manager
         self.Log_manager = Log_manager
+        self.path_status_cache = path_status_cache if path_status_cache is not None else PathStatusCache()
+        # 等待后台检查结果的路径：路径 -> 使用该路径的路径框控件名称集合
+        self._path_checks_pending: Dict[str, set] = {}
+        # 属性对象上的影子状态：control_name -> (属性对象, {键: 值})
+        self._property_shadow: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        # settings 中的影子值：control_name -> {键: 值}
+        self._settings_shadow: Dict[str, Dict[str, Any]] = {}
+        # 影子值所对应的 settings 对象
+        self._shadow_settings: Any = script_settings
+        self.settings_generation: int = 0
+        self.obs_calls_saved: int = 0
+        # 暂存写入：开启后同步期间的值写入先汇集到暂存 obs_data，结束时一次性 obs_data_apply 到 settings。
+        # 纯 Python 模拟中暂存只增加创建、应用与释放的开销，在 OBS 中确认收益之前默认直接写入 settings
+        self.stage_settings_writes: bool = False
+        self._staging_depth: int = 0
+        self._staged_settings: Any = None
+        # 本轮同步中已推送状态的控件，最外层暂存作用域结束时一次性记入状态位图
+        self._state_pushed_widgets: List[Any] = []
+        # 批处理作用域：作用域内的更新请求合并到 _batch_targets，最外层作用域结束时统一同步
+        self._batch_depth: int = 0
+        self._batch_targets: Dict[str, Any] = {}
+        # 延后同步：开启后折叠分组中的控件进入队列，每轮同步结束时在时间预算内分批补齐
+        self.deferred_sync_enabled: bool = False
+        self.deferred_budget_ms: float = 2.0
+        # 延后同步队列：props_name -> {control_name: 控件对象}，按属性集分桶，桶内按载入次序排列
+        self._deferred_by_props: Dict[str, Dict[str, Any]] = {}
+        # 队列中的控件所在的桶：control_name -> props_name
+        self._deferred_widgets: Dict[str, str] = {}
+        self.last_drain_ms: float = 0.0
+        self.max_drain_ms: float = 0.0
+        self.last_drain_synced: int = 0
+        # 每个控件绑定的同步函数：control_name -> (控件对象, 状态同步函数, 值同步函数)
+        # 控件注册时绑定、移除时解绑，派生类型变化时由控件管理器通知重新绑定
+        self._sync_bindings: Dict[str, Tuple[Any, Callable[[], None], Callable[[], None]]] = {}
+        control_manager.add_registration_listener(self)
+        for w in control_manager.get_widgets_by_load_order():
+            self._bind_widget(w)
+
+    # ----------------------------------------------------------------------
+    # 影子副本
+    # ----------------------------------------------------------------------
+
+    def invalidate_shadow(self) -> None:
+        """使全部影子副本失效，下次同步时重新从 OBS 读取（如 script_properties 重建属性后）。"""
+        self._property_shadow.clear()
+        self.invalidate_settings_shadow()
+
+    def invalidate_settings_shadow(self, control_name: Optional[str] = None) -> None:
+        """
+        使 settings 影子值失效。
+
+        Args:
+            control_name: 用户修改了值的控件名称，为 None 时整体失效并递增设置代数（如 script_update）。
+        """
+        if control_name is None:
+            self._settings_shadow.clear()
+            self.settings_generation += 1
+        else:
+            self._settings_shadow.pop(control_name, None)
+
+    def wrap_modified_callback(self, control_name: str, callback: Callable[..., bool]) -> Callable[..., bool]:
+        """
+        包装控件修改回调：用户在界面上修改控件值时，先使该控件的 settings 影子值失效，
+        再在批处理作用域内执行原回调，回调中的多次刷新请求合并为一次同步。
+
+        Args:
+            control_name: 控件名称。
+            callback: 原修改回调，签名为 (props, prop, settings)。
+
+        Returns:
+            包装后的修改回调。
+        """
+        def shadow_invalidating_callback(ps, p, st=None):
+            self.invalidate_settings_shadow(control_name)
+            with self.batch():
+                return callback(ps, p, st)
+        return shadow_invalidating_callback
+
+    # ----------------------------------------------------------------------
+    # 从设置回填模型
+    # ----------------------------------------------------------------------
+
+    def read_back_settings(self) -> int:
+        """
+        把用户在界面上的当前值一次性回填到控件数据模型。
+
+        只调用一次 obs_data_get_json 并解析一次，由 control_manager.hydrate_from_settings() 回填
+        值与设置不同的控件（含字体标志位、颜色分量与列表项）；回填的字段不会被标记为脏。
+
+        Returns:
+            int: 被回填的控件数量。
+        """
+        self.control_manager.apply_pending_changes()
+        settings_json = obs.obs_data_get_json(self.script_settings)
+        try:
+            values = json.loads(settings_json) if settings_json else {}
+        except ValueError as e:
+            self.Log_manager.log_error(f"解析脚本设置 JSON 失败: {e}")
+            return 0
+        hydrated = self.control_manager.hydrate_from_settings(values)
+        for w in hydrated:
+            # 模型已取自设置，丢弃旧的影子值，下次同步时重新读取
+            self.invalidate_settings_shadow(w.control_name)
+        self.Log_manager.log_info(f"从脚本设置回填了 {len(hydrated)} 个控件")
+        return len(hydrated)
+
+    # ----------------------------------------------------------------------
+    # 批处理作用域
+    # ----------------------------------------------------------------------
+
+    @contextmanager
+    def batch(self):
+        """
+        合并刷新的批处理作用域，用法：``with ui_updater.batch(): ...``
+
+        作用域内调用 update()、update_controls()、refresh_group_fold() 与 flush_dirty() 时只记录需要同步的控件，
+        最外层作用域结束时（无论是否发生异常）把这些控件与控件管理器中的脏控件合并为一个集合，按载入次序同步一次。
+        嵌套的作用域只在最外层结束时同步。
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+
+    @property
+    def in_batch(self) -> bool:
+        """当前是否处于批处理作用域内"""
+        return self._batch_depth > 0
+
+    def _flush_batch(self) -> int:
+        """
+        同步批处理作用域内累积的控件与脏控件，请求完整同步的控件优先于仅同步变化字段。
+        尚未创建 OBS 属性对象的控件跳过同步，其脏字段重新登记，留待下一次同步。
+        """
+        targets = self._batch_targets
+        self._batch_targets = {}
+        self.control_manager.apply_pending_changes()
+        dirty = self.control_manager.pop_dirty()
+        entries = {control_name: (w, None) for control_name, w in targets.items()}
+        for w, dirty_fields in dirty:
+            entries.setdefault(w.control_name, (w, dirty_fields))
+        synced_count = 0
+        with self._staging():
+            for w, dirty_fields in sorted(entries.values(), key=lambda entry: entry[0].load_order):
+                if w.obj is None:
+                    continue
+                self._sync_widget(w, dirty_fields)
+                synced_count += 1
+        self._remark_unsynced(dirty)
+        return synced_count
+
+    def _remark_unsynced(self, dirty: List[Tuple[Any, AbstractSet[str]]]) -> None:
+        """把 pop_dirty() 取出但因没有 OBS 属性对象而未同步的控件重新登记为脏，避免丢失变化字段。"""
+        for w, dirty_fields in dirty:
+            if w.obj is None:
+                self.control_manager.mark_dirty(w, dirty_fields)
+
+    # ----------------------------------------------------------------------
+    # 延后同步折叠区域
+    # ----------------------------------------------------------------------
+
+    def enable_deferred_sync(self, budget_ms: float = 2.0) -> None:
+        """
+        开启延后同步：queue_update() 立即同步可视区域（所有祖先分组均展开）中的控件，
+        位于折叠分组中的控件进入队列，之后每轮同步结束时在 budget_ms 的时间预算内分批补齐。
+
+        所有同步都在调用方（script_properties、控件修改回调）所在的线程中完成；队列中的控件一旦
+        因分组展开而变为可见，会在当轮同步结束前全部补齐，因此界面上看到的内容与关闭时一致。
+
+        Args:
+            budget_ms: 每轮同步结束时用于补齐队列的时间预算（毫秒）。
+        """
+        self.deferred_sync_enabled = True
+        self.deferred_budget_ms = budget_ms
+
+    def disable_deferred_sync(self) -> None:
+        """关闭延后同步，并立即同步队列中剩余的控件。"""
+        self.deferred_sync_enabled = False
+        self.flush_deferred()
+
+    def queue_update(self, update_widget_for_props_dict: Dict[str, List[str]]) -> bool:
+        """
+        请求刷新，参数与 update() 相同。
+
+        未开启延后同步时等同于 update()；开启后可视区域中的控件立即同步，折叠分组中的控件
+        按载入次序进入延后同步队列，已在队列中的控件不会重复加入。
+
+        Returns:
+            bool: 始终返回 True。
+        """
+        if not self.deferred_sync_enabled:
+            return self.update(update_widget_for_props_dict)
+        self.control_manager.apply_pending_changes()
+        widgets = []
+        for props_name, control_names in update_widget_for_props_dict.items():
+            for w in self.control_manager.get_widgets_by_control_names(set(control_names)):
+                if w is not None and w.props_name == props_name:
+                    widgets.append(w)
+        widgets.sort(key=lambda widget: widget.load_order)
+        visible_widgets = []
+        folded_cache: Dict[str, bool] = {}
+        for w in widgets:
+            if w.props_name not in folded_cache:
+                folded_cache[w.props_name] = self.control_manager.is_any_ancestor_folded(w.props_name)
+            if not folded_cache[w.props_name]:
+                visible_widgets.append(w)
+            elif w.control_name not in self._deferred_widgets:
+                self._deferred_by_props.setdefault(w.props_name, {})[w.control_name] = w
+                self._deferred_widgets[w.control_name] = w.props_name
+        # 同步可视区域的控件，作用域结束时按预算补齐部分队列
+        self._sync_widgets(visible_widgets)
+        return True
+
+    def flush_deferred(self) -> int:
+        """
+        立即同步延后同步队列中的全部控件。
+
+        Returns:
+            int: 本次同步的控件数量。
+        """
+        widgets = [w for bucket in self._deferred_by_props.values() for w in bucket.values() if self._is_registered(w)]
+        self._deferred_by_props.clear()
+        self._deferred_widgets.clear()
+        widgets.sort(key=lambda widget: widget.load_order)
+        return self._sync_widgets(widgets)
+
+    @property
+    def deferred_queue_depth(self) -> int:
+        """延后同步队列中等待同步的控件数量"""
+        return len(self._deferred_widgets)
+
+    @property
+    def deferred_metrics(self) -> Dict[str, Any]:
+        """延后同步的指标：队列深度、上一轮及最大单轮补齐耗时（毫秒）、上一轮补齐的控件数量"""
+        return {
+            "queue_depth": len(self._deferred_widgets),
+            "last_drain_ms": self.last_drain_ms,
+            "max_drain_ms": self.max_drain_ms,
+            "last_drain_synced": self.last_drain_synced,
+        }
+
+    def _is_registered(self, w: Any) -> bool:
+        """控件是否仍注册在控件管理器中（队列中的控件可能已被移除）。"""
+        return self.control_manager.get_widget_by_control_name(w.control_name) is w
+
+    def _discard_deferred(self, control_name: str) -> None:
+        """把控件移出延后同步队列。"""
+        props_name = self._deferred_widgets.pop(control_name, None)
+        if props_name is None:
+            return
+        bucket = self._deferred_by_props[props_name]
+        del bucket[control_name]
+        if not bucket:
+            del self._deferred_by_props[props_name]
+
+    def _drain_deferred(self) -> None:
+        """
+        在最外层同步作用域结束前补齐延后同步队列：已变为可见的属性集中的控件全部同步，
+        仍被折叠的控件在时间预算内同步，每轮至少同步一个控件以保证进度。
+        检查可见性的开销与队列中的属性集数量成正比，而不是与控件数量成正比。
+        """
+        start = time.perf_counter()
+        deadline = start + self.deferred_budget_ms / 1000.0
+        folded_buckets = []
+        synced_count = 0
+        for props_name, bucket in list(self._deferred_by_props.items()):
+            if self.control_manager.is_any_ancestor_folded(props_name):
+                folded_buckets.append(bucket)
+                continue
+            for w in list(bucket.values()):
+                synced_count += self._sync_deferred_widget(w)
+        for bucket in folded_buckets:
+            for w in list(bucket.values()):
+                if synced_count and time.perf_counter() >= deadline:
+                    break
+                synced_count += self._sync_deferred_widget(w)
+            else:
+                continue
+            break
+        self.last_drain_ms = (time.perf_counter() - start) * 1000.0
+        self.max_drain_ms = max(self.max_drain_ms, self.last_drain_ms)
+        self.last_drain_synced = synced_count
+
+    def _sync_deferred_widget(self, w: Any) -> bool:
+        """
+        完整同步一个延后同步队列中的控件并移出队列；已移除或尚未创建 OBS 属性对象的控件只移出队列。
+        """
+        self._discard_deferred(w.control_name)
+        if w.obj is None or not self._is_registered(w):
+            return False
+        self._sync_widget(w)
+        self.control_manager.clear_dirty(w.control_name)
+        return True
+
+    # ----------------------------------------------------------------------
+    # 暂存写入
+    # ----------------------------------------------------------------------
+
+    @contextmanager
+    def _staging(self):
+        """
+        同步作用域：开启 stage_settings_writes 时作用域内的 settings 值写入汇集到一个暂存 obs_data，
+        最外层作用域结束时通过一次 obs_data_apply 写入 script_settings 并释放暂存对象；
+        同时把本轮推送过状态的控件一次性记入状态位图。最外层作用域正常结束前补齐延后同步队列。
+        """
+        self._staging_depth += 1
+        if self._staging_depth == 1:
+            # 每轮同步开始时（script_properties 或回调中的下一次更新）报告已完成的后台路径检查
+            self._report_path_results()
+        try:
+            yield
+            if self._staging_depth == 1 and self._deferred_widgets:
+                self._drain_deferred()
+        finally:
+            self._staging_depth -= 1
+            if self._staging_depth == 0:
+                self._apply_staged_settings()
+                self._mark_state_pushed()
+
+    def _record_state_pushed(self, w: Any) -> None:
+        """记录已推送状态的控件，暂存作用域外直接记入状态位图。"""
+        self._state_pushed_widgets.append(w)
+        if self._staging_depth == 0:
+            self._mark_state_pushed()
+
+    def _mark_state_pushed(self) -> None:
+        """把已记录的控件以一个合并掩码记为已推送，整轮同步只做一次位图运算。"""
+        widgets = self._state_pushed_widgets
+        if not widgets:
+            return
+        self._state_pushed_widgets = []
+        self.control_manager.mark_state_pushed(widgets)
+
+    def _write_target(self) -> Any:
+        """获取值写入的目标 obs_data：开启暂存写入时作用域内为暂存对象，否则为 script_settings。"""
+        if self._staging_depth == 0 or not self.stage_settings_writes:
+            return self.script_settings
+        if self._staged_settings is None:
+            self._staged_settings = obs.obs_data_create()
+        return self._staged_settings
+
+    def _apply_staged_settings(self) -> None:
+        """将暂存的写入一次性应用到 script_settings 并释放暂存对象。"""
+        staged = self._staged_settings
+        if staged is None:
+            return
+        self._staged_settings = None
+        try:
+            obs.obs_data_apply(self.script_settings, staged)
+        finally:
+            obs.obs_data_release(staged)
+
+    def _property_cache(self, w: Any) -> Dict[str, Any]:
+        """获取控件属性对象的影子状态，属性对象重建后自动失效。"""
+        entry = self._property_shadow.get(w.control_name)
+        if entry is None or entry[0] is not w.obj:
+            entry = self._property_shadow[w.control_name] = (w.obj, {})
+        return entry[1]
+
+    def _settings_cache(self, w: Any) -> Dict[str, Any]:
+        """获取控件在 settings 中的影子值，settings 对象被替换后整体失效。"""
+        if self._shadow_settings is not self.script_settings:
+            self._shadow_settings = self.script_settings
+            self.invalidate_settings_shadow()
+        cache = self._settings_shadow.get(w.control_name)
+        if cache is None:
+            cache = self._settings_shadow[w.control_name] = {}
+        return cache
+
+    def _shadow_read(self, cache: Dict[str, Any], key: str, reader: Callable[[], Any], calls: int = 1) -> Any:
+        """
+        优先从影子副本读取，未命中时调用 reader 从 OBS 读取并记录。
+
+        Args:
+            cache: 影子副本字典。
+            key: 影子键。
+            reader: 从 OBS 读取的函数。
+            calls: 命中时省去的 OBS 调用次数，可为根据缓存值计算次数的函数。
+        """
+        if key in cache:
+            value = cache[key]
+            self.obs_calls_saved += calls(value) if callable(calls) else calls
+            return value
+        value = cache[key] = reader()
+        return value
 
     def update(self, update_widget_for_props_dict: Dict[str, List[str]]) -> bool:
         """
         更新 UI 界面数据，使控件状态与内部数据模型同步。
 
-        遍历所有需要关注的控件（通过 self.control_manager.get_widgets_by_load_order() 获取），
-        根据预定义的配置（update_widget_for_props_dict）更新控件的可见性、
-        启用状态以及当前值。同时将用户界面的改动写回到 script_settings 中。
+        通过控件名称索引直接定位配置（update_widget_for_props_dict）中列出的控件，按载入次序
+        更新它们的可见性、启用状态以及当前值，不再遍历全部控件。同时将用户界面的改动写回到 script_settings 中。
 
         Args:
             update_widget_for_props_dict: 字典，键为控件所属属性集名称（props_name），
                                            值为该属性集下需要动态更新的控件名称列表（control_name）。
 
         Returns:
-            bool: 始终返回 True，表示更新完成。
+            bool: 始终返回 True，表示更新完成（批处理作用域内表示已加入待同步集合）。
 
         Notes:
             - 控件数据对象应继承自 ControlBaseData，并包含对应类型的专用属性。
             - 本方法仅处理原有逻辑中涉及的控件类型（复选框、数字框、文本框、按钮、组合框、路径框、分组框），
               颜色框、字体框、列表框暂不处理（可后续扩展）。
         """
-        for w in self.control_manager.get_widgets_by_load_order():
-            # 检查当前控件是否需要动态更新
-            if w.props_name not in update_widget_for_props_dict:
-                continue
-            elif w.control_name not in update_widget_for_props_dict[w.props_name]:
-                continue
+        # 并发模式下先登记后台线程排队的字段变更
+        self.control_manager.apply_pending_changes()
+        targets = {}
+        for props_name, control_names in update_widget_for_props_dict.items():
+            # 只更新 props_name 与所在属性集一致的控件
+            for w in self.control_manager.get_widgets_by_control_names(set(control_names)):
+                if w is not None and w.props_name == props_name:
+                    targets[w.control_name] = w
 
-            self.Log_manager.log_info(
-                f"{w.control_name}可见状态{obs.obs_property_visible(w.obj)}⏩{w.visible}"
-            )
-            # 更新可见性
-            if w.widget_variant == GroupVariant.CHECKABLE:
-                self.Log_manager.log_info(
-                    f"--{w.control_name}折叠状态{w.folding_visible}"
-                )
-                if w.visible:
-                    obs.obs_property_set_visible(w.obj, w.folding_visible)
-                    obs.obs_property_set_visible(w.folding_control_obj, not w.folding_visible)
-                else:
-                    obs.obs_property_set_visible(w.obj, w.visible)
-                    obs.obs_property_set_visible(w.folding_control_obj, w.visible)
-            else:
-                if obs.obs_property_visible(w.obj) != w.visible:
-                    obs.obs_property_set_visible(w.obj, w.visible)
+        if self._batch_depth:
+            self._batch_targets.update(targets)
+            return True
 
-            self.Log_manager.log_info(
-                f"{w.control_name}启用状态{obs.obs_property_enabled(w.obj)}⏩{w.enabled}"
-            )
-            # 更新启用状态
-            if w.widget_variant is GroupVariant.CHECKABLE:
-                self.Log_manager.log_info(
-                    f"--{w.control_name}折叠状态{w.folding_enabled}"
-                )
-                if w.enabled:
-                    obs.obs_property_set_enabled(w.obj, w.folding_enabled)
-                    obs.obs_property_set_enabled(w.folding_control_obj, not w.folding_enabled)
-                else:
-                    obs.obs_property_set_enabled(w.obj, w.enabled)
-                    obs.obs_property_set_enabled(w.folding_control_obj, w.enabled)
-            else:
-                if obs.obs_property_enabled(w.obj) != w.enabled:
-                    obs.obs_property_set_enabled(w.obj, w.enabled)
+        with self._staging():
+            for w in sorted(targets.values(), key=lambda widget: widget.load_order):
+                self._sync_widget(w)
+                # 控件已完整同步，清除其脏标记
+                self.control_manager.clear_dirty(w.control_name)
 
-            # 根据控件分类进行数据同步
-            category = w.widget_category
+        return True
+
+    def update_controls(self, control_names: Iterable[str]) -> int:
+        """
+        按控件名称集合完整同步控件，开销只与给定的控件数量有关，与表单中的控件总数无关。
+
+        可直接传入 control_manager.get_dirty_widgets() 的结果（其键即为控件名称）；
+        只需同步变化字段时请使用 flush_dirty()。不存在或尚未创建 OBS 属性对象的控件会被跳过。
 
-            # 复选框
-            if category is WidgetCategory.CHECKBOX:
-                if isinstance(w, CheckBoxData):
-                    self._update_checkbox(w)
+        Args:
+            control_names: 需要同步的控件名称集合。
 
-            # 数字框
-            elif category is WidgetCategory.DIGITALBOX:
-                if isinstance(w, DigitalBoxData):
-                    self._update_digitalbox(w)
+        Returns:
+            int: 本次同步的控件数量。
+        """
+        self.control_manager.apply_pending_changes()
+        widgets = [
+            w for w in self.control_manager.get_widgets_by_control_names(set(control_names))
+            if w is not None
+        ]
+        widgets.sort(key=lambda widget: widget.load_order)
+        return self._sync_widgets(widgets)
 
-            # 文本框
-            elif category is WidgetCategory.TEXTBOX:
-                if isinstance(w, TextBoxData):
-                    self._update_textbox(w)
+    def refresh_group_fold(self, group: GroupData) -> int:
+        """
+        分组框折叠或展开后，只刷新实际可见性发生变化的控件。
 
-            # 按钮（无需数据同步）
-            elif category is WidgetCategory.BUTTON:
-                pass
+        折叠时子树中的控件随分组一起被 OBS 隐藏，只需刷新分组框自身；展开时刷新分组框及其子树中
+        未被仍处于折叠状态的嵌套分组遮挡的控件（含嵌套分组框本身），开销与这些控件的数量成正比。
 
-            # 组合框
+        Args:
+            group: 发生折叠或展开的分组控件。
+
+        Returns:
+            int: 本次同步的控件数量。
+        """
+        self.control_manager.apply_pending_changes()
+        widgets = [group]
+        if group.folding_visible:
+            widgets.extend(self.control_manager.get_unfolded_subtree_widgets(group.group_props_name))
+        return self._sync_widgets(widgets)
+
+    def _sync_widgets(self, widgets: Iterable[Any]) -> int:
+        """
+        完整同步给定的控件（已按载入次序排列），跳过尚未创建 OBS 属性对象的控件。
+        批处理作用域内只把控件加入待同步集合，返回加入的数量。
+        """
+        if self._batch_depth:
+            count = 0
+            for w in widgets:
+                self._batch_targets[w.control_name] = w
+                count += 1
+            return count
+        synced_count = 0
+        with self._staging():
+            for w in widgets:
+                if w.obj is None:
+                    continue
+                self._sync_widget(w)
+                self.control_manager.clear_dirty(w.control_name)
+                synced_count += 1
+        return synced_count
+
+    def flush_dirty(self) -> int:
+        """
+        仅同步自上次同步以来字段发生变化的控件，并清除它们的脏标记。
+
+        可在任意回调中修改控件数据后调用。只有可见/可用相关字段变化的控件仅同步可见性与启用状态，
+        其余控件完整同步。尚未创建 OBS 属性对象的控件会被跳过并保留脏标记，留待之后的同步。
+
+        Returns:
+            int: 本次同步的控件数量，批处理作用域内推迟到作用域结束时同步并返回 0。
+        """
+        if self._batch_depth:
+            return 0
+        dirty = self.control_manager.pop_dirty()
+        synced_count = 0
+        with self._staging():
+            for w, dirty_fields in dirty:
+                if w.obj is None:
+                    continue
+                self._sync_widget(w, dirty_fields)
+                synced_count += 1
+        self._remark_unsynced(dirty)
+        return synced_count
+
+    def _sync_widget(self, w: Any, dirty_fields: Optional[AbstractSet[str]] = None) -> None:
+        """
+        将单个控件的数据模型同步到 OBS 界面。
+
+        Args:
+            w: 控件数据对象。
+            dirty_fields: 需要同步的已变化字段名，为 None 时同步全部状态与值。
+        """
+        binding = self._sync_bindings.get(w.control_name)
+        if binding is None or binding[0] is not w:
+            # 未经注册通知的控件（如基础分组）在首次同步时绑定
+            binding = self._bind_widget(w)
+        if dirty_fields is None and self._deferred_widgets:
+            # 完整同步后控件无需再延后同步
+            self._discard_deferred(w.control_name)
+        if dirty_fields is None or not dirty_fields.isdisjoint(_STATE_FIELDS):
+            binding[1]()
+        if dirty_fields is None or not dirty_fields <= _STATE_FIELDS:
+            binding[2]()
+
+    def on_widget_registered(self, w: Any) -> None:
+        """
+        控件管理器的注册通知：控件注册、重新登记或派生类型变化时（重新）绑定同步函数；
+        控件移动到其他属性集时，把它在延后同步队列中的条目移到新属性集的桶中。
+        """
+        self._bind_widget(w)
+        props_name = self._deferred_widgets.get(w.control_name)
+        if props_name is not None and props_name != w.props_name:
+            self._discard_deferred(w.control_name)
+            self._deferred_by_props.setdefault(w.props_name, {})[w.control_name] = w
+            self._deferred_widgets[w.control_name] = w.props_name
+
+    def on_widget_unregistered(self, w: Any) -> None:
+        """控件管理器的注销通知：移除控件的同步函数绑定。"""
+        binding = self._sync_bindings.get(w.control_name)
+        if binding is not None and binding[0] is w:
+            del self._sync_bindings[w.control_name]
+
+    def _bind_widget(self, w: Any) -> Tuple[Any, Callable[[], None], Callable[[], None]]:
+        """
+        按控件的分类与派生类型为其绑定专用的状态同步与值同步函数。
+
+        分类与派生类型只在这里判断一次：可勾选分组框绑定专用的状态同步函数，数字框绑定整数或浮点数的
+        OBS 函数，信息文本框与组合框的显示文本按派生类型选定，不可勾选的分组框不做值同步。
+        之后每次同步都直接调用绑定的函数，不再逐次判断分类与类型。
+
+        Returns:
+            (控件对象, 状态同步函数, 值同步函数)
+        """
+        category, variant = w.widget_category, w.widget_variant
+        if variant is GroupVariant.CHECKABLE:
+            state_sync = functools.partial(self._sync_checkable_group_state, w)
+        else:
+            state_sync = functools.partial(self._sync_widget_state, w)
+
+        value_sync = _noop
+        entry = _VALUE_SYNC_METHODS.get(category)
+        if entry is not None and isinstance(w, entry[0]):
+            method = getattr(self, entry[1])
+            if category is WidgetCategory.DIGITALBOX:
+                ops = _DIGITALBOX_OPS.get(variant)
+                if ops is not None:
+                    value_sync = functools.partial(method, w, ops)
+            elif category is WidgetCategory.TEXTBOX and variant is TextBoxVariant.INFO:
+                value_sync = functools.partial(self._update_info_textbox, w)
             elif category is WidgetCategory.COMBOBOX:
-                if isinstance(w, ComboBoxData):
-                    self._update_combobox(w)
-
-            # 路径框
-            elif category is WidgetCategory.PATHBOX:
-                if isinstance(w, PathBoxData):
-                    self._update_pathbox(w)
-
-            # 分组框
-            elif category is WidgetCategory.GROUP:
-                if isinstance(w, GroupData):
-                    self._update_group(w)
-
-            # 颜色框
-            elif category is WidgetCategory.COLORBOX:
-                if isinstance(w, ColorBoxData):
-                    self._update_colorbox(w)
-
-            # 字体框
-            elif category is WidgetCategory.FONTBOX:
-                if isinstance(w, FontBoxData):
-                    self._update_fontbox(w)
-
-            # 列表框
-            elif category is WidgetCategory.LISTBOX:
-                if isinstance(w, ListBoxData):
-                    self._update_listbox(w)
-
-            # 其他控件类型（颜色框、字体框、列表框）暂不处理，可后续扩展
-            else:
-                # 可在此添加日志或忽略
-                pass
+                value_sync = functools.partial(method, w, _COMBOBOX_TEXT.get(variant))
+            elif category is not WidgetCategory.GROUP or variant is GroupVariant.CHECKABLE:
+                value_sync = functools.partial(method, w)
 
-        return True
+        binding = (w, state_sync, value_sync)
+        self._sync_bindings[w.control_name] = binding
+        return binding
+
+    def _sync_widget_state(self, w: Any) -> None:
+        """同步普通控件的可见性与启用状态。"""
+        cache = self._property_cache(w)
+        current_visible = self._shadow_read(cache, "visible", lambda: obs.obs_property_visible(w.obj))
+        current_enabled = self._shadow_read(cache, "enabled", lambda: obs.obs_property_enabled(w.obj))
+        # 更新可见性
+        self.Log_manager.log_info(
+            f"{w.control_name}可见状态{current_visible}⏩{w.visible}"
+        )
+        if current_visible != w.visible:
+            obs.obs_property_set_visible(w.obj, w.visible)
+            cache["visible"] = w.visible
+
+        # 更新启用状态
+        self.Log_manager.log_info(
+            f"{w.control_name}启用状态{current_enabled}⏩{w.enabled}"
+        )
+        if current_enabled != w.enabled:
+            obs.obs_property_set_enabled(w.obj, w.enabled)
+            cache["enabled"] = w.enabled
+
+        # 记录已推送的状态，供按位比较
+        self._record_state_pushed(w)
+
+    def _sync_checkable_group_state(self, w: GroupData) -> None:
+        """同步可勾选分组框及其折叠控件的可见性与启用状态。"""
+        cache = self._property_cache(w)
+        current_visible = self._shadow_read(cache, "visible", lambda: obs.obs_property_visible(w.obj))
+        current_enabled = self._shadow_read(cache, "enabled", lambda: obs.obs_property_enabled(w.obj))
+        # 更新可见性
+        self.Log_manager.log_info(
+            f"{w.control_name}可见状态{current_visible}⏩{w.visible}"
+        )
+        self.Log_manager.log_info(
+            f"--{w.control_name}折叠状态{w.folding_visible}"
+        )
+        if w.visible:
+            obs.obs_property_set_visible(w.obj, w.folding_visible)
+            obs.obs_property_set_visible(w.folding_control_obj, not w.folding_visible)
+            cache["visible"] = w.folding_visible
+        else:
+            obs.obs_property_set_visible(w.obj, w.visible)
+            obs.obs_property_set_visible(w.folding_control_obj, w.visible)
+            cache["visible"] = w.visible
+
+        # 更新启用状态
+        self.Log_manager.log_info(
+            f"{w.control_name}启用状态{current_enabled}⏩{w.enabled}"
+        )
+        self.Log_manager.log_info(
+            f"--{w.control_name}折叠状态{w.folding_enabled}"
+        )
+        if w.enabled:
+            obs.obs_property_set_enabled(w.obj, w.folding_enabled)
+            obs.obs_property_set_enabled(w.folding_control_obj, not w.folding_enabled)
+            cache["enabled"] = w.folding_enabled
+        else:
+            obs.obs_property_set_enabled(w.obj, w.enabled)
+            obs.obs_property_set_enabled(w.folding_control_obj, w.enabled)
+            cache["enabled"] = w.enabled
+
+        # 记录已推送的状态，供按位比较
+        self._record_state_pushed(w)
 
     # ----------------------------------------------------------------------
     # 私有更新方法，按控件类型拆分以提高可读性
@@ -175,7 +757,10 @@ class UIUpdater:
     def _update_checkbox(self, w: CheckBoxData) -> None:
         """同步复选框控件的值。"""
         #  获取当前数据
-        current_bool = obs.obs_data_get_bool(self.script_settings, w.control_name)
+        settings_cache = self._settings_cache(w)
+        current_bool = self._shadow_read(
+            settings_cache, "value", lambda: obs.obs_data_get_bool(self.script_settings, w.control_name)
+        )
         #  数据审查
         if type(w.checked) is not bool:
             self.Log_manager.log_warning(f"复选框 {w.control_name} 期望 bool，实际为 {type(w.checked)}")
@@ -183,89 +768,122 @@ class UIUpdater:
         self.Log_manager.log_info(f"{w.control_name}的勾选状态{current_bool}⏩{w.checked}")
         #  执行更新
         if current_bool != w.checked:
-            obs.obs_data_set_bool(self.script_settings, w.control_name, w.checked)
+            obs.obs_data_set_bool(self._write_target(), w.control_name, w.checked)
+            settings_cache["value"] = w.checked
+
+    def _update_digitalbox(self, w: DigitalBoxData, ops: Tuple[Any, ...]) -> None:
+        """
+        同步数字框控件的范围与值。
 
-    def _update_digitalbox(self, w: DigitalBoxData) -> None:
-        """同步数字框控件的范围与值。"""
+        Args:
+            w: 数字框控件数据对象。
+            ops: 绑定时按派生类型选定的整数或浮点数 OBS 函数与数值类型，见 _DIGITALBOX_OPS。
+        """
+        get_min, get_max, get_step, set_limits, get_value, set_value, number_type = ops
         #  获取当前数据
-        variant = w.widget_variant
-        if variant in (DigitalBoxVariant.INT, DigitalBoxVariant.INT_SLIDER):
-            current_min = obs.obs_property_int_min(w.obj)
-            current_max = obs.obs_property_int_max(w.obj)
-            current_step = obs.obs_property_int_step(w.obj)
-            current_value = obs.obs_data_get_int(self.script_settings, w.control_name)
-        elif variant in (DigitalBoxVariant.FLOAT, DigitalBoxVariant.FLOAT_SLIDER):
-            current_min = obs.obs_property_float_min(w.obj)
-            current_max = obs.obs_property_float_max(w.obj)
-            current_step = obs.obs_property_float_step(w.obj)
-            current_value = obs.obs_data_get_double(self.script_settings, w.control_name)
+        property_cache = self._property_cache(w)
+        settings_cache = self._settings_cache(w)
+        current_min, current_max, current_step = self._shadow_read(
+            property_cache, "limits", lambda: (get_min(w.obj), get_max(w.obj), get_step(w.obj)), calls=3
+        )
+        current_value = self._shadow_read(
+            settings_cache, "value", lambda: get_value(self.script_settings, w.control_name)
+        )
         #  数据审查
-        if variant in (DigitalBoxVariant.INT, DigitalBoxVariant.INT_SLIDER):
-            if type(w.digital) is not int:
-                self.Log_manager.log_warning(f"数字框 {w.control_name} 期望 int，实际为 {type(w.digital)}")
-        elif variant in (DigitalBoxVariant.FLOAT, DigitalBoxVariant.FLOAT_SLIDER):
-            if type(w.digital) is not float:
-                self.Log_manager.log_warning(f"数字框 {w.control_name} 期望 float，实际为 {type(w.digital)}")
+        if type(w.digital) is not number_type:
+            self.Log_manager.log_warning(
+                f"数字框 {w.control_name} 期望 {number_type.__name__}，实际为 {type(w.digital)}"
+            )
         #  记录更新
         self.Log_manager.log_info(f"{w.control_name}最小值{current_min}⏩{w.min_val}")
         self.Log_manager.log_info(f"{w.control_name}最大值{current_max}⏩{w.max_val}")
         self.Log_manager.log_info(f"{w.control_name}步数{current_step}⏩{w.step}")
         self.Log_manager.log_info(f"{w.control_name}数值{current_value}⏩{w.digital}")
         #  执行更新
-        if variant in (DigitalBoxVariant.INT, DigitalBoxVariant.INT_SLIDER):
-            if w.min_val != current_min or w.max_val != current_max or w.step != current_step:  # 整数范围更新
-                obs.obs_property_int_set_limits(w.obj, int(w.min_val), int(w.max_val), int(w.step))
-            if current_value != w.digital:  # 值更新
-                obs.obs_data_set_int(self.script_settings, w.control_name, w.digital)
-        elif variant in (DigitalBoxVariant.FLOAT, DigitalBoxVariant.FLOAT_SLIDER):
-            if w.min_val != current_min or w.max_val != current_max or w.step != current_step:  # 浮点数范围更新
-                obs.obs_property_float_set_limits(w.obj, float(w.min_val), float(w.max_val), float(w.step))
-            if current_value != w.digital:  # 值更新
-                obs.obs_data_set_double(self.script_settings, w.control_name, w.digital)
+        if w.min_val != current_min or w.max_val != current_max or w.step != current_step:  # 范围更新
+            limits = (number_type(w.min_val), number_type(w.max_val), number_type(w.step))
+            set_limits(w.obj, *limits)
+            property_cache["limits"] = limits
+        if current_value != w.digital:  # 值更新
+            set_value(self._write_target(), w.control_name, w.digital)
+            settings_cache["value"] = w.digital
 
     def _update_textbox(self, w: TextBoxData) -> None:
-        """同步文本框控件的类型与内容。"""
+        """同步文本框控件的内容。"""
         #  获取当前数据
-        variant = w.widget_variant
-        if variant is TextBoxVariant.INFO:
-            current_info_type = obs.obs_property_text_info_type(w.obj)
-        current_string = obs.obs_data_get_string(self.script_settings, w.control_name)
+        settings_cache = self._settings_cache(w)
+        current_string = self._shadow_read(
+            settings_cache, "value", lambda: obs.obs_data_get_string(self.script_settings, w.control_name)
+        )
         #  数据审查
-        if variant is TextBoxVariant.INFO:
-            if type(w.info_type) is not TextBoxInfoVariant:
-                self.Log_manager.log_warning(f"文本框 {w.control_name} 期望 TextBoxInfoVariant，实际为 {type(w.info_type)}")
         if type(w.text) is not str:
             self.Log_manager.log_warning(f"文本框 {w.control_name} 期望 str，实际为 {type(w.text)}")
         #  记录更新
-        if variant is TextBoxVariant.INFO:
-            self.Log_manager.log_info(f"{w.control_name}文本提示类型{current_info_type}⏩{w.info_type}")
         self.Log_manager.log_info(f"{w.control_name}文本{current_string}⏩{w.text}")
         #  执行更新
-        if variant is TextBoxVariant.INFO:
-            if current_info_type != w.info_type.value:  # 更新信息类型
-                obs.obs_property_text_set_info_type(w.obj, w.info_type.value)
         if current_string != w.text:  # 文本内容更新
-            obs.obs_data_set_string(self.script_settings, w.control_name, w.text)
+            obs.obs_data_set_string(self._write_target(), w.control_name, w.text)
+            settings_cache["value"] = w.text
 
-    def _update_combobox(self, w: ComboBoxData) -> None:
-        """同步组合框控件的选项与当前值。"""
+    def _update_info_textbox(self, w: TextBoxData) -> None:
+        """同步信息文本框控件的信息类型与内容。"""
         #  获取当前数据
-        current_options = []
-        """当前选项列表数据"""
-        item_count = obs.obs_property_list_item_count(w.obj)
-        for idx in range(item_count):
-            label = obs.obs_property_list_item_name(w.obj, idx)
-            value = obs.obs_property_list_item_string(w.obj, idx)
-            current_options.append({"label": label, "value": value})
-        current_string = obs.obs_data_get_string(self.script_settings, w.control_name)
+        property_cache = self._property_cache(w)
+        current_info_type = self._shadow_read(
+            property_cache, "info_type", lambda: obs.obs_property_text_info_type(w.obj)
+        )
+        #  数据审查
+        if type(w.info_type) is not TextBoxInfoVariant:
+            self.Log_manager.log_warning(f"文本框 {w.control_name} 期望 TextBoxInfoVariant，实际为 {type(w.info_type)}")
+        #  记录更新
+        self.Log_manager.log_info(f"{w.control_name}文本提示类型{current_info_type}⏩{w.info_type}")
+        #  执行更新
+        if current_info_type != w.info_type.value:  # 更新信息类型
+            obs.obs_property_text_set_info_type(w.obj, w.info_type.value)
+            property_cache["info_type"] = w.info_type.value
+        self._update_textbox(w)
+
+    def _update_combobox(self, w: ComboBoxData, text_binding: Optional[Tuple[int, str, Any]]) -> None:
+        """
+        同步组合框控件的选项与当前值。
+
+        OBS 中的选项顺序为：第一个标签等于当前显示文本的项位于索引 0，其后依次为其余标签不同的项。
+        选项变化时对上次推送的选项序列做增量差分，只插入、删除变化的项；
+        选项序列的哈希与显示文本均未变化时直接复用上次的结果。
+
+        Args:
+            w: 组合框控件数据对象。
+            text_binding: 绑定时按派生类型选定的显示文本写法，见 _COMBOBOX_TEXT；为 None 时不写入显示文本。
+        """
+        #  获取当前数据
+        property_cache = self._property_cache(w)
+        settings_cache = self._settings_cache(w)
+
+        def read_options():
+            options = []
+            item_count = obs.obs_property_list_item_count(w.obj)
+            for idx in range(item_count):
+                label = obs.obs_property_list_item_name(w.obj, idx)
+                value = obs.obs_property_list_item_string(w.obj, idx)
+                options.append((label, value))
+            return tuple(options)
+
+        current_options = self._shadow_read(
+            property_cache, "options", read_options, calls=lambda options: 1 + 2 * len(options)
+        )
+        """当前选项序列，元素为 (显示文本, 值)"""
+        current_string = self._shadow_read(
+            settings_cache, "value", lambda: obs.obs_data_get_string(self.script_settings, w.control_name)
+        )
         #  数据审查
         if not isinstance(w.items, list):
             self.Log_manager.log_warning(f"组合框 {w.control_name} 期望 list，实际为 {type(w.items)}")
-            label_exists = False
-            value_exists = False
+            desired_options = ()
+            labels = values = {}
         else:
-            label_exists = any(item.get("label") == w.label for item in w.items)
-            value_exists = any(item.get("value") == w.value for item in w.items)
+            desired_options, labels, values = self._combobox_layout(w, property_cache)
+        label_exists = w.label in labels
+        value_exists = w.value in values
         if type(w.label) is not str:
             self.Log_manager.log_warning(f"组合框 {w.control_name} 期望 str，实际为 {type(w.label)}")
         if type(w.value) is not str:
@@ -275,67 +893,139 @@ class UIUpdater:
         if not value_exists:
             self.Log_manager.log_warning(f"组合框 {w.control_name} 期望 in {w.items}，实际为 {w.value}")
         #  记录更新
-        if w.items != current_options:
-            self.Log_manager.log_info(f"{w.control_name}组合框列表{current_options}⏩{w.items}")
+        options_changed = isinstance(w.items, list) and desired_options != current_options
+        if options_changed:
+            self.Log_manager.log_info(f"{w.control_name}组合框列表{list(current_options)}⏩{list(desired_options)}")
         self.Log_manager.log_info(f"{w.control_name}组合框显示文本{current_string}⏩{w.label}")
         #  执行更新
-        if w.items != current_options:  # 设定组合框列表
+        if options_changed:  # 设定组合框列表
+            self._apply_combobox_diff(w, current_options, desired_options)
+            property_cache["options"] = desired_options
+        if text_binding is not None:  # 显示文本更新：可编辑列表写入显示文本，不可编辑列表写入值
+            index, field_name, read_first_item = text_binding
+            text = getattr(w, field_name)
+            if current_string != text:
+                if text not in (labels, values)[index]:
+                    options = property_cache["options"]
+                    text = options[0][index] if options else read_first_item(w.obj, 0)
+                obs.obs_data_set_string(self._write_target(), w.control_name, text)
+                settings_cache["value"] = text
+
+    @staticmethod
+    def _combobox_layout(w: ComboBoxData, property_cache: Dict[str, Any]) -> Tuple[tuple, Dict, Dict]:
+        """
+        计算组合框在 OBS 中应呈现的选项序列，以及显示文本、值的字典索引。
+
+        结果按 (选项序列哈希, 显示文本) 缓存在属性影子副本中，选项与显示文本都未变化时直接复用。
+
+        Returns:
+            (选项序列, 显示文本 -> 首次出现的索引, 值 -> 首次出现的索引)
+        """
+        items_key = tuple((item.get("label"), item.get("value")) for item in w.items)
+        layout_key = (hash(items_key), w.label)
+        cached = property_cache.get("layout")
+        if cached is not None and cached[0] == layout_key and cached[1] == items_key:
+            return cached[2]
+
+        labels: Dict[Any, int] = {}
+        values: Dict[Any, int] = {}
+        first_option = None
+        other_options = []
+        for index, option in enumerate(items_key):
+            label, value = option
+            labels.setdefault(label, index)
+            values.setdefault(value, index)
+            if label == w.label:
+                if first_option is None:
+                    first_option = option
+            else:
+                other_options.append(option)
+        desired_options = tuple(other_options) if first_option is None else (first_option, *other_options)
+        layout = (desired_options, labels, values)
+        property_cache["layout"] = (layout_key, items_key, layout)
+        return layout
+
+    @staticmethod
+    def _apply_combobox_diff(w: ComboBoxData, current_options: tuple, desired_options: tuple) -> None:
+        """
+        以最少的插入、删除把组合框选项从 current_options 变为 desired_options；
+        差分的调用次数不少于清空重建时改为清空重建。
+        """
+        opcodes = [
+            opcode for opcode in SequenceMatcher(None, current_options, desired_options, autojunk=False).get_opcodes()
+            if opcode[0] != "equal"
+        ]
+        edit_count = sum((i2 - i1) + (j2 - j1) for _, i1, i2, j1, j2 in opcodes)
+        if edit_count >= 1 + len(desired_options):
             obs.obs_property_list_clear(w.obj)  # 清除列表
-            for item in w.items:  # 先将当前显示文本对应的项插入到索引 0
-                if item["label"] == w.label:
-                    obs.obs_property_list_insert_string(w.obj, 0, item["label"], item["value"])
-                    break
-            for item in w.items:
-                if item["label"] != w.label:
-                    obs.obs_property_list_add_string(w.obj, item["label"], item["value"])
-        if w.widget_variant is ComboBoxVariant.EDITABLE:  # 可编辑列表显示文本更新
-            if current_string != w.label:
-                if label_exists:
-                    obs.obs_data_set_string(self.script_settings, w.control_name, w.label)
-                else:
-                    first_item_name = obs.obs_property_list_item_name(w.obj, 0)
-                    obs.obs_data_set_string(self.script_settings, w.control_name, first_item_name)
-        elif w.widget_variant is ComboBoxVariant.LIST:  # 不可编辑列表显示文本更新
-            if current_string != w.value:
-                if value_exists:
-                    obs.obs_data_set_string(self.script_settings, w.control_name, w.value)
-                else:
-                    first_item_value = obs.obs_property_list_item_string(w.obj, 0)
-                    obs.obs_data_set_string(self.script_settings, w.control_name, first_item_value)
+            for label, value in desired_options:
+                obs.obs_property_list_add_string(w.obj, label, value)
+            return
+        # 从后往前应用，前面的索引不受影响
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            for idx in range(i2 - 1, i1 - 1, -1):  # delete / replace 先删除旧项
+                obs.obs_property_list_item_remove(w.obj, idx)
+            for offset, (label, value) in enumerate(desired_options[j1:j2]):  # insert / replace 再插入新项
+                obs.obs_property_list_insert_string(w.obj, i1 + offset, label, value)
 
     def _update_pathbox(self, w: PathBoxData) -> None:
         """同步路径框控件的路径文本。"""
         #  获取当前数据
-        current_path = obs.obs_data_get_string(self.script_settings, w.control_name)
+        settings_cache = self._settings_cache(w)
+        current_path = self._shadow_read(
+            settings_cache, "value", lambda: obs.obs_data_get_string(self.script_settings, w.control_name)
+        )
         #  数据审查
         if type(w.path_text) is not str:
             self.Log_manager.log_warning(f"路径框 {w.control_name} 期望 str，实际为 {type(w.path_text)}")
-        if not os.path.exists(w.path_text):
+        # 只读取路径状态缓存，结果未知时由后台检查，完成后在 _report_path_results() 中报告
+        path_exists = self.path_status_cache.get(w.path_text)
+        if path_exists is None:
+            self._path_checks_pending.setdefault(w.path_text, set()).add(w.control_name)
+        elif not path_exists:
             self.Log_manager.log_warning(f"路径框 {w.control_name} 路径不存在: {w.path_text}")
         #  记录更新
         self.Log_manager.log_info(f"{w.control_name}路径框{current_path}⏩{w.path_text}")
         #  执行更新
         if current_path != w.path_text:
-            obs.obs_data_set_string(self.script_settings, w.control_name, w.path_text)
+            obs.obs_data_set_string(self._write_target(), w.control_name, w.path_text)
+            settings_cache["value"] = w.path_text
+
+    def _report_path_results(self) -> None:
+        """
+        报告已完成的后台路径检查，对仍使用该路径且路径不存在的路径框记录警告。
+
+        只在同步作用域开始时调用，即 script_properties 与控件修改回调所在的 UI 线程中，
+        没有新完成的检查时直接返回。
+        """
+        results = self.path_status_cache.drain_results()
+        if not results:
+            return
+        for path, exists in results:
+            control_names = self._path_checks_pending.pop(path, ())
+            if exists:
+                continue
+            for w in self.control_manager.get_widgets_by_control_names(control_names):
+                if w is not None and w.path_text == path:
+                    self.Log_manager.log_warning(f"路径框 {w.control_name} 路径不存在: {path}")
 
     def _update_group(self, w: GroupData) -> None:
-        """同步分组框控件的勾选状态（如果可勾选）。"""
+        """同步可勾选分组框控件的勾选状态，只为可勾选的分组框绑定。"""
         #  获取当前数据
-        variant = w.widget_variant
-        if variant is GroupVariant.CHECKABLE:
-            current_bool = obs.obs_data_get_bool(self.script_settings, w.control_name)
+        settings_cache = self._settings_cache(w)
+        current_bool = self._shadow_read(
+            settings_cache, "value", lambda: obs.obs_data_get_bool(self.script_settings, w.control_name)
+        )
         #  数据审查
-        if variant is GroupVariant.CHECKABLE:
-            if type(w.checked) is not bool:
-                self.Log_manager.log_warning(f"分组框 {w.control_name} 期望 bool，实际为 {type(w.checked)}")
+        if type(w.checked) is not bool:
+            self.Log_manager.log_warning(f"分组框 {w.control_name} 期望 bool，实际为 {type(w.checked)}")
         #  记录更新
-        if variant is GroupVariant.CHECKABLE:
-            self.Log_manager.log_info(f"{w.control_name}分组框{current_bool}⏩{w.checked}")
+        self.Log_manager.log_info(f"{w.control_name}分组框{current_bool}⏩{w.checked}")
         #  执行更新
-        if variant is GroupVariant.CHECKABLE:
-            if current_bool != w.checked:
-                obs.obs_data_set_bool(self.script_settings, w.control_name, w.checked)
-            obs.obs_data_set_bool(self.script_settings, w.control_name.encode().hex(), w.checked)  # 同步折叠控件选项状态
+        if current_bool != w.checked:
+            obs.obs_data_set_bool(self._write_target(), w.control_name, w.checked)
+            settings_cache["value"] = w.checked
+        obs.obs_data_set_bool(self._write_target(), w.control_name.encode().hex(), w.checked)  # 同步折叠控件选项状态
 
     def _update_colorbox(self, w: ColorBoxData) -> None:
         """
@@ -345,7 +1035,10 @@ class UIUpdater:
         示例：0x80FF0000 = 50% 透明度的红色
         """
         #  获取当前数据
-        current = obs.obs_data_get_int(self.script_settings, w.control_name)
+        settings_cache = self._settings_cache(w)
+        current = self._shadow_read(
+            settings_cache, "value", lambda: obs.obs_data_get_int(self.script_settings, w.control_name)
+        )
         #  数据审查
         if type(w.color_value) is not int:
             self.Log_manager.log_warning(f"颜色框 {w.control_name} 期望 int，实际为 {type(w.color_value)}")
@@ -355,7 +1048,8 @@ class UIUpdater:
         )
         #  执行更新
         if current != w.color_value:
-            obs.obs_data_set_int(self.script_settings, w.control_name, w.color_value)
+            obs.obs_data_set_int(self._write_target(), w.control_name, w.color_value)
+            settings_cache["value"] = w.color_value
 
     def _update_fontbox(self, w: FontBoxData) -> None:
         """
@@ -368,15 +1062,24 @@ class UIUpdater:
         - "current_flags"   ：标志位，按位组合控制粗体、斜体等
         """
         #  获取当前数据
-        current_font_data = obs.obs_data_get_obj(self.script_settings, w.control_name)
-        if current_font_data:
-            current_face = obs.obs_data_get_string(current_font_data, "face")
-            current_size = obs.obs_data_get_int(current_font_data, "size")
-            current_style = obs.obs_data_get_string(current_font_data, "style")
-            current_flags = obs.obs_data_get_int(current_font_data, "flags")
+        settings_cache = self._settings_cache(w)
+
+        def read_font():
+            current_font_data = obs.obs_data_get_obj(self.script_settings, w.control_name)
+            if not current_font_data:
+                return None, None, None, None
+            font = (
+                obs.obs_data_get_string(current_font_data, "face"),
+                obs.obs_data_get_int(current_font_data, "size"),
+                obs.obs_data_get_string(current_font_data, "style"),
+                obs.obs_data_get_int(current_font_data, "flags"),
+            )
             obs.obs_data_release(current_font_data)  # 务必释放字体数据对象，避免内存泄漏
-        else:
-            current_face = current_size = current_style = current_flags = None
+            return font
+
+        current_face, current_size, current_style, current_flags = self._shadow_read(
+            settings_cache, "value", read_font, calls=lambda font: 1 if font[0] is None else 6
+        )
         #  数据审查
         if type(w.font_face) is not str:
             self.Log_manager.log_warning(f"字体框 {w.control_name} 期望 str，实际为 {type(w.font_face)}")
@@ -410,56 +1113,106 @@ class UIUpdater:
             obs.obs_data_set_int(font_data, "size", w.font_size)
             obs.obs_data_set_string(font_data, "style", w.font_style)
             obs.obs_data_set_int(font_data, "flags", w.font_flags)
-            obs.obs_data_set_obj(self.script_settings, w.control_name, font_data)
+            obs.obs_data_set_obj(self._write_target(), w.control_name, font_data)
             obs.obs_data_release(font_data)
+            settings_cache["value"] = (w.font_face, w.font_size, w.font_style, w.font_flags)
 
     def _update_listbox(self, w: ListBoxData) -> None:
         """
-        从 settings 读取列表框数据（obs_data_array_t）并更新 ListBoxData 模型。
+        将 ListBoxData 模型的列表项同步到 settings 中的列表框数据（obs_data_array_t）。
 
         列表框数据格式：
         - 存储在 settings 中的是一个 obs_data_array_t（数组对象）
         - 数组每个元素是一个 obs_data_t 对象，格式为 {"value": str, "selected": bool, "hidden": bool}
-        - 主要读取 "value" 字段获取列表项内容
+
+        影子副本保存上次同步的列表项元组，与模型内容相等（元组逐项比较）时直接跳过，不调用 OBS；
+        内容变化时对已有数组做最少的 obs_data_array_insert / erase / push_back 编辑，而不是整体替换数组。
         """
-        current_array = obs.obs_data_get_array(self.script_settings, w.control_name)
-        current_items = []
-        if current_array is not None:
-            count = obs.obs_data_array_count(current_array)
-            for i in range(count):
-                item_obj = obs.obs_data_array_item(current_array, i)
-                # 从 obs_data_t 中提取字段
-                val = obs.obs_data_get_string(item_obj, "value")
-                sel = obs.obs_data_get_bool(item_obj, "selected")
-                hid = obs.obs_data_get_bool(item_obj, "hidden")
-                current_items.append({"value": val, "selected": sel, "hidden": hid})
-                obs.obs_data_release(item_obj)
-            obs.obs_data_array_release(current_array)
+        settings_cache = self._settings_cache(w)
 
         # 数据审查
         if not isinstance(w.items, list):
             self.Log_manager.log_warning(
                 f'列表框 {w.control_name} 期望 list，实际为 {type(w.items)}'
             )
+            return
 
-        # 记录更新
-        if current_items != w.items:
-            self.Log_manager.log_info(f"{w.control_name}列表框内容{current_items}⏩{w.items}")
+        desired_items = tuple(
+            (item.get("value", "?"), item.get("selected", False), item.get("hidden", False)) for item in w.items
+        )
+        """目标列表项，元素为 (value, selected, hidden)"""
+
+        def read_items():
+            items = []
+            current_array = obs.obs_data_get_array(self.script_settings, w.control_name)
+            if current_array is not None:
+                count = obs.obs_data_array_count(current_array)
+                for i in range(count):
+                    item_obj = obs.obs_data_array_item(current_array, i)
+                    # 从 obs_data_t 中提取字段
+                    val = obs.obs_data_get_string(item_obj, "value")
+                    sel = obs.obs_data_get_bool(item_obj, "selected")
+                    hid = obs.obs_data_get_bool(item_obj, "hidden")
+                    items.append((val, sel, hid))
+                    obs.obs_data_release(item_obj)
+                obs.obs_data_array_release(current_array)
+            return tuple(items)
+
+        current_items = self._shadow_read(
+            settings_cache, "value", read_items, calls=lambda items: 3 + 5 * len(items)
+        )
+
+        # 记录更新并执行更新（从模型写回 settings）
+        if current_items != desired_items:
+            self.Log_manager.log_info(f"{w.control_name}列表框内容{list(current_items)}⏩{list(desired_items)}")
+            self._apply_listbox_diff(w, current_items, desired_items)
+            settings_cache["value"] = desired_items
+
+    def _apply_listbox_diff(self, w: ListBoxData, current_items: tuple, desired_items: tuple) -> None:
+        """
+        就地编辑 settings 中的列表框数组；数组不存在或与影子副本长度不一致时整体写入新数组。
 
-        # 执行更新（从模型写回 settings）
-        # 注意：这里假定 w.items 已经是模型希望同步到的目标状态
-        # 如果需要将用户界面改动反向同步回模型，则相反方向。但 UIUpdater 通常负责模型 -> UI，此处我们做 UI -> 模型
-        # 然而本方法名 _update_listbox 调用时机是模型变化后刷新 UI，所以应该将 w.items 写入 settings
-        # 为了保持一致，我们实现写入逻辑（与其它 _update_xxx 方向一致）
-        if current_items != w.items:
+        就地编辑直接作用于 script_settings 中的数组，先应用已暂存的写入，保证写入顺序与直接写入时一致。
+        """
+        self._apply_staged_settings()
+        current_array = obs.obs_data_get_array(self.script_settings, w.control_name)
+        if current_array is not None and obs.obs_data_array_count(current_array) != len(current_items):
+            obs.obs_data_array_release(current_array)
+            current_array = None
+        if current_array is None:
             # 构建新数组
             new_array = obs.obs_data_array_create()
-            for item in w.items:
-                obj = obs.obs_data_create()
-                obs.obs_data_set_string(obj, "value", item.get("value", "?"))
-                obs.obs_data_set_bool(obj, "selected", item.get("selected", False))
-                obs.obs_data_set_bool(obj, "hidden", item.get("hidden", False))
-                obs.obs_data_array_push_back(new_array, obj)
-                obs.obs_data_release(obj)
-            obs.obs_data_set_array(self.script_settings, w.control_name, new_array)
-            obs.obs_data_array_release(new_array)
\ No newline at end of file
+            for item in desired_items:
+                self._push_listbox_item(new_array, None, item)
+            obs.obs_data_set_array(self._write_target(), w.control_name, new_array)
+            obs.obs_data_array_release(new_array)
+            return
+
+        length = len(current_items)
+        opcodes = SequenceMatcher(None, current_items, desired_items, autojunk=False).get_opcodes()
+        # 从后往前应用，前面的索引不受影响
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            for idx in range(i2 - 1, i1 - 1, -1):  # delete / replace 先删除旧项
+                obs.obs_data_array_erase(current_array, idx)
+                length -= 1
+            for offset, item in enumerate(desired_items[j1:j2]):  # insert / replace 再插入新项
+                index = i1 + offset
+                self._push_listbox_item(current_array, None if index == length else index, item)
+                length += 1
+        obs.obs_data_array_release(current_array)
+
+    @staticmethod
+    def _push_listbox_item(array: Any, index: Optional[int], item: Tuple[str, bool, bool]) -> None:
+        """创建列表项 obs_data 并插入数组，index 为 None 时追加到末尾。"""
+        value, selected, hidden = item
+        obj = obs.obs_data_create()
+        obs.obs_data_set_string(obj, "value", value)
+        obs.obs_data_set_bool(obj, "selected", selected)
+        obs.obs_data_set_bool(obj, "hidden", hidden)
+        if index is None:
+            obs.obs_data_array_push_back(array, obj)
+        else:
+            obs.obs_data_array_insert(array, index, obj)
+        obs.obs_data_release(obj)
@@ -1,16 +1,23 @@
 """控件变动回调函数框架"""
+from contextlib import nullcontext
 from typing import Callable, Any
 
 
 class ModifiedFunction:
 
-    def __init__(self, BtnFunctions, log_manager):
+    def __init__(self, BtnFunctions, log_manager, ui_updater=None):
         self.BtnFunctions = BtnFunctions
         self.Log_manager = log_manager
         self.allow_execution = True
+        # 可选的 UI 更新器，回调在其批处理作用域内执行，多次刷新请求合并为一次
+        self.ui_updater = ui_updater
 
     def property_modified(self, control_name:str, modified_callback_name:str) -> Callable[[Any, Any, Any], bool]:
         def build_pm(ps, p, st=None) -> bool:
+            with self.ui_updater.batch() if self.ui_updater is not None else nullcontext():
+                return run_pm(ps, p, st)
+
+        def run_pm(ps, p, st=None) -> bool:
             self.Log_manager.log_info(f"监测到控件变动: {control_name}")
             if control_name == "e58581e8aeb8e689a7e8a18ce68ea7e4bbb6e4bfaee694b9e59b9ee8b083":
                 self.allow_execution = True
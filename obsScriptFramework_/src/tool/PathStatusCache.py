@@ -0,0 +1,103 @@
+"""路径状态缓存：在后台线程中检查路径是否存在，避免阻塞 OBS 线程"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class PathStatusCache:
+    """
+    带有效期的路径状态缓存。
+
+    路径是否存在由后台线程池通过 os.stat 检查，调用方只读取缓存结果，永远不会在调用线程上访问文件系统。
+    缓存未命中或已过期时提交后台检查，检查完成的结果通过 drain_results() 交给调用方所在线程处理。
+    """
+
+    def __init__(self, ttl: float = 10.0, max_workers: int = 2):
+        """
+        :param ttl: 缓存结果的有效期（秒），过期后读取时会在后台重新检查，期间仍返回旧结果
+        :param max_workers: 后台检查线程数
+        """
+        self.ttl = ttl
+        self.max_workers = max_workers
+        # 路径 -> (是否存在, 检查完成的时间)
+        self._entries: Dict[str, Tuple[bool, float]] = {}
+        # 正在后台检查的路径
+        self._pending: Set[str] = set()
+        # 自上次 drain_results() 以来完成检查的 (路径, 是否存在)
+        self._results: deque = deque()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get(self, path: str) -> Optional[bool]:
+        """
+        读取路径状态，不访问文件系统
+
+        :param path: 路径
+        :return: 路径是否存在；尚无检查结果时返回 None（已提交后台检查）
+        """
+        if not isinstance(path, str) or not path:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(path)
+            expired = entry is None or now - entry[1] >= self.ttl
+            if expired and path not in self._pending:
+                self._pending.add(path)
+                self._submit(path)
+        return None if entry is None else entry[0]
+
+    def drain_results(self) -> List[Tuple[str, bool]]:
+        """
+        取出自上次调用以来完成检查的结果，应在需要处理结果的线程（如 OBS 的 UI 线程）中调用
+
+        :return: (路径, 是否存在) 列表
+        """
+        results = []
+        while self._results:
+            results.append(self._results.popleft())
+        return results
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        使缓存失效，下次读取时重新检查
+
+        :param path: 需要失效的路径，为 None 时清空全部缓存
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        关闭后台线程池，通常在 script_unload 中调用
+
+        :param wait: 是否等待正在进行的检查完成
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _submit(self, path: str) -> None:
+        """提交后台检查，调用方需持有锁"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="PathStatusCache")
+        self._executor.submit(self._check, path)
+
+    def _check(self, path: str) -> None:
+        """在后台线程中检查路径并记录结果"""
+        try:
+            os.stat(path)
+            exists = True
+        except (OSError, ValueError):
+            exists = False
+        with self._lock:
+            self._entries[path] = (exists, time.monotonic())
+            self._pending.discard(path)
+        self._results.append((path, exists))
@@ -1,5 +1,6 @@
 import csv
 import json
+import sys
 from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 
@@ -39,7 +40,8 @@ class ControlTemplateParser:
         if not attr_rows:
             return {"error": "Empty attribute definition file"}
 
-        headers = attr_rows[0]
+        # 驻留标题字符串，解析出的字段名在所有控件之间共享同一对象
+        headers = [sys.intern(header) for header in attr_rows[0]]
 
         # 检测分组边界（依靠标题行）
         self._detect_group_boundaries(headers)
@@ -150,7 +152,7 @@ class ControlTemplateParser:
                 continue
 
             object_name = row[3].strip()
-            widget_type = row[1].strip()
+            widget_type = sys.intern(row[1].strip())
 
             # 跳过控件类型为空的行
             if not widget_type:
@@ -189,7 +191,7 @@ class ControlTemplateParser:
             template = self.templates[widget_type]
 
             control = {
-                "object_name": object_name,
+                "object_name": sys.intern(object_name),
                 "original_name": original_name,
                 "level": level,
                 "widget_category": widget_type,